@@ -0,0 +1,116 @@
+"""
+Import-time benchmark with a budget.
+
+Usage:
+
+    python -m benchmarks.import_time                      # all cases, print JSON
+    python -m benchmarks.import_time --runs 20
+    python -m benchmarks.import_time --budget lumnisai=30  # override a budget (ms)
+    python -m benchmarks.import_time --baseline import.json
+
+Every case runs in a fresh interpreter, since a module is only imported once
+per process, and reports the median wall time of the import statement alone,
+without interpreter startup. A case slower than its budget fails the run with
+status 1; the budgets keep `import lumnisai` cheap for serverless cold starts
+and command line tools, which is why models and resources are loaded lazily.
+
+Results use the same format as benchmarks.run, so --baseline works the same way.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from dataclasses import asdict
+from datetime import datetime, timezone
+
+from lumnisai import __version__
+
+from .run import Result, compare
+
+# Case name to (import statement, default budget in ms)
+CASES: dict[str, tuple[str, float]] = {
+    "lumnisai": ("import lumnisai", 50.0),
+    "async_client": ("from lumnisai import AsyncClient", 450.0),
+    "client": ("from lumnisai import Client", 500.0),
+    "models": ("from lumnisai.models import ResponseObject", 350.0),
+}
+
+_TIMER = """
+import time
+started = time.perf_counter()
+{statement}
+print(time.perf_counter() - started)
+"""
+
+
+def import_ms(statement: str) -> float:
+    """Milliseconds one fresh interpreter spends on `statement`."""
+    output = subprocess.run(
+        [sys.executable, "-c", _TIMER.format(statement=statement)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1]) * 1000
+
+
+def _budget(value: str) -> tuple[str, float]:
+    name, _, ms = value.partition("=")
+    if name not in CASES or not ms:
+        raise argparse.ArgumentTypeError(f"expected CASE=MS with CASE in {sorted(CASES)}")
+    return name, float(ms)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_time", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--case", action="append", choices=sorted(CASES), help="Run only these cases")
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters per case")
+    parser.add_argument("--budget", action="append", type=_budget, default=[], help="CASE=MS budget override")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against a previous results file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative regression")
+    args = parser.parse_args(argv)
+
+    budgets = {name: budget for name, (_, budget) in CASES.items()} | dict(args.budget)
+    results: list[Result] = []
+    over_budget = []
+    for name in args.case or list(CASES):
+        statement = CASES[name][0]
+        import_ms(statement)  # warm the filesystem and bytecode caches
+        median = statistics.median(import_ms(statement) for _ in range(args.runs))
+        params = {"statement": statement, "runs": args.runs, "budget_ms": budgets[name]}
+        results.append(Result(f"import.{name}", median, "ms", False, params))
+        if median > budgets[name]:
+            over_budget.append(f"import.{name}: {median:.1f} ms > {budgets[name]:.0f} ms budget")
+
+    report = {
+        "meta": {
+            "lumnisai": __version__,
+            "python": sys.version.split()[0],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
+
+    for line in over_budget:
+        print(f"OVER BUDGET {line}", file=sys.stderr)
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+    return 1 if over_budget or regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
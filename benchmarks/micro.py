@@ -0,0 +1,311 @@
+"""
+Microbenchmarks of the SDK's CPU hot paths.
+
+Usage:
+
+    python -m benchmarks.micro                          # all cases, print JSON
+    python -m benchmarks.micro --case response.validate --duration 2
+    python -m benchmarks.micro --output micro.json
+    python -m benchmarks.micro --baseline micro.json    # fail on regressions
+
+Each case runs one operation on a realistic payload (hundreds of progress
+entries, large tool call arguments, a large structured_response) and reports
+operations per second plus the memory it allocates: `alloc` is the peak
+traced memory during one operation and `retained` what is still allocated
+afterwards, both in KiB measured with tracemalloc. Timing runs with
+tracemalloc off, so the two measurements do not disturb each other.
+
+Results use the same format as benchmarks.run, so --baseline works the same way.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from lumnisai import __version__
+from lumnisai._transport import codec
+from lumnisai.exceptions import LumnisAIError
+from lumnisai.models import (
+    AgentConfig,
+    CreateResponseRequest,
+    Message,
+    ModelOverrides,
+    ProgressEntry,
+    ResponseObject,
+)
+
+from .run import Result, compare
+
+
+@dataclass
+class Case:
+    name: str
+    description: str
+    setup: Callable[[argparse.Namespace], Callable[[], Any]]
+
+
+# ----------------------------------------------------------------------
+# Payloads
+# ----------------------------------------------------------------------
+
+def _words(rng: random.Random, count: int) -> str:
+    vocabulary = ["agent", "search", "result", "company", "revenue", "market", "analysis",
+                  "report", "source", "summary", "customer", "growth", "product", "team"]
+    return " ".join(rng.choice(vocabulary) for _ in range(count))
+
+
+def _tool_call(rng: random.Random, args_size: int) -> dict[str, Any]:
+    return {
+        "name": rng.choice(["web_search", "fetch_page", "extract_table", "write_file"]),
+        "args": {
+            "query": _words(rng, 12),
+            "urls": [f"https://example.com/{uuid.UUID(int=rng.getrandbits(128))}" for _ in range(20)],
+            "content": _words(rng, args_size),
+        },
+        "output_text": _words(rng, 60),
+    }
+
+
+def response_payload(progress_entries: int, args_size: int, structured_items: int) -> dict[str, Any]:
+    """A finished response as the API returns it, with JSON-native values."""
+    rng = random.Random(0)
+    created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return {
+        "response_id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "thread_id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "tenant_id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "user_id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "status": "succeeded",
+        "progress": [
+            {
+                "ts": (created + timedelta(seconds=i)).isoformat(),
+                "state": "processing",
+                "message": _words(rng, 15),
+                "tool_calls": [_tool_call(rng, args_size) for _ in range(rng.randint(1, 3))],
+            }
+            for i in range(progress_entries)
+        ],
+        "input_messages": [{"role": "user", "content": _words(rng, 200)}],
+        "output_text": _words(rng, 3000),
+        "structured_response": {
+            "companies": [
+                {
+                    "name": _words(rng, 2),
+                    "revenue": rng.randint(1_000, 10_000_000),
+                    "growth": rng.random(),
+                    "tags": [_words(rng, 1) for _ in range(5)],
+                    "summary": _words(rng, 40),
+                }
+                for _ in range(structured_items)
+            ],
+        },
+        "created_at": created.isoformat(),
+        "completed_at": (created + timedelta(seconds=progress_entries + 1)).isoformat(),
+    }
+
+
+def error_detail(items: int) -> dict[str, Any]:
+    """An error body of the size a failing bulk or validation call returns."""
+    rng = random.Random(1)
+    return {
+        "error": {
+            "code": "VALIDATION_ERROR",
+            "message": f"Request failed with token sk-{'a' * 40} in the payload",
+            "details": [
+                {
+                    "loc": ["body", "messages", i, "content"],
+                    "msg": _words(rng, 20),
+                    "input": f"Bearer {uuid.UUID(int=rng.getrandbits(128)).hex}{uuid.UUID(int=rng.getrandbits(128)).hex}",
+                    "context": {"api_key": "secret", "request": _words(rng, 30)},
+                }
+                for i in range(items)
+            ],
+        }
+    }
+
+
+# ----------------------------------------------------------------------
+# Cases
+# ----------------------------------------------------------------------
+
+def _response_validate(args: argparse.Namespace) -> Callable[[], Any]:
+    payload = response_payload(args.progress_entries, args.args_size, args.structured_items)
+    return lambda: ResponseObject.model_validate(payload)
+
+
+def _response_decode(args: argparse.Namespace) -> Callable[[], Any]:
+    # What the transport does with a body the resource names a model for
+    body = json.dumps(response_payload(args.progress_entries, args.args_size, args.structured_items)).encode()
+    return lambda: codec.validate(ResponseObject, body)
+
+
+def _progress_validate(args: argparse.Namespace) -> Callable[[], Any]:
+    entries = response_payload(args.progress_entries, args.args_size, 0)["progress"]
+    return lambda: [ProgressEntry.model_validate(entry) for entry in entries]
+
+
+def _response_dump(args: argparse.Namespace) -> Callable[[], Any]:
+    response = ResponseObject.model_validate(
+        response_payload(args.progress_entries, args.args_size, args.structured_items)
+    )
+    return lambda: response.model_dump(mode="json")
+
+
+def _request_build(args: argparse.Namespace) -> Callable[[], Any]:
+    rng = random.Random(2)
+    history = [{"role": rng.choice(["user", "assistant"]), "content": _words(rng, 150)} for _ in range(20)]
+    response_format = response_payload(0, 0, 0)["structured_response"] | {
+        "type": "object",
+        "properties": {f"field_{i}": {"type": "string", "description": _words(rng, 10)} for i in range(50)},
+    }
+    user_id = str(uuid.UUID(int=rng.getrandbits(128)))
+    thread_id = uuid.UUID(int=rng.getrandbits(128))
+
+    def build() -> str:
+        # Mirrors ResponsesResource.create()
+        request = CreateResponseRequest(
+            messages=[Message(**message) for message in history],
+            user_id=user_id,
+            thread_id=thread_id,
+        )
+        request.response_format = response_format
+        request.model_overrides = ModelOverrides(smart_model="openai:gpt-4o")
+        request.agent_config = AgentConfig(planner_model_name="anthropic:claude-3-7-sonnet-20250219")
+        return request.model_dump_json(exclude_none=True)
+
+    return build
+
+
+def _sanitize_error(args: argparse.Namespace) -> Callable[[], Any]:
+    detail = error_detail(args.error_items)
+    return lambda: LumnisAIError("Validation error", status_code=422, detail=detail)
+
+
+CASES = [
+    Case("response.validate", "ResponseObject.model_validate on a parsed body", _response_validate),
+    Case("response.decode", "JSON bytes to ResponseObject", _response_decode),
+    Case("progress.validate", "ProgressEntry.model_validate per progress list", _progress_validate),
+    Case("response.dump", "ResponseObject.model_dump(mode='json')", _response_dump),
+    Case("request.build", "CreateResponseRequest build and model_dump_json", _request_build),
+    Case("error.sanitize", "LumnisAIError construction with detail sanitizing", _sanitize_error),
+]
+
+
+# ----------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------
+
+def _ops_per_second(operation: Callable[[], Any], duration: float) -> float:
+    # Calibrate a batch size that takes ~10ms, then run whole batches
+    batch = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(batch):
+            operation()
+        elapsed = time.perf_counter() - started
+        if elapsed >= 0.01:
+            break
+        batch *= 2
+
+    runs = 0
+    total = 0.0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        for _ in range(batch):
+            operation()
+        total += time.perf_counter() - started
+        runs += batch
+    return runs / total
+
+
+def _allocations(operation: Callable[[], Any]) -> tuple[float, float]:
+    """Peak and retained KiB traced during one operation."""
+    operation()  # warm caches so they are not counted
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = operation()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return (peak - before) / 1024, (current - before) / 1024
+
+
+def measure(case: Case, args: argparse.Namespace) -> list[Result]:
+    operation = case.setup(args)
+    gc.collect()
+    ops = _ops_per_second(operation, args.duration)
+    alloc, retained = _allocations(operation)
+    params = {
+        "description": case.description,
+        "progress_entries": args.progress_entries,
+        "args_size": args.args_size,
+        "structured_items": args.structured_items,
+        "codec": codec.NAME,
+    }
+    return [
+        Result(f"{case.name}.ops", ops, "ops/s", True, params),
+        Result(f"{case.name}.alloc", alloc, "KiB/op", False, params),
+        Result(f"{case.name}.retained", retained, "KiB/op", False, params),
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    names = [case.name for case in CASES]
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.micro", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--case", action="append", choices=names, help="Run only these cases")
+    parser.add_argument("--duration", type=float, default=1.0, help="Seconds of timing per case")
+    parser.add_argument("--progress-entries", type=int, default=300, help="Progress entries per response")
+    parser.add_argument("--args-size", type=int, default=400, help="Words of content in each tool call's args")
+    parser.add_argument("--structured-items", type=int, default=200, help="Items in structured_response")
+    parser.add_argument("--error-items", type=int, default=50, help="Entries in the sanitized error detail")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against a previous results file")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed relative regression")
+    args = parser.parse_args(argv)
+
+    selected = [case for case in CASES if not args.case or case.name in args.case]
+    results: list[Result] = []
+    for case in selected:
+        results += measure(case, args)
+
+    report = {
+        "meta": {
+            "lumnisai": __version__,
+            "python": sys.version.split()[0],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+"""
+End-to-end benchmarks of the SDK against an in-process fake Lumnis server.
+
+Usage:
+
+    python -m benchmarks.run                          # all scenarios, print JSON
+    python -m benchmarks.run --output results.json    # save results
+    python -m benchmarks.run --baseline results.json  # fail on regressions
+    python -m benchmarks.run --scenario invoke --latency 0.005
+
+Every result is a named metric with a unit and a direction, so two result files
+can be compared mechanically; --baseline exits with status 1 when any metric is
+worse than the baseline by more than --tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from lumnisai import AsyncClient, __version__
+from lumnisai.testing import FakeLumnisServer
+
+
+@dataclass
+class Result:
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool
+    params: dict[str, Any]
+
+
+def _client(server: FakeLumnisServer) -> AsyncClient:
+    return AsyncClient(api_key="benchmark", http_transport=server.transport(), max_retries=0)
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _timed_invoke(
+    client: AsyncClient,
+    semaphore: asyncio.Semaphore,
+    latencies: list[float],
+    poll_interval: float,
+) -> None:
+    async with semaphore:
+        started = time.perf_counter()
+        await client.invoke(
+            "benchmark",
+            user_id=str(uuid.uuid4()),
+            show_progress=False,
+            poll_interval=poll_interval,
+        )
+        latencies.append(time.perf_counter() - started)
+
+
+async def bench_invoke(args: argparse.Namespace) -> list[Result]:
+    """Completed invocations per second and latency at increasing concurrency."""
+    results = []
+    for concurrency in args.concurrency:
+        server = FakeLumnisServer(
+            latency=args.latency,
+            progress_interval=args.progress_interval,
+            progress_entries=args.progress_entries,
+        )
+        total = max(concurrency * 4, 32)
+        latencies: list[float] = []
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with _client(server) as client:
+            started = time.perf_counter()
+            await asyncio.gather(
+                *(_timed_invoke(client, semaphore, latencies, args.progress_interval) for _ in range(total))
+            )
+            elapsed = time.perf_counter() - started
+
+        params = {"concurrency": concurrency, "invocations": total, "latency": args.latency}
+        results += [
+            Result(f"invoke.throughput[c={concurrency}]", total / elapsed, "invocations/s", True, params),
+            Result(f"invoke.p50[c={concurrency}]", statistics.median(latencies) * 1000, "ms", False, params),
+            Result(f"invoke.p95[c={concurrency}]", _percentile(latencies, 0.95) * 1000, "ms", False, params),
+            Result(f"invoke.requests_per_invocation[c={concurrency}]", server.requests / total, "requests", False, params),
+        ]
+    return results
+
+
+async def bench_streaming(args: argparse.Namespace) -> list[Result]:
+    """SDK time spent per streamed progress entry, beyond the server's cadence."""
+    entries = 200
+    server = FakeLumnisServer(latency=args.latency, progress_interval=0.0, progress_entries=entries)
+    async with _client(server) as client:
+        started = time.perf_counter()
+        received = 0
+        async for _ in await client.invoke(
+            "benchmark", user_id=str(uuid.uuid4()), stream=True, poll_interval=0.0
+        ):
+            received += 1
+        elapsed = time.perf_counter() - started
+
+    params = {"progress_entries": entries, "received": received}
+    return [Result("stream.per_entry", elapsed / max(received, 1) * 1e6, "us/entry", False, params)]
+
+
+async def bench_files(args: argparse.Namespace) -> list[Result]:
+    """Upload and download throughput for payloads of increasing size."""
+    results = []
+    server = FakeLumnisServer(latency=args.latency)
+    async with _client(server) as client:
+        for size_mb in args.file_sizes:
+            payload = b"x" * (size_mb * 1024 * 1024)
+            rounds = max(1, 64 // size_mb)
+
+            started = time.perf_counter()
+            for i in range(rounds):
+                uploaded = await client.files.upload(file_content=payload, file_name=f"bench-{i}.bin")
+            upload_elapsed = time.perf_counter() - started
+
+            started = time.perf_counter()
+            for _ in range(rounds):
+                await client.files.download(uploaded.file_id)
+            download_elapsed = time.perf_counter() - started
+
+            params = {"size_mb": size_mb, "rounds": rounds}
+            results += [
+                Result(f"files.upload[{size_mb}MB]", size_mb * rounds / upload_elapsed, "MB/s", True, params),
+                Result(f"files.download[{size_mb}MB]", size_mb * rounds / download_elapsed, "MB/s", True, params),
+            ]
+    return results
+
+
+async def bench_listing(args: argparse.Namespace) -> list[Result]:
+    """Rows per second when paging through responses and threads."""
+    server = FakeLumnisServer(latency=args.latency)
+    server.seed_responses(args.list_rows, days=30)
+    results = []
+    params = {"rows": args.list_rows, "latency": args.latency}
+
+    async with _client(server) as client:
+        started = time.perf_counter()
+        rows = 0
+        offset = 0
+        while True:
+            page = await client.responses.list_responses(limit=100, offset=offset)
+            rows += len(page.responses)
+            offset += 100
+            if offset >= page.total:
+                break
+        results.append(Result("list.responses.sequential", rows / (time.perf_counter() - started), "rows/s", True, params))
+
+        today = datetime.now(timezone.utc).date()
+        started = time.perf_counter()
+        rows = 0
+        async for _ in client.responses.scan(today - timedelta(days=31), today, shards=8):
+            rows += 1
+        results.append(Result("list.responses.scan", rows / (time.perf_counter() - started), "rows/s", True, params))
+
+        started = time.perf_counter()
+        rows = 0
+        offset = 0
+        while True:
+            page = await client.threads.list(limit=100, offset=offset)
+            rows += len(page.threads)
+            offset += 100
+            if offset >= page.total:
+                break
+        results.append(Result("list.threads.sequential", rows / (time.perf_counter() - started), "rows/s", True, params))
+    return results
+
+
+SCENARIOS: dict[str, Callable[[argparse.Namespace], Awaitable[list[Result]]]] = {
+    "invoke": bench_invoke,
+    "streaming": bench_streaming,
+    "files": bench_files,
+    "listing": bench_listing,
+}
+
+
+def compare(results: list[Result], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Describe every metric that regressed by more than `tolerance`."""
+    previous = {item["name"]: item["value"] for item in baseline["results"]}
+    regressions = []
+    for result in results:
+        before = previous.get(result.name)
+        if not before:
+            continue
+        change = (result.value - before) / before
+        if (change < -tolerance) if result.higher_is_better else (change > tolerance):
+            regressions.append(
+                f"{result.name}: {before:.2f} -> {result.value:.2f} {result.unit} ({change:+.1%})"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="Run only these scenarios")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated server latency per request (s)")
+    parser.add_argument("--progress-interval", type=float, default=0.01, help="Seconds between progress entries")
+    parser.add_argument("--progress-entries", type=int, default=3, help="Progress entries per invocation")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--file-sizes", type=int, nargs="+", default=[1, 16], help="Payload sizes in MB")
+    parser.add_argument("--list-rows", type=int, default=5000, help="Responses seeded for listing")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--baseline", help="Compare against a previous results file")
+    parser.add_argument("--tolerance", type=float, default=0.15, help="Allowed relative regression")
+    args = parser.parse_args(argv)
+
+    results: list[Result] = []
+    for name in args.scenario or list(SCENARIOS):
+        # invoke() prints the response ID of every invocation
+        with contextlib.redirect_stdout(io.StringIO()):
+            results += asyncio.run(SCENARIOS[name](args))
+
+    report = {
+        "meta": {
+            "lumnisai": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text)
+    print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
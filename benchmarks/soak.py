@@ -0,0 +1,233 @@
+"""
+Soak test: memory growth of a long-lived client.
+
+Usage:
+
+    python -m benchmarks.soak                              # all operations
+    python -m benchmarks.soak --operation for_user --iterations 20000
+    python -m benchmarks.soak --output soak.json
+
+A single AsyncClient runs thousands of each operation against the in-process
+fake server while the live Python allocations (sys.getallocatedblocks, after
+a full collection) and the process RSS are sampled between batches. Growth is
+fitted with a least-squares line over the samples taken after warm-up; an
+operation that keeps more than --threshold allocations per operation is
+reported as a leak and the process exits with status 1.
+
+For a leak, a second phase runs under tracemalloc and lists the source lines
+whose allocations grew the most. tracemalloc is kept out of the measured
+phase because it slows every allocation down by an order of magnitude.
+
+The fake server forgets its stored responses and files after every batch, so
+only memory kept by the SDK, httpx and pydantic counts. RSS is reported for
+reference; allocator caching makes it too noisy to judge leaks on its own.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import gc
+import json
+import os
+import sys
+import tracemalloc
+import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from lumnisai import AsyncClient, __version__
+from lumnisai.testing import FakeLumnisServer
+
+Operation = Callable[[AsyncClient], Awaitable[Any]]
+
+# Frames kept per allocation while attributing a leak
+_TRACE_FRAMES = 4
+
+
+@dataclass
+class Sample:
+    operations: int
+    allocated_blocks: int
+    rss_bytes: int | None
+
+
+@dataclass
+class SoakResult:
+    operation: str
+    iterations: int
+    blocks_per_operation: float
+    rss_bytes_per_operation: float | None
+    leak: bool
+    top_growth: list[str]
+    samples: list[Sample]
+
+
+async def _invoke(client: AsyncClient) -> Any:
+    return await client.invoke("soak", user_id=str(uuid.uuid4()), show_progress=False, poll_interval=0)
+
+
+async def _stream(client: AsyncClient) -> Any:
+    async for _ in await client.invoke("soak", user_id=str(uuid.uuid4()), stream=True, poll_interval=0):
+        pass
+
+
+async def _upload(client: AsyncClient) -> Any:
+    uploaded = await client.files.upload(file_content=b"soak test\n" * 6500, file_name="soak.txt")
+    return await client.files.download(uploaded.file_id)
+
+
+async def _for_user(client: AsyncClient) -> Any:
+    # The pattern from the README: a scoped client per request, never closed
+    user_client = client.for_user(str(uuid.uuid4()))
+    return await user_client.invoke("soak", show_progress=False, poll_interval=0)
+
+
+async def _as_user(client: AsyncClient) -> Any:
+    async with client.as_user(str(uuid.uuid4())) as user_client:
+        return await user_client.invoke("soak", show_progress=False, poll_interval=0)
+
+
+OPERATIONS: dict[str, Operation] = {
+    "invoke": _invoke,
+    "stream": _stream,
+    "upload": _upload,
+    "for_user": _for_user,
+    "as_user": _as_user,
+}
+
+
+def _rss_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _sample(operations: int) -> Sample:
+    gc.collect()
+    return Sample(operations, sys.getallocatedblocks(), _rss_bytes())
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    gc.collect()
+    return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+
+
+def _slope(points: list[tuple[float, float]]) -> float:
+    count = len(points)
+    mean_x = sum(x for x, _ in points) / count
+    mean_y = sum(y for _, y in points) / count
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    if not variance:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / variance
+
+
+async def soak(name: str, args: argparse.Namespace) -> SoakResult:
+    operation = OPERATIONS[name]
+    server = FakeLumnisServer(seed=0, progress_interval=0.0, progress_entries=args.progress_entries)
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async with AsyncClient(api_key="soak", http_transport=server.transport(), max_retries=0) as client:
+
+        async def one() -> None:
+            async with semaphore:
+                await operation(client)
+
+        async def batch(size: int) -> None:
+            await asyncio.gather(*(one() for _ in range(size)))
+            server.reset()
+
+        # Fill caches, pools and lazily created state before measuring
+        await batch(args.warmup)
+
+        samples = [_sample(0)]
+        done = 0
+        while done < args.iterations:
+            size = min(args.sample_every, args.iterations - done)
+            await batch(size)
+            done += size
+            samples.append(_sample(done))
+
+        blocks_per_operation = _slope([(sample.operations, sample.allocated_blocks) for sample in samples])
+        rss_per_operation = None
+        if all(sample.rss_bytes is not None for sample in samples):
+            rss_per_operation = _slope([(sample.operations, sample.rss_bytes) for sample in samples])
+
+        leak = blocks_per_operation > args.threshold
+        top_growth = []
+        if leak:
+            # Attribute the growth; the first batch lets bounded caches turn
+            # over to traced entries so they do not show up as growth
+            tracemalloc.start(_TRACE_FRAMES)
+            try:
+                await batch(args.sample_every)
+                baseline = _snapshot()
+                await batch(args.sample_every)
+                snapshot = _snapshot()
+            finally:
+                tracemalloc.stop()
+            for stat in snapshot.compare_to(baseline, "lineno")[:args.top]:
+                if stat.size_diff > 0:
+                    frame = stat.traceback[0]
+                    top_growth.append(
+                        f"{frame.filename}:{frame.lineno} "
+                        f"{stat.count_diff / args.sample_every:+.2f} blocks/op, "
+                        f"{stat.size_diff / args.sample_every:+.0f} B/op"
+                    )
+
+    return SoakResult(name, done, blocks_per_operation, rss_per_operation, leak, top_growth, samples)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.soak", description=__doc__.split("\n\n")[0])
+    parser.add_argument("--operation", action="append", choices=sorted(OPERATIONS), help="Soak only these operations")
+    parser.add_argument("--iterations", type=int, default=5000, help="Measured operations per soak")
+    parser.add_argument("--warmup", type=int, default=1000, help="Operations before the first sample")
+    parser.add_argument("--sample-every", type=int, default=500, help="Operations between samples")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--progress-entries", type=int, default=3, help="Progress entries per invocation")
+    parser.add_argument("--threshold", type=float, default=0.5, help="Allocations kept per operation counted as a leak")
+    parser.add_argument("--top", type=int, default=10, help="Growth sites listed for a leak")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = []
+    # invoke() prints the response ID of every invocation; a buffer would grow
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for name in args.operation or list(OPERATIONS):
+            results.append(asyncio.run(soak(name, args)))
+
+    report = {
+        "meta": {
+            "lumnisai": __version__,
+            "python": sys.version.split()[0],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "threshold": args.threshold,
+        },
+        "results": [asdict(result) for result in results],
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    for result in results:
+        rss = "n/a" if result.rss_bytes_per_operation is None else f"{result.rss_bytes_per_operation:.0f}"
+        print(
+            f"{'LEAK' if result.leak else 'ok  '} {result.operation:<10} "
+            f"{result.blocks_per_operation:>6.2f} blocks/op, {rss:>7} B/op RSS "
+            f"over {result.iterations} operations"
+        )
+        for line in result.top_growth:
+            print(f"       {line}")
+    return 1 if any(result.leak for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
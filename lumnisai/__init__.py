@@ -1,55 +1,155 @@
 
 import logging
-from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
 
-from .async_client import AsyncClient
-from .client import Client
-from .exceptions import (
-    AuthenticationError,
-    ErrorCode,
-    FileAccessDeniedError,
-    FileNotFoundError,
-    FileOperationError,
-    LocalFileNotSupported,
-    LumnisAIError,
-    MissingUserId,
-    NotFoundError,
-    NotImplementedYetError,
-    RateLimitError,
-    TenantScopeUserIdConflict,
-    TransportError,
-    ValidationError,
-)
-from .models import (
-    AgentConfig,
-    AgentMode,
-    AnthropicModels,
-    ContentType,
-    DeepSeekModels,
-    DuplicateHandling,
-    FileChunk,
-    FileMetadata,
-    FileScope,
-    FileSearchResult,
-    FileSearchResponse,
-    GoogleModels,
-    Models,
-    OpenAIModels,
-    ProcessingStatus,
-    ResponseListResponse,
-    SkillGuideline,
-    SkillGuidelineCreate,
-    SkillGuidelineListResponse,
-    SkillGuidelineUpdate,
-)
-from .types import ApiKeyMode, ApiProvider, ModelProvider, ModelType, Scope
-from .utils import ProgressTracker, display_progress, format_progress_entry
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from ._transport import (
+        BulkLane,
+        CircuitBreaker,
+        ConcurrencyLimiter,
+        ConcurrencyStats,
+        HedgePolicy,
+        HTTPCache,
+        Priority,
+        PriorityScheduler,
+        PriorityStats,
+        SharedRateLimiter,
+        TransportHooks,
+        TransportProfile,
+        TransportStats,
+        TransportStatsSnapshot,
+        WarmupReport,
+        request_priority,
+    )
+    from .async_client import AsyncClient
+    from .client import Client
+    from .exceptions import (
+        AuthenticationError,
+        CircuitOpenError,
+        ErrorCode,
+        FileAccessDeniedError,
+        FileNotFoundError,
+        FileOperationError,
+        LocalFileNotSupported,
+        LumnisAIError,
+        MissingUserId,
+        NotFoundError,
+        NotImplementedYetError,
+        RateLimitError,
+        TenantScopeUserIdConflict,
+        TransportError,
+        ValidationError,
+    )
+    from .models import (
+        AgentConfig,
+        AgentMode,
+        AnthropicModels,
+        ContentType,
+        DeepSeekModels,
+        DuplicateHandling,
+        FileChunk,
+        FileMetadata,
+        FileScope,
+        FileSearchResult,
+        FileSearchResponse,
+        GoogleModels,
+        Models,
+        OpenAIModels,
+        ProcessingStatus,
+        ResponseListResponse,
+        SkillGuideline,
+        SkillGuidelineCreate,
+        SkillGuidelineListResponse,
+        SkillGuidelineUpdate,
+    )
+    from .store import ResponseStore
+    from .types import ApiKeyMode, ApiProvider, ModelProvider, ModelType, Scope
+    from .utils import ProgressTracker, display_progress, format_progress_entry
+
+# Public names by submodule, imported on first access
+_SUBMODULES = {
+    "._transport": (
+        "BulkLane",
+        "CircuitBreaker",
+        "ConcurrencyLimiter",
+        "ConcurrencyStats",
+        "HedgePolicy",
+        "HTTPCache",
+        "Priority",
+        "PriorityScheduler",
+        "PriorityStats",
+        "SharedRateLimiter",
+        "TransportHooks",
+        "TransportProfile",
+        "TransportStats",
+        "TransportStatsSnapshot",
+        "WarmupReport",
+        "request_priority",
+    ),
+    ".async_client": ("AsyncClient",),
+    ".client": ("Client",),
+    ".exceptions": (
+        "AuthenticationError",
+        "CircuitOpenError",
+        "ErrorCode",
+        "FileAccessDeniedError",
+        "FileNotFoundError",
+        "FileOperationError",
+        "LocalFileNotSupported",
+        "LumnisAIError",
+        "MissingUserId",
+        "NotFoundError",
+        "NotImplementedYetError",
+        "RateLimitError",
+        "TenantScopeUserIdConflict",
+        "TransportError",
+        "ValidationError",
+    ),
+    ".models": (
+        "AgentConfig",
+        "AgentMode",
+        "AnthropicModels",
+        "ContentType",
+        "DeepSeekModels",
+        "DuplicateHandling",
+        "FileChunk",
+        "FileMetadata",
+        "FileScope",
+        "FileSearchResult",
+        "FileSearchResponse",
+        "GoogleModels",
+        "Models",
+        "OpenAIModels",
+        "ProcessingStatus",
+        "ResponseListResponse",
+        "SkillGuideline",
+        "SkillGuidelineCreate",
+        "SkillGuidelineListResponse",
+        "SkillGuidelineUpdate",
+    ),
+    ".store": ("ResponseStore",),
+    ".types": ("ApiKeyMode", "ApiProvider", "ModelProvider", "ModelType", "Scope"),
+    ".utils": ("ProgressTracker", "display_progress", "format_progress_entry"),
+}
+
+_getattr, __dir__ = lazy_exports(__name__, _SUBMODULES, globals())
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        # Reading the package metadata costs as much as the rest of the import
+        from importlib.metadata import PackageNotFoundError, version
+
+        global __version__
+        try:
+            __version__ = version("lumnisai")
+        except PackageNotFoundError:
+            __version__ = "0.1.0b0"
+        return __version__
+    return _getattr(name)
 
-# Package version
-try:
-    __version__ = version("lumnisai")
-except PackageNotFoundError:
-    __version__ = "0.1.0b0"
 
 # Configure logging
 logging.getLogger("lumnisai").addHandler(logging.NullHandler())
@@ -80,6 +180,7 @@ __all__ = [
     "OpenAIModels",
     "ProcessingStatus",
     "ResponseListResponse",
+    "ResponseStore",
     # Skills models
     "SkillGuideline",
     "SkillGuidelineCreate", 
@@ -87,6 +188,7 @@ __all__ = [
     "SkillGuidelineUpdate",
     # Exceptions
     "AuthenticationError",
+    "CircuitOpenError",
     "ErrorCode",
     "FileAccessDeniedError",
     "FileNotFoundError",
@@ -102,6 +204,23 @@ __all__ = [
     "Scope",
     "TenantScopeUserIdConflict",
     "TransportError",
+    # Transport
+    "BulkLane",
+    "CircuitBreaker",
+    "ConcurrencyLimiter",
+    "ConcurrencyStats",
+    "HedgePolicy",
+    "HTTPCache",
+    "Priority",
+    "PriorityScheduler",
+    "PriorityStats",
+    "SharedRateLimiter",
+    "TransportHooks",
+    "TransportProfile",
+    "TransportStats",
+    "TransportStatsSnapshot",
+    "WarmupReport",
+    "request_priority",
     "ValidationError",
     # Utils
     "ProgressTracker",
@@ -0,0 +1,50 @@
+"""
+Lazy exports for package namespaces.
+
+Importing a model or resource module builds its Pydantic validators, which
+dominates `import lumnisai`. The package `__init__` modules therefore only
+declare where each public name lives; the submodule is imported the first
+time the name is accessed and the value is cached in the package namespace.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    submodules: dict[str, tuple[str, ...]],
+    namespace: dict[str, Any],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build the module-level `__getattr__` and `__dir__` for a package.
+
+    Args:
+        package: The package's `__name__`
+        submodules: Relative submodule name to the public names it defines
+        namespace: The package's `globals()`, where loaded names are cached
+    """
+    exports = {name: module for module, names in submodules.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            if not name.startswith("__"):
+                # Submodules stay reachable as attributes, as with eager imports
+                try:
+                    return importlib.import_module(f".{name}", package)
+                except ModuleNotFoundError as e:
+                    if e.name != f"{package}.{name}":
+                        raise
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
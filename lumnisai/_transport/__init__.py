@@ -1,3 +1,44 @@
+from .breaker import CircuitBreaker, CircuitState
+from .cache import HTTPCache
+from .hedging import HedgePolicy
 from .http import HTTPTransport
+from .instrumentation import (
+    EndpointStats,
+    LatencyStats,
+    RequestInfo,
+    TransportHooks,
+    TransportStats,
+    TransportStatsSnapshot,
+)
+from .lanes import BulkLane
+from .limiter import ConcurrencyLimiter, ConcurrencyStats
+from .profile import PROFILES, TransportProfile
+from .ratelimit import SharedRateLimiter
+from .scheduler import Priority, PriorityScheduler, PriorityStats, request_priority
+from .warmup import LaneWarmup, WarmupReport
 
-__all__ = ["HTTPTransport"]
+__all__ = [
+    "PROFILES",
+    "BulkLane",
+    "CircuitBreaker",
+    "CircuitState",
+    "ConcurrencyLimiter",
+    "ConcurrencyStats",
+    "EndpointStats",
+    "HTTPCache",
+    "HTTPTransport",
+    "HedgePolicy",
+    "LaneWarmup",
+    "LatencyStats",
+    "Priority",
+    "PriorityScheduler",
+    "PriorityStats",
+    "RequestInfo",
+    "SharedRateLimiter",
+    "TransportHooks",
+    "TransportProfile",
+    "TransportStats",
+    "TransportStatsSnapshot",
+    "WarmupReport",
+    "request_priority",
+]
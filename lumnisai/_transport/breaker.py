@@ -0,0 +1,204 @@
+"""
+Per-endpoint-group circuit breaking.
+
+When one backend (say the files service) degrades, retries against it keep
+connection-pool slots busy that /v1/responses polling needs. A circuit per
+endpoint group ("files", "responses", "users", ...) watches the outcome and
+latency of recent attempts; once too many fail or are slow, it opens and
+requests to that group fail immediately with `CircuitOpenError` instead of
+being sent. After `open_seconds` a few probe requests are let through, and
+the circuit closes again when they succeed.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from enum import Enum
+
+import httpx
+
+from ..exceptions import CircuitOpenError, TransportError
+
+logger = logging.getLogger("lumnisai.transport")
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def endpoint_group(path: str) -> str:
+    """The group a request path belongs to, e.g. "/v1/files/{id}" -> "files"."""
+    segments = path.split("?", 1)[0].strip("/").split("/")
+    return segments[1] if len(segments) > 1 else segments[0]
+
+
+def _is_failure(error: Exception) -> bool:
+    # Only errors that say something about the backend's health count;
+    # client errors such as 404 or 422 mean the backend answered
+    if isinstance(error, (httpx.NetworkError, httpx.TimeoutException)):
+        return True
+    return isinstance(error, TransportError) and not isinstance(error, CircuitOpenError) and (
+        error.status_code is None or error.status_code >= 500
+    )
+
+
+class _Circuit:
+
+    def __init__(self, group: str, breaker: CircuitBreaker):
+        self.group = group
+        self.breaker = breaker
+        self.state = CircuitState.CLOSED
+        self.opened_at = 0.0
+        # (failed, slow) of recent attempts while closed
+        self.outcomes: deque[tuple[bool, bool]] = deque(maxlen=breaker.window)
+        self.probes = 0
+        self.probe_successes = 0
+
+    def _acquire(self) -> None:
+        with self.breaker._lock:
+            if self.state is CircuitState.OPEN:
+                remaining = self.opened_at + self.breaker.open_seconds - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(self.group, retry_after=remaining)
+                self.state = CircuitState.HALF_OPEN
+                self.probes = 0
+                self.probe_successes = 0
+                logger.info(f"Circuit for {self.group!r} half-open, probing")
+            if self.state is CircuitState.HALF_OPEN:
+                if self.probes >= self.breaker.half_open_calls:
+                    raise CircuitOpenError(self.group, retry_after=None)
+                self.probes += 1
+
+    def _record(self, failed: bool, slow: bool) -> None:
+        breaker = self.breaker
+        with breaker._lock:
+            if self.state is CircuitState.HALF_OPEN:
+                self.probes -= 1
+                if failed or slow:
+                    self._open()
+                else:
+                    self.probe_successes += 1
+                    if self.probe_successes >= breaker.half_open_calls:
+                        self.state = CircuitState.CLOSED
+                        self.outcomes.clear()
+                        logger.info(f"Circuit for {self.group!r} closed")
+                return
+            if self.state is CircuitState.OPEN:
+                return
+
+            self.outcomes.append((failed, slow))
+            calls = len(self.outcomes)
+            if calls < breaker.min_calls:
+                return
+            failures = sum(failed for failed, _ in self.outcomes)
+            slow_calls = sum(slow for _, slow in self.outcomes)
+            if failures >= breaker.failure_rate * calls or slow_calls >= breaker.slow_call_rate * calls:
+                self._open()
+
+    def _release(self) -> None:
+        with self.breaker._lock:
+            if self.state is CircuitState.HALF_OPEN:
+                self.probes -= 1
+
+    def _open(self) -> None:
+        self.state = CircuitState.OPEN
+        self.opened_at = time.monotonic()
+        self.outcomes.clear()
+        self.breaker.opened += 1
+        logger.warning(f"Circuit for {self.group!r} opened for {self.breaker.open_seconds:g}s")
+
+    @contextmanager
+    def call(self, *, track_latency: bool = True) -> Iterator[None]:
+        """Guard one attempt; raises CircuitOpenError when the circuit is open."""
+        self._acquire()
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            self._record(_is_failure(e), False)
+            raise
+        except BaseException:
+            # Cancelled: says nothing about the backend
+            self._release()
+            raise
+        else:
+            elapsed = time.monotonic() - started
+            self._record(False, track_latency and elapsed > self.breaker.slow_call_seconds)
+
+
+class CircuitBreaker:
+    """
+    Circuit breakers for every endpoint group of a client.
+
+    Args:
+        failure_rate: Fraction of failed attempts (network errors, timeouts,
+            5xx) in the window that opens a circuit
+        slow_call_rate: Fraction of slow attempts in the window that opens
+            a circuit
+        slow_call_seconds: Attempts slower than this count as slow; long
+            polls are exempt
+        window: Recent attempts considered per group
+        min_calls: Attempts needed in the window before a circuit can open
+        open_seconds: How long an open circuit fails fast before probing
+        half_open_calls: Probe attempts let through, and successes needed
+            to close the circuit again
+
+    Example:
+        breaker = CircuitBreaker(failure_rate=0.5, open_seconds=15)
+        client = AsyncClient(circuit_breaker=breaker)
+        breaker.states()  # {"files": "open", "responses": "closed"}
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate: float = 0.5,
+        slow_call_rate: float = 0.8,
+        slow_call_seconds: float = 10.0,
+        window: int = 20,
+        min_calls: int = 10,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 1,
+    ):
+        self.failure_rate = failure_rate
+        self.slow_call_rate = slow_call_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.window = window
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        # Times any circuit opened
+        self.opened = 0
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def circuit(self, path: str) -> _Circuit:
+        group = endpoint_group(path)
+        circuit = self._circuits.get(group)
+        if circuit is None:
+            with self._lock:
+                circuit = self._circuits.setdefault(group, _Circuit(group, self))
+        return circuit
+
+    def states(self) -> dict[str, CircuitState]:
+        """Current state of every group seen so far."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                group: CircuitState.HALF_OPEN
+                if circuit.state is CircuitState.OPEN and now >= circuit.opened_at + self.open_seconds
+                else circuit.state
+                for group, circuit in self._circuits.items()
+            }
+
+    def reset(self) -> None:
+        """Close every circuit."""
+        with self._lock:
+            self._circuits.clear()
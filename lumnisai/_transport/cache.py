@@ -0,0 +1,187 @@
+"""
+Conditional GET cache for rarely changing reads.
+
+Model preferences, the app catalog, MCP tool lists, tenant info and skills
+are read far more often than they change. When an endpoint is opted in, the
+transport keeps the decoded body of its last 200 response together with the
+response's validators. Later reads send If-None-Match / If-Modified-Since and
+a 304 is answered from the cache, so neither the body nor its parsing is paid
+again. Responses without validators are served from the cache for the
+endpoint's TTL instead.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+from pydantic import BaseModel
+
+# Endpoints cached by default, with the TTL in seconds used when the server
+# sends no validators
+DEFAULT_CACHED_ENDPOINTS: dict[str, float] = {
+    "GET /v1/model-preferences": 60.0,
+    "GET /v1/integrations/apps": 300.0,
+    "GET /v1/mcp-servers/{id}/tools": 300.0,
+    "GET /v1/tenant": 300.0,
+    "GET /v1/tenants/{id}": 300.0,
+    "GET /v1/skills": 60.0,
+}
+
+CacheKey = tuple[str, str, str]
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body, or a pending slot for a cache miss."""
+
+    key: CacheKey
+    ttl: float
+    value: Any = None
+    etag: str | None = None
+    last_modified: str | None = None
+    expires_at: float = 0.0
+    size: int = 0
+    stored: bool = False
+
+    @property
+    def fresh(self) -> bool:
+        """Whether the body may be served without asking the server."""
+        return self.stored and self.etag is None and self.last_modified is None and time.monotonic() < self.expires_at
+
+    def conditional_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.stored and self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.stored and self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _copy(value: Any) -> Any:
+    # Callers own what they get back, so hand out copies of the cached body
+    if isinstance(value, BaseModel):
+        return value.model_copy(deep=True)
+    return copy.deepcopy(value)
+
+
+class HTTPCache:
+    """
+    LRU cache of decoded GET bodies, keyed by URL, query and credentials.
+
+    Args:
+        endpoints: Endpoint name (as in `TransportStats`, e.g.
+            "GET /v1/skills") to TTL in seconds. Only these endpoints are
+            cached. Defaults to `DEFAULT_CACHED_ENDPOINTS`.
+        max_entries: Most responses kept
+        max_bytes: Most response body bytes kept; larger bodies are not cached
+
+    A cache may be shared by several clients; `for_user()` clients share
+    their parent's. Successful writes (POST, PUT, PATCH, DELETE) drop the
+    cached reads of the same collection, e.g. PUT /v1/skills/{id} drops
+    GET /v1/skills.
+
+    Example:
+        cache = HTTPCache({"GET /v1/skills": 30.0})
+        client = AsyncClient(http_cache=cache)
+    """
+
+    def __init__(
+        self,
+        endpoints: Mapping[str, float] | None = None,
+        *,
+        max_entries: int = 256,
+        max_bytes: int = 8 * 1024 * 1024,
+    ):
+        self.endpoints = dict(DEFAULT_CACHED_ENDPOINTS if endpoints is None else endpoints)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+        self._entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def lookup(
+        self,
+        endpoint: str,
+        url: str,
+        params: Any,
+        authorization: str,
+    ) -> CacheEntry | None:
+        """
+        The entry for a GET, or a pending one on a miss. None when the
+        endpoint is not cached.
+        """
+        ttl = self.endpoints.get(endpoint)
+        if ttl is None:
+            return None
+        key = (url, str(httpx.QueryParams(params)) if params else "", authorization)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return CacheEntry(key, ttl)
+            self._entries.move_to_end(key)
+            return entry
+
+    def hit(self, entry: CacheEntry) -> Any:
+        """Serve a fresh entry without a request."""
+        self.hits += 1
+        return _copy(entry.value)
+
+    def not_modified(self, entry: CacheEntry) -> Any:
+        """Serve an entry the server answered with 304 Not Modified."""
+        self.revalidated += 1
+        entry.expires_at = time.monotonic() + entry.ttl
+        return _copy(entry.value)
+
+    def store(self, entry: CacheEntry, response: httpx.Response, value: Any) -> Any:
+        """Keep a 200 response's decoded body. Returns the caller's copy."""
+        self.misses += 1
+        size = len(response.content)
+        if "no-store" in response.headers.get("Cache-Control", "") or size > self.max_bytes:
+            return value
+
+        with self._lock:
+            previous = self._entries.pop(entry.key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            entry.value = value
+            entry.etag = response.headers.get("ETag")
+            entry.last_modified = response.headers.get("Last-Modified")
+            entry.expires_at = time.monotonic() + entry.ttl
+            entry.size = size
+            entry.stored = True
+            self._entries[entry.key] = entry
+            self._bytes += size
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+        return _copy(value)
+
+    def invalidate(self, path: str) -> None:
+        """Drop cached reads of the collection `path` belongs to."""
+        # "/v1/skills/{id}" -> "/v1/skills"
+        collection = "/".join(path.split("?", 1)[0].split("/")[:3])
+        with self._lock:
+            for key in [key for key in self._entries if httpx.URL(key[0]).path.startswith(collection)]:
+                self._bytes -= self._entries.pop(key).size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
@@ -0,0 +1,69 @@
+"""
+Coalescing of identical concurrent requests.
+
+When many coroutines read the same resource at the same moment (a burst of
+get_response or files.get calls for one ID), only the first sends a request;
+the others wait for it and receive a copy of the decoded result, or the same
+exception.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+from .cache import _copy
+
+
+class Singleflight:
+    """
+    Runs at most one call per key at a time and shares its outcome.
+
+    The shared call runs as its own task. Cancelling a waiter only cancels
+    that waiter; the call is cancelled when its last waiter is, so callers
+    that are still interested always get the result. The caller that
+    started the call gets its result; the callers that joined it get copies,
+    so no two callers share a mutable object.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+        self._waiters: dict[Hashable, int] = {}
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        joined = task is not None
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._calls[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+
+        self._waiters[key] += 1
+        try:
+            result = await asyncio.shield(task)
+            return _copy(result) if joined else result
+        except asyncio.CancelledError:
+            if not task.done() and self._waiters[key] == 1:
+                # Last one waiting: nobody needs the result any more
+                self._forget(key, task)
+                task.cancel()
+            raise
+        finally:
+            if key in self._waiters and self._calls.get(key) is task:
+                self._waiters[key] -= 1
+
+    def _forget(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+            del self._waiters[key]
+        # Waiters retrieve the exception; mark it retrieved if nobody did
+        if task.done() and not task.cancelled():
+            task.exception()
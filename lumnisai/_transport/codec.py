@@ -0,0 +1,76 @@
+"""
+JSON encoding and decoding of request and response bodies.
+
+Uses orjson or msgspec when one is installed (`pip install lumnisai[fast]`)
+and the standard library otherwise. Request bodies are encoded to bytes here
+instead of by httpx, and response bodies that map onto a model are validated
+by `validate`, which picks the fastest route from bytes to the model.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+    ModelT = TypeVar("ModelT", bound=BaseModel)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised when msgspec is absent
+    msgspec = None
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    # Integer keys are written as strings, as the standard library does
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _orjson_loads(data: bytes | str) -> Any:
+    return orjson.loads(data)
+
+
+def _msgspec_dumps(obj: Any) -> bytes:
+    return msgspec.json.encode(obj)
+
+
+def _msgspec_loads(data: bytes | str) -> Any:
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e)) from e
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode()
+
+
+def _stdlib_loads(data: bytes | str) -> Any:
+    return json.loads(data)
+
+
+if orjson is not None:
+    NAME = "orjson"
+    dumps, loads = _orjson_dumps, _orjson_loads
+elif msgspec is not None:
+    NAME = "msgspec"
+    dumps, loads = _msgspec_dumps, _msgspec_loads
+else:
+    NAME = "json"
+    dumps, loads = _stdlib_dumps, _stdlib_loads
+
+
+def validate(model: type[ModelT], data: bytes) -> ModelT:
+    """Validate a JSON body into `model`."""
+    if NAME == "json":
+        # Pydantic's JSON parser beats json.loads followed by model_validate
+        return model.model_validate_json(data)
+    # orjson and msgspec build the intermediate objects faster still
+    return model.model_validate(loads(data))
@@ -0,0 +1,115 @@
+"""
+Hedged requests for idempotent reads.
+
+A read that has not been answered within the usual latency of its endpoint
+is most likely stuck behind a slow connection. Sending a second copy on
+another connection and keeping whichever answers first cuts the tail
+latency at the cost of a few extra requests, which a budget keeps to a small
+fraction of the traffic.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Iterable
+
+# Endpoints hedged by default
+DEFAULT_HEDGED_ENDPOINTS = (
+    "GET /v1/responses/{id}",
+    "GET /v1/files/{id}",
+)
+
+
+class HedgePolicy:
+    """
+    When to send a second attempt of a read, and how many.
+
+    Args:
+        endpoints: Endpoint names (as in `TransportStats`) whose GETs are hedged
+        percentile: The hedge is sent once a request has taken longer than
+            this percentile of the endpoint's recent latencies
+        min_delay: Lower bound of the hedge delay, in seconds
+        max_delay: Upper bound of the hedge delay, in seconds
+        budget: Hedges allowed as a fraction of hedgeable requests
+        burst: Most hedges that may be sent back to back after a quiet period
+        window: Recent latencies kept per endpoint
+        min_samples: Requests observed before an endpoint is hedged
+
+    Long polls (requests with a `wait` parameter) are never hedged, since
+    their latency is chosen by the caller.
+
+    Example:
+        client = AsyncClient(hedging=HedgePolicy(percentile=0.9, budget=0.02))
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[str] = DEFAULT_HEDGED_ENDPOINTS,
+        *,
+        percentile: float = 0.95,
+        min_delay: float = 0.01,
+        max_delay: float = 2.0,
+        budget: float = 0.05,
+        burst: float = 10.0,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        if not 0.0 < percentile < 1.0:
+            raise ValueError("percentile must be between 0 and 1")
+        self.endpoints = frozenset(endpoints)
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.burst = burst
+        self.window = window
+        self.min_samples = min_samples
+        # Hedges sent, and hedges that answered before the original attempt
+        self.hedged = 0
+        self.won = 0
+        self._tokens = burst
+        self._latencies: dict[str, deque[float]] = {}
+        self._delays: dict[str, float] = {}
+        # Latencies added since the endpoint's delay was last computed
+        self._unsorted: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def covers(self, endpoint: str) -> bool:
+        return endpoint in self.endpoints
+
+    def delay(self, endpoint: str) -> float | None:
+        """
+        Seconds to wait before hedging a request, or None while the endpoint
+        has too few samples. Each call accrues budget for one request.
+        """
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.budget)
+            return self._delays.get(endpoint)
+
+    def allow(self) -> bool:
+        """Spend budget on one hedge, if there is enough."""
+        with self._lock:
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            self.hedged += 1
+            return True
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Add the latency of a successful request."""
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+            latencies.append(latency)
+            self._unsorted[endpoint] = unsorted = self._unsorted.get(endpoint, 0) + 1
+            if len(latencies) < self.min_samples:
+                return
+            # Recompute the delay every tenth of a window, not on every request
+            if endpoint in self._delays and unsorted < max(1, self.window // 10):
+                return
+            self._unsorted[endpoint] = 0
+            ordered = sorted(latencies)
+            value = ordered[min(len(ordered) - 1, int(self.percentile * len(ordered)))]
+            self._delays[endpoint] = min(self.max_delay, max(self.min_delay, value))
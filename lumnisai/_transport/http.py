@@ -1,13 +1,19 @@
 
 import asyncio
+import dataclasses
+import functools
 import logging
+import math
 import time
+from collections.abc import Mapping
+from contextlib import AsyncExitStack, nullcontext
 from decimal import Decimal, getcontext
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urljoin
 
 import httpx
 from httpx import Response
+from pydantic import BaseModel
 
 from ..constants import (
     DEFAULT_BACKOFF_FACTOR,
@@ -23,6 +29,21 @@ from ..exceptions import (
     TransportError,
     ValidationError,
 )
+from . import codec
+from .breaker import CircuitBreaker
+from .cache import CacheEntry, HTTPCache
+from .coalesce import Singleflight
+from .hedging import HedgePolicy
+from .instrumentation import RequestInfo, TransportHooks, endpoint_name
+from .lanes import BulkLane
+from .limiter import ConcurrencyLimiter
+from .profile import TransportProfile
+from .ratelimit import SharedRateLimiter, parse_retry_after
+from .scheduler import PriorityScheduler
+from .warmup import WarmupReport, prewarm_lane
+
+if TYPE_CHECKING:
+    from ..tracing import Tracer
 
 logger = logging.getLogger("lumnisai.transport")
 
@@ -68,12 +89,46 @@ class HTTPTransport:
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
         backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        hooks: TransportHooks | None = None,
+        tracer: "Tracer | None" = None,
+        http_transport: httpx.AsyncBaseTransport | None = None,
+        cache: HTTPCache | None = None,
+        coalesce_requests: bool = True,
+        hedging: HedgePolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        limiter: ConcurrencyLimiter | None = None,
+        rate_limiter: SharedRateLimiter | None = None,
+        scheduler: PriorityScheduler | None = None,
+        bulk_lane: BulkLane | None = None,
+        profile: TransportProfile | None = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
+        self.hooks = hooks if hooks is not None else TransportHooks()
+        if tracer is None:
+            from ..tracing import NOOP_TRACER
+
+            tracer = NOOP_TRACER
+        self.tracer = tracer
+        self.cache = cache
+        # Identical concurrent reads share one request
+        self.singleflight = Singleflight() if coalesce_requests else None
+        self.hedging = hedging
+        self.circuit_breaker = circuit_breaker
+        self.limiter = limiter
+        self.rate_limiter = rate_limiter
+        self.scheduler = scheduler
+        if scheduler is not None and limiter is not None:
+            # Queue in priority order up to the adaptive limit
+            scheduler.limiter = limiter
+        self.bulk_lane = bulk_lane
+        self.profile = profile if profile is not None else TransportProfile()
+        self._http_transport = http_transport
+        self._hedge_client: httpx.AsyncClient | None = None
+        self._bulk_client: httpx.AsyncClient | None = None
 
         # Token bucket for tenant scope warnings
         self.tenant_warning_bucket = TokenBucket(
@@ -81,23 +136,62 @@ class HTTPTransport:
             TENANT_WARNING_BUCKET_REFILL_RATE
         )
 
-        # HTTP client with optimized connection pool
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(timeout),
-            limits=httpx.Limits(
-                max_keepalive_connections=20,
-                max_connections=100,
-                keepalive_expiry=30.0
-            ),
-            http2=True,  # Enable HTTP/2 for better performance
+        self.client = self._build_client()
+
+    def _build_client(
+        self,
+        *,
+        timeout: httpx.Timeout | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+    ) -> httpx.AsyncClient:
+        # HTTP client with the connection pool described by the profile
+        profile = self.profile
+        limits = limits or profile.limits()
+        http2 = profile.http2 if http2 is None else http2
+        transport = self._http_transport  # e.g. httpx.MockTransport for in-process testing
+        if transport is None:
+            # TCP keepalive and the local address need a transport of their own
+            transport = profile.http_transport(limits=limits, http2=http2)
+        return httpx.AsyncClient(
+            timeout=timeout or profile.timeouts(self.timeout),
+            limits=limits,
+            http2=http2,
             follow_redirects=True,  # Automatically follow redirects (e.g., for file downloads)
+            transport=transport,
             headers={
                 "User-Agent": "lumnisai-python/0.1.0b0",
             },
         )
 
+    @property
+    def hedge_client(self) -> httpx.AsyncClient:
+        """
+        Connection pool for hedged attempts. With HTTP/2 a hedge sent through
+        the main pool would share the slow connection it is meant to avoid.
+        """
+        if self._hedge_client is None:
+            self._hedge_client = self._build_client()
+        return self._hedge_client
+
+    @property
+    def bulk_client(self) -> httpx.AsyncClient:
+        """Connection pool of the bulk transfer lane."""
+        if self._bulk_client is None:
+            lane = self.bulk_lane
+            self._bulk_client = self._build_client(
+                timeout=lane.httpx_timeout(), limits=lane.limits(), http2=lane.http2
+            )
+        return self._bulk_client
+
     async def close(self):
         await self.client.aclose()
+        if self._hedge_client is not None:
+            await self._hedge_client.aclose()
+            self._hedge_client = None
+        if self._bulk_client is not None:
+            await self._bulk_client.aclose()
+            self._bulk_client = None
 
     async def __aenter__(self):
         return self
@@ -127,6 +221,10 @@ class HTTPTransport:
         if headers:
             request_headers.update(headers)
 
+        # Encode JSON bodies here rather than in httpx, with the fastest codec
+        if "json" in kwargs:
+            kwargs["content"] = codec.dumps(kwargs.pop("json"))
+
         # Log request (with auth headers redacted)
         log_headers = {k: v if k != "Authorization" else "[REDACTED]"
                       for k, v in request_headers.items()}
@@ -139,9 +237,19 @@ class HTTPTransport:
             **kwargs,
         }
 
-    async def _handle_response(self, response: Response, raw_response: bool = False) -> Any:
+    async def _handle_response(
+        self,
+        response: Response,
+        raw_response: bool = False,
+        model: type[BaseModel] | None = None,
+        cache_entry: CacheEntry | None = None,
+    ) -> Any:
         request_id = response.headers.get("X-Request-ID")
 
+        # Conditional GET answered from the cache
+        if response.status_code == 304 and cache_entry is not None and cache_entry.stored:
+            return self.cache.not_modified(cache_entry)
+
         # Success
         if 200 <= response.status_code < 300:
             # Return raw bytes if requested (e.g., for file downloads)
@@ -149,14 +257,27 @@ class HTTPTransport:
                 return response.content
             
             if response.headers.get("content-type", "").startswith("application/json"):
-                return response.json()
-            return response.text
+                # Validate straight from bytes when the caller knows the model
+                if model is not None:
+                    value = codec.validate(model, response.content)
+                else:
+                    value = codec.loads(response.content)
+            else:
+                value = response.text
+            if cache_entry is not None:
+                return self.cache.store(cache_entry, response, value)
+            return value
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after and self.rate_limiter is not None and response.status_code in (429, 503):
+            # Hold back every process sharing the limiter, not just this request
+            await self.rate_limiter.pause(retry_after)
 
         # Parse error detail
         detail = {}
         try:
             if response.headers.get("content-type", "").startswith("application/json"):
-                detail = response.json()
+                detail = codec.loads(response.content)
         except (ValueError, TypeError) as e:
             logger.debug(f"Failed to parse error response as JSON: {e}")
             detail = {"raw": response.text}
@@ -184,12 +305,11 @@ class HTTPTransport:
                 detail=detail,
             )
         elif response.status_code == 429:
-            retry_after = response.headers.get("Retry-After")
             raise RateLimitError(
                 request_id=request_id,
                 status_code=429,
                 detail=detail,
-                retry_after=int(retry_after) if retry_after else None,
+                retry_after=math.ceil(retry_after) if retry_after is not None else None,
             )
         elif 400 <= response.status_code < 500:
             error_msg = detail.get("error", {}).get("message", "Validation error")
@@ -214,6 +334,7 @@ class HTTPTransport:
         *,
         idempotency_key: str | None = None,
         raw_response: bool = False,
+        model: type[BaseModel] | None = None,
         **kwargs,
     ) -> Any:
         # Add idempotency key if provided
@@ -221,6 +342,20 @@ class HTTPTransport:
         if idempotency_key:
             headers["Idempotency-Key"] = idempotency_key
 
+        # Serve or revalidate opted-in reads from the HTTP cache
+        cache_entry = None
+        if self.cache is not None and method == "GET" and not raw_response:
+            cache_entry = self.cache.lookup(
+                endpoint_name(method, path),
+                urljoin(self.base_url, path),
+                kwargs.get("params"),
+                self.api_key,
+            )
+            if cache_entry is not None:
+                if cache_entry.fresh:
+                    return self.cache.hit(cache_entry)
+                headers.update(cache_entry.conditional_headers())
+
         # Prepare request
         request_params = self._prepare_request(
             method, path, headers=headers, **kwargs
@@ -228,15 +363,98 @@ class HTTPTransport:
 
         # Determine if request is idempotent
         is_idempotent = method in ("GET", "HEAD", "OPTIONS") or idempotency_key is not None
+        send = functools.partial(
+            self._send,
+            method,
+            path,
+            request_params,
+            is_idempotent=is_idempotent,
+            raw_response=raw_response,
+            model=model,
+            cache_entry=cache_entry,
+        )
+        # Raw responses are not coalesced: an httpx.Response cannot be copied
+        if self.singleflight is not None and method in ("GET", "HEAD") and not raw_response:
+            params = kwargs.get("params")
+            key = (
+                method,
+                request_params["url"],
+                str(httpx.QueryParams(params)) if params else "",
+                tuple(headers.items()),
+                # Per-call options such as timeout change what the call may return
+                tuple(sorted((name, repr(value)) for name, value in kwargs.items() if name != "params")),
+                model,
+            )
+            result = await self.singleflight.do(key, send)
+        else:
+            result = await send()
+
+        # A successful write may change what cached reads return
+        if self.cache is not None and method not in ("GET", "HEAD", "OPTIONS"):
+            self.cache.invalidate(path)
+        return result
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        request_params: dict[str, Any],
+        *,
+        is_idempotent: bool,
+        raw_response: bool = False,
+        model: type[BaseModel] | None = None,
+        cache_entry: CacheEntry | None = None,
+    ) -> Any:
+        # Retry loop around single attempts
         max_attempts = self.max_retries + 1 if is_idempotent else 1
+        decode = {"raw_response": raw_response, "model": model, "cache_entry": cache_entry}
+        endpoint = endpoint_name(method, path)
+        # Long polls take as long as the caller asked for; never hedge them,
+        # count them as slow or make them wait for a slot
+        long_poll = "wait" in (request_params.get("params") or {})
+        # Bulk transfers have their own pool and limits instead
+        bulk = self.bulk_lane is not None and self.bulk_lane.covers(endpoint)
+        client = self.bulk_client if bulk else self.client
+        hedged = (
+            self.hedging is not None
+            and method == "GET"
+            and self.hedging.covers(endpoint)
+            and not long_poll
+            and not bulk
+        )
+        circuit = self.circuit_breaker.circuit(path) if self.circuit_breaker is not None else None
+        # Transfers are as slow as the file is large
+        track_latency = not long_poll and not bulk
+        limited = self.limiter is not None and not long_poll and not bulk
+        scheduled = self.scheduler is not None and not long_poll and not bulk
 
         last_error = None
         first_server_error = None  # Track first 5xx error separately
 
         for attempt in range(max_attempts):
+            info = None
+            if self.hooks:
+                info = RequestInfo(
+                    method,
+                    path,
+                    endpoint,
+                    attempt=attempt,
+                    headers=request_params["headers"],
+                )
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
             try:
-                response = await self.client.request(**request_params)
-                return await self._handle_response(response, raw_response=raw_response)
+                async with AsyncExitStack() as slots:
+                    if bulk:
+                        await slots.enter_async_context(self.bulk_lane.slot())
+                    if scheduled:
+                        await slots.enter_async_context(self.scheduler.slot())
+                    if limited:
+                        await slots.enter_async_context(self.limiter.slot(endpoint))
+                    with circuit.call(track_latency=track_latency) if circuit is not None else nullcontext():
+                        if hedged:
+                            return await self._hedged_attempt(request_params, info, endpoint, **decode)
+                        return await self._attempt(client, request_params, info, **decode)
 
             except (httpx.NetworkError, httpx.TimeoutException) as e:
                 last_error = TransportError(
@@ -263,17 +481,198 @@ class HTTPTransport:
             if attempt < max_attempts - 1:
                 backoff = self.backoff_factor * (2 ** attempt)
                 logger.debug(f"Retrying request (attempt {attempt + 1}/{max_attempts}) after {backoff}s")
+                if info is not None:
+                    info.backoff = backoff
+                    self.hooks.emit("retry", info)
                 await asyncio.sleep(backoff)
 
         # All retries failed - prefer first server error with status code over network errors
         raise first_server_error or last_error or TransportError("Request failed after all retries")
 
+    async def _attempt(
+        self,
+        client: httpx.AsyncClient,
+        request_params: dict[str, Any],
+        info: RequestInfo | None,
+        *,
+        raw_response: bool = False,
+        model: type[BaseModel] | None = None,
+        cache_entry: CacheEntry | None = None,
+    ) -> Any:
+        if info is None:
+            response = await client.request(**request_params)
+            return await self._handle_response(
+                response, raw_response=raw_response, model=model, cache_entry=cache_entry
+            )
+        return await self._instrumented_attempt(
+            client, request_params, info, raw_response=raw_response, model=model, cache_entry=cache_entry
+        )
+
+    async def _hedged_attempt(
+        self,
+        request_params: dict[str, Any],
+        info: RequestInfo | None,
+        endpoint: str,
+        **decode: Any,
+    ) -> Any:
+        # One attempt, plus a second one on the hedge pool if the first is
+        # slower than usual; the first success wins and the other is cancelled
+        started = time.perf_counter()
+        delay = self.hedging.delay(endpoint)
+        if delay is None:
+            result = await self._attempt(self.client, request_params, info, **decode)
+            self.hedging.record(endpoint, time.perf_counter() - started)
+            return result
+
+        primary = asyncio.ensure_future(self._attempt(self.client, request_params, info, **decode))
+        pending = {primary}
+        try:
+            await asyncio.wait(pending, timeout=delay)
+            if primary.done():
+                result = primary.result()
+                self.hedging.record(endpoint, time.perf_counter() - started)
+                return result
+            if self.hedging.allow():
+                hedge_info = None
+                if info is not None:
+                    # The hedge is an attempt of its own: nothing measured on
+                    # the primary carries over
+                    hedge_info = dataclasses.replace(
+                        info,
+                        headers=dict(info.headers),
+                        hedge=True,
+                        status_code=None,
+                        request_id=None,
+                        bytes_sent=0,
+                        bytes_received=0,
+                        pool_wait=None,
+                        connect_time=None,
+                        time_to_headers=None,
+                        decode_time=None,
+                        elapsed=None,
+                        error=None,
+                        span=None,
+                        _trace_events={},
+                    )
+                pending.add(
+                    asyncio.ensure_future(self._attempt(self.hedge_client, request_params, hedge_info, **decode))
+                )
+
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winners = [task for task in done if task.exception() is None]
+                if winners:
+                    if winners[0] is not primary:
+                        self.hedging.won += 1
+                    self.hedging.record(endpoint, time.perf_counter() - started)
+                    return winners[0].result()
+                if not pending:
+                    return done.pop().result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _instrumented_attempt(
+        self,
+        client: httpx.AsyncClient,
+        request_params: dict[str, Any],
+        info: RequestInfo,
+        *,
+        raw_response: bool = False,
+        model: type[BaseModel] | None = None,
+        cache_entry: CacheEntry | None = None,
+    ) -> Any:
+        # Same as client.request() + _handle_response(), but streams the
+        # response so headers, body and decoding can be timed separately
+        info.started_at = time.perf_counter()
+        self.hooks.emit("request_start", info)
+        try:
+            request = client.build_request(
+                **request_params, extensions={"trace": info.trace}
+            )
+            info.bytes_sent = int(request.headers.get("Content-Length", 0))
+            response = await client.send(request, stream=True)
+            try:
+                info.time_to_headers = time.perf_counter() - info.started_at
+                info.status_code = response.status_code
+                info.request_id = response.headers.get("X-Request-ID")
+                self.hooks.emit("response_headers", info)
+                await response.aread()
+            finally:
+                await response.aclose()
+            info.bytes_received = response.num_bytes_downloaded
+
+            decode_started = time.perf_counter()
+            result = await self._handle_response(
+                response, raw_response=raw_response, model=model, cache_entry=cache_entry
+            )
+            finished = time.perf_counter()
+            info.decode_time = finished - decode_started
+            info.elapsed = finished - info.started_at
+        except Exception as e:
+            info.error = e
+            info.elapsed = time.perf_counter() - info.started_at
+            self.hooks.emit("error", info)
+            raise
+        except asyncio.CancelledError:
+            info.elapsed = time.perf_counter() - info.started_at
+            self.hooks.emit("cancelled", info)
+            raise
+
+        self.hooks.emit("response_end", info)
+        return result
+
     async def warmup(self):
         try:
             await self.request("GET", "/v1/health", timeout=5.0)
         except Exception:
             pass  # Ignore warmup failures
 
+    async def prewarm(
+        self,
+        connections: int | Mapping[str, int] = 10,
+        *,
+        timeout: float = 10.0,
+    ) -> WarmupReport:
+        """
+        Open connections ahead of traffic, concurrently in every lane.
+
+        Args:
+            connections: Connections to open in the "api" lane, or a mapping
+                of lane ("api", "bulk") to connections. Capped at the number
+                of connections the lane keeps alive.
+            timeout: Timeout of each warmup request, in seconds
+        """
+        if isinstance(connections, int):
+            connections = {"api": connections}
+        request_params = self._prepare_request("GET", "/v1/health", timeout=timeout)
+
+        # Resolve every lane before creating any coroutine, so an invalid one
+        # does not leave the others never awaited
+        for lane in connections:
+            if lane != "api" and (lane != "bulk" or self.bulk_lane is None):
+                raise ValueError(f"Unknown or disabled lane {lane!r}; expected 'api' or 'bulk'")
+        lanes = []
+        for lane, count in connections.items():
+            if count <= 0:
+                continue
+            if lane == "api":
+                client, http2, keepalive = self.client, self.profile.http2, self.profile.max_keepalive_connections
+            else:
+                client, http2, keepalive = self.bulk_client, self.bulk_lane.http2, self.bulk_lane.max_connections
+            lanes.append((lane, client, http2, min(count, keepalive)))
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(prewarm_lane(lane, client, request_params, count, http2=http2) for lane, client, http2, count in lanes)
+        )
+        report = WarmupReport(elapsed_ms=(time.perf_counter() - started) * 1000, lanes=list(results))
+        if report.ready:
+            logger.info(str(report))
+        else:
+            logger.warning(str(report))
+        return report
+
     async def warn_tenant_scope(self):
         if await self.tenant_warning_bucket.consume():
             logging.getLogger("lumnisai.scoping").warning(
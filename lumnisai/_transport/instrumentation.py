@@ -0,0 +1,362 @@
+"""
+Request lifecycle hooks and in-process transport statistics.
+
+HTTPTransport reports every attempt of every request to a `TransportHooks`
+registry. Nothing is timed or traced unless at least one callback has been
+registered, so an idle registry costs a truthiness check per request.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from .limiter import ConcurrencyStats
+from .scheduler import PriorityStats
+
+logger = logging.getLogger("lumnisai.transport")
+
+HookEvent = Literal["request_start", "response_headers", "response_end", "retry", "error", "cancelled"]
+HOOK_EVENTS: tuple[HookEvent, ...] = (
+    "request_start",
+    "response_headers",
+    "response_end",
+    "retry",
+    "error",
+    "cancelled",
+)
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+_ID_SEGMENT = re.compile(
+    r"^(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    r"|\d+|[0-9a-fA-F]{24,}|[^/]+@[^/]+)$"
+)
+
+
+@lru_cache(maxsize=1024)
+def endpoint_name(method: str, path: str) -> str:
+    """Group a request under its route, e.g. "GET /v1/responses/{id}"."""
+    path = path.split("?", 1)[0]
+    segments = ["{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")]
+    return f"{method} {'/'.join(segments)}"
+
+
+@dataclass
+class RequestInfo:
+    """
+    State of one request attempt, passed to every hook.
+
+    Durations are in seconds and measured from `started_at`. `pool_wait` and
+    `connect_time` come from httpx connection tracing and are None when the
+    request did not go through a real connection pool (e.g. a mock transport).
+    `headers` are the outgoing request headers; request_start callbacks may
+    add to them.
+    """
+
+    method: str
+    path: str
+    endpoint: str
+    attempt: int = 0
+    started_at: float = 0.0
+    headers: dict[str, str] = field(default_factory=dict)
+    status_code: int | None = None
+    request_id: str | None = None
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    pool_wait: float | None = None
+    connect_time: float | None = None
+    time_to_headers: float | None = None
+    decode_time: float | None = None
+    elapsed: float | None = None
+    backoff: float | None = None
+    # Whether this attempt is a hedge sent alongside a slow one
+    hedge: bool = False
+    error: BaseException | None = None
+    # Tracing span of this attempt, when tracing is enabled
+    span: Any = None
+    # Timestamps of httpx trace events, keyed by event name
+    _trace_events: dict[str, float] = field(default_factory=dict)
+
+    async def trace(self, event_name: str, info: dict[str, Any]) -> None:
+        """httpx `trace` extension callback recording connection timings."""
+        now = time.perf_counter()
+        if not self._trace_events:
+            # The first connection-level event marks the end of the pool wait
+            self.pool_wait = now - self.started_at
+        self._trace_events[event_name] = now
+
+        if event_name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+            started = self._trace_events.get(event_name.replace(".complete", ".started"))
+            if started is not None:
+                self.connect_time = (self.connect_time or 0.0) + now - started
+
+
+Hook = Callable[[RequestInfo], None]
+
+
+class TransportHooks:
+    """
+    Registry of callbacks invoked over the lifecycle of each request.
+
+    Events, in order:
+        request_start: before an attempt is sent
+        response_headers: status line and headers received
+        response_end: body read and decoded (successful responses only)
+        retry: an attempt failed and will be retried after `info.backoff`
+        error: an attempt failed; `info.error` holds the exception
+        cancelled: an attempt was abandoned, e.g. the loser of a hedged pair
+
+    Callbacks run synchronously on the event loop and must not block.
+    Exceptions raised by callbacks are logged and swallowed.
+
+    Example:
+        hooks = TransportHooks()
+        hooks.on("response_end", lambda info: print(info.endpoint, info.elapsed))
+        client = AsyncClient(hooks=hooks)
+    """
+
+    def __init__(self) -> None:
+        self._callbacks: dict[str, list[Hook]] = {event: [] for event in HOOK_EVENTS}
+        self._active = False
+
+    def __bool__(self) -> bool:
+        return self._active
+
+    def on(self, event: HookEvent, callback: Hook) -> Hook:
+        """Register a callback for an event. Returns the callback."""
+        if event not in self._callbacks:
+            raise ValueError(f"Unknown transport event {event!r}; expected one of {HOOK_EVENTS}")
+        self._callbacks[event].append(callback)
+        self._active = True
+        return callback
+
+    def off(self, event: HookEvent, callback: Hook) -> None:
+        """Unregister a callback previously registered with on()."""
+        self._callbacks[event].remove(callback)
+        self._active = any(self._callbacks.values())
+
+    def emit(self, event: HookEvent, info: RequestInfo) -> None:
+        for callback in self._callbacks[event]:
+            try:
+                callback(info)
+            except Exception as e:
+                logger.debug(f"Transport hook {callback!r} failed on {event}: {e}")
+
+
+class LatencyStats(BaseModel):
+    """Latency distribution, in milliseconds, estimated from histogram buckets."""
+
+    count: int
+    mean: float | None = None
+    p50: float | None = None
+    p95: float | None = None
+    p99: float | None = None
+    max: float | None = None
+    buckets: dict[str, int]
+
+
+class EndpointStats(BaseModel):
+    """Aggregated transport statistics for one endpoint; times are totals."""
+
+    endpoint: str
+    requests: int
+    errors: int
+    retries: int
+    status_counts: dict[str, int]
+    latency: LatencyStats
+    bytes_sent: int
+    bytes_received: int
+    pool_wait_ms: float = 0.0
+    connect_ms: float = 0.0
+    decode_ms: float = 0.0
+
+
+class TransportStatsSnapshot(BaseModel):
+    """Point-in-time copy of the collected transport statistics."""
+
+    uptime_seconds: float
+    requests: int
+    errors: int
+    retries: int
+    endpoints: list[EndpointStats]
+    # State of the concurrency limiter, when the client has one
+    concurrency: ConcurrencyStats | None = None
+    # Admission by priority class, when the client has a scheduler
+    priorities: list[PriorityStats] | None = None
+
+    def __str__(self):
+        lines = [f"{self.requests} requests, {self.errors} errors, {self.retries} retries in {self.uptime_seconds:.0f}s"]
+        if self.concurrency is not None:
+            concurrency = self.concurrency
+            lines.append(
+                f"  concurrency limit {concurrency.limit}, {concurrency.in_flight} in flight, "
+                f"{concurrency.queue_depth} queued"
+            )
+        for priority in self.priorities or []:
+            mean_wait = priority.queue_time_ms / priority.admitted if priority.admitted else 0.0
+            lines.append(
+                f"  {priority.priority.value}: {priority.admitted} admitted, {priority.queued} queued, "
+                f"mean wait {mean_wait:.1f}ms, max {priority.max_queue_time_ms:.0f}ms"
+            )
+        for stats in self.endpoints:
+            latency = stats.latency
+            p50 = f"{latency.p50:.0f}ms" if latency.p50 is not None else "n/a"
+            p99 = f"{latency.p99:.0f}ms" if latency.p99 is not None else "n/a"
+            lines.append(f"  {stats.endpoint}: {stats.requests} requests, p50 {p50}, p99 {p99}, {stats.errors} errors")
+        return "\n".join(lines)
+
+
+class _EndpointCounters:
+
+    __slots__ = (
+        "bytes_received",
+        "bytes_sent",
+        "connect",
+        "decode",
+        "errors",
+        "histogram",
+        "latency_max",
+        "latency_sum",
+        "pool_wait",
+        "requests",
+        "retries",
+        "status_counts",
+    )
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.status_counts: dict[str, int] = {}
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.pool_wait = 0.0
+        self.connect = 0.0
+        self.decode = 0.0
+
+    def percentile(self, q: float) -> float:
+        # Linear interpolation inside the bucket holding the q-th observation
+        rank = q * sum(self.histogram)
+        seen = 0
+        for index, count in enumerate(self.histogram):
+            if count and seen + count >= rank:
+                lower = LATENCY_BUCKETS_MS[index - 1] if index > 0 else 0
+                upper = LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else self.latency_max
+                return min(lower + (upper - lower) * (rank - seen) / count, self.latency_max)
+            seen += count
+        return self.latency_max
+
+
+class TransportStats:
+    """
+    Collector of per-endpoint latency histograms, byte counts, retries and
+    pool wait time, fed by transport hooks.
+
+    Enable it with `AsyncClient(collect_stats=True)` and read it with
+    `client.stats()`, or attach it to your own `TransportHooks`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._endpoints: dict[str, _EndpointCounters] = {}
+
+    def attach(self, hooks: TransportHooks) -> None:
+        hooks.on("response_end", self._record_response)
+        hooks.on("retry", self._record_retry)
+        hooks.on("error", self._record_error)
+
+    def _counters(self, endpoint: str) -> _EndpointCounters:
+        counters = self._endpoints.get(endpoint)
+        if counters is None:
+            counters = self._endpoints.setdefault(endpoint, _EndpointCounters())
+        return counters
+
+    def _record(self, info: RequestInfo, counters: _EndpointCounters) -> None:
+        counters.requests += 1
+        if info.status_code is not None:
+            status = str(info.status_code)
+            counters.status_counts[status] = counters.status_counts.get(status, 0) + 1
+        if info.elapsed is not None:
+            latency_ms = info.elapsed * 1000
+            counters.histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+            counters.latency_sum += latency_ms
+            counters.latency_max = max(counters.latency_max, latency_ms)
+        counters.bytes_sent += info.bytes_sent
+        counters.bytes_received += info.bytes_received
+        counters.pool_wait += info.pool_wait or 0.0
+        counters.connect += info.connect_time or 0.0
+        counters.decode += info.decode_time or 0.0
+
+    def _record_response(self, info: RequestInfo) -> None:
+        with self._lock:
+            self._record(info, self._counters(info.endpoint))
+
+    def _record_error(self, info: RequestInfo) -> None:
+        with self._lock:
+            counters = self._counters(info.endpoint)
+            counters.errors += 1
+            self._record(info, counters)
+
+    def _record_retry(self, info: RequestInfo) -> None:
+        with self._lock:
+            self._counters(info.endpoint).retries += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+            self._started = time.monotonic()
+
+    def snapshot(self) -> TransportStatsSnapshot:
+        with self._lock:
+            endpoints = []
+            for endpoint, counters in sorted(self._endpoints.items()):
+                observed = sum(counters.histogram)
+                labels = [f"<={bound}ms" for bound in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+                latency = LatencyStats(
+                    count=observed,
+                    buckets={label: count for label, count in zip(labels, counters.histogram) if count},
+                )
+                if observed:
+                    latency.mean = counters.latency_sum / observed
+                    latency.p50 = counters.percentile(0.50)
+                    latency.p95 = counters.percentile(0.95)
+                    latency.p99 = counters.percentile(0.99)
+                    latency.max = counters.latency_max
+                endpoints.append(
+                    EndpointStats(
+                        endpoint=endpoint,
+                        requests=counters.requests,
+                        errors=counters.errors,
+                        retries=counters.retries,
+                        status_counts=dict(counters.status_counts),
+                        latency=latency,
+                        bytes_sent=counters.bytes_sent,
+                        bytes_received=counters.bytes_received,
+                        pool_wait_ms=counters.pool_wait * 1000,
+                        connect_ms=counters.connect * 1000,
+                        decode_ms=counters.decode * 1000,
+                    )
+                )
+
+            return TransportStatsSnapshot(
+                uptime_seconds=time.monotonic() - self._started,
+                requests=sum(e.requests for e in endpoints),
+                errors=sum(e.errors for e in endpoints),
+                retries=sum(e.retries for e in endpoints),
+                endpoints=endpoints,
+            )
@@ -0,0 +1,96 @@
+"""
+A separate lane for bulk transfers.
+
+Uploads and downloads hold a connection for as long as the file takes to
+move. On the shared HTTP/2 pool they also share a connection's stream and
+flow-control windows with every JSON call multiplexed over it, so a large
+upload slows down response polling. Bulk transfer endpoints therefore go
+through their own connection pool, with their own connection limit,
+timeouts and HTTP version, and bypass the admission control of API calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Iterable
+from contextlib import asynccontextmanager
+
+import httpx
+
+# Endpoints sent through the bulk lane by default
+DEFAULT_BULK_ENDPOINTS = (
+    "POST /v1/files/upload",
+    "POST /v1/files/bulk-upload",
+    "GET /v1/files/{id}/download",
+)
+
+
+class BulkLane:
+    """
+    Connection pool and limits for bulk transfer endpoints.
+
+    Args:
+        endpoints: Endpoint names (as in `TransportStats`) sent through the lane
+        max_connections: Connections the lane may open
+        max_concurrency: Transfers allowed in flight; others wait their turn.
+            None leaves it to `max_connections`.
+        timeout: Read and write timeout of a transfer, in seconds
+        connect_timeout: Connect timeout, in seconds
+        http2: Whether to use HTTP/2. Off by default so every transfer gets
+            its own TCP connection and flow-control window.
+
+    Example:
+        client = AsyncClient(bulk_lane=BulkLane(max_concurrency=2, timeout=600))
+    """
+
+    def __init__(
+        self,
+        endpoints: Iterable[str] = DEFAULT_BULK_ENDPOINTS,
+        *,
+        max_connections: int = 8,
+        max_concurrency: int | None = 4,
+        timeout: float = 300.0,
+        connect_timeout: float = 10.0,
+        http2: bool = False,
+    ):
+        self.endpoints = frozenset(endpoints)
+        self.max_connections = max_connections
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.http2 = http2
+        # Transfers in flight, and waiting for a turn
+        self.in_flight = 0
+        self.waiting = 0
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    def covers(self, endpoint: str) -> bool:
+        return endpoint in self.endpoints
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the lane's transfer slots for an attempt."""
+        if self._semaphore is not None:
+            self.waiting += 1
+            try:
+                await self._semaphore.acquire()
+            finally:
+                self.waiting -= 1
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_keepalive_connections=self.max_connections,
+            max_connections=self.max_connections,
+            keepalive_expiry=30.0,
+        )
+
+    def httpx_timeout(self) -> httpx.Timeout:
+        # Transfers queue for a connection as long as it takes
+        return httpx.Timeout(self.timeout, connect=self.connect_timeout, pool=None)
@@ -0,0 +1,232 @@
+"""
+Adaptive client-side concurrency limiting.
+
+The connection pool allows 100 connections, far more concurrent requests than
+the API sustains for most tenants; a batch job that uses them all mostly gets
+429s back. The limiter caps requests in flight and adjusts the cap the way
+TCP adjusts its congestion window (AIMD): it grows by one request per
+round trip of healthy responses, and shrinks by a constant factor on 429 or
+503 responses, timeouts, or when latency stays well above its usual level.
+Requests over the cap wait in a FIFO queue until a slot frees up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+
+import httpx
+from pydantic import BaseModel
+
+from ..exceptions import RateLimitError, TransportError
+
+logger = logging.getLogger("lumnisai.transport")
+
+
+class ConcurrencyStats(BaseModel):
+    """Point-in-time state of a `ConcurrencyLimiter`."""
+
+    limit: int
+    in_flight: int
+    queue_depth: int
+    queued: int
+    increases: int
+    decreases: int
+
+
+def _is_overload(error: BaseException) -> bool:
+    if isinstance(error, (RateLimitError, httpx.TimeoutException)):
+        return True
+    return isinstance(error, TransportError) and error.status_code == 503
+
+
+class ConcurrencyLimiter:
+    """
+    AIMD limit on the number of requests a client has in flight.
+
+    Args:
+        initial_limit: Requests allowed in flight before any feedback
+        min_limit: The limit never drops below this
+        max_limit: The limit never grows above this
+        backoff: Factor the limit is multiplied by on overload
+        latency_tolerance: An endpoint whose smoothed latency exceeds this
+            multiple of its baseline (the median of its recent healthy
+            latencies) counts as overloaded
+        window: Recent latencies kept per endpoint for the baseline
+        min_samples: Responses observed before an endpoint's latency is judged
+        smoothing: Weight of each response in the smoothed latency, an
+            exponentially weighted moving average
+        sustained: Consecutive responses the smoothed latency must stay over
+            the tolerance before the limit drops
+
+    The limit drops at most once per round trip: overload signals from
+    requests sent before the last decrease are ignored, so a burst of 429s
+    answering one wave of requests halves the limit once rather than
+    collapsing it. Single slow responses are expected with any latency
+    distribution and never lower the limit; only a sustained rise does.
+    Latencies over the tolerance are left out of the baseline, so the limit
+    stays down for as long as the rise lasts.
+    Long polls neither take a slot nor feed the limiter.
+
+    Example:
+        limiter = ConcurrencyLimiter(initial_limit=10, max_limit=50)
+        client = AsyncClient(concurrency_limiter=limiter)
+        limiter.limit, limiter.queue_depth
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff: float = 0.5,
+        latency_tolerance: float = 2.0,
+        window: int = 100,
+        min_samples: int = 10,
+        smoothing: float = 0.2,
+        sustained: int = 5,
+    ):
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError("initial_limit must be between min_limit and max_limit")
+        if not 0.0 < backoff < 1.0:
+            raise ValueError("backoff must be between 0 and 1")
+        if not 0.0 < smoothing <= 1.0:
+            raise ValueError("smoothing must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.window = window
+        self.min_samples = min_samples
+        self.smoothing = smoothing
+        self.sustained = sustained
+        self.in_flight = 0
+        # Requests that had to wait, and adjustments of the limit
+        self.queued = 0
+        self.increases = 0
+        self.decreases = 0
+        self._limit = float(initial_limit)
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._latencies: dict[str, deque[float]] = {}
+        # Per endpoint: smoothed latency, median of the window, latencies
+        # added since the median was computed, and responses in a row whose
+        # smoothed latency was over the tolerance
+        self._smoothed: dict[str, float] = {}
+        self._baselines: dict[str, float] = {}
+        self._unsorted: dict[str, int] = {}
+        self._excess: dict[str, int] = {}
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def stats(self) -> ConcurrencyStats:
+        return ConcurrencyStats(
+            limit=self.limit,
+            in_flight=self.in_flight,
+            queue_depth=self.queue_depth,
+            queued=self.queued,
+            increases=self.increases,
+            decreases=self.decreases,
+        )
+
+    @asynccontextmanager
+    async def slot(self, endpoint: str) -> AsyncIterator[None]:
+        """Hold one in-flight slot for an attempt, waiting for one if needed."""
+        await self._acquire()
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as e:
+            if _is_overload(e):
+                self._decrease(started, f"{type(e).__name__} from {endpoint}")
+            raise
+        else:
+            self._observe(endpoint, started, time.monotonic() - started)
+        finally:
+            self.in_flight -= 1
+            self._wake()
+
+    async def _acquire(self) -> None:
+        if not self._waiters and self.in_flight < self.limit:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted a slot just as we were cancelled: hand it on
+                self.in_flight -= 1
+                self._wake()
+            else:
+                with suppress(ValueError):
+                    self._waiters.remove(waiter)
+            raise
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def _observe(self, endpoint: str, started: float, latency: float) -> None:
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+        previous = self._smoothed.get(endpoint, latency)
+        smoothed = self._smoothed[endpoint] = previous + self.smoothing * (latency - previous)
+        baseline = self._baseline(endpoint, latencies)
+        if baseline is not None and smoothed > self.latency_tolerance * baseline:
+            # Keep latencies out of the window while over the tolerance, or a
+            # sustained rise would become the baseline it is judged against
+            self._excess[endpoint] = excess = self._excess.get(endpoint, 0) + 1
+            if excess >= self.sustained:
+                self._excess[endpoint] = 0
+                self._decrease(
+                    started,
+                    f"latency of {endpoint} at {smoothed * 1000:.0f}ms against {baseline * 1000:.0f}ms",
+                )
+            return
+        latencies.append(latency)
+        self._excess[endpoint] = 0
+        if self._limit < self.max_limit:
+            # +1 per round trip: each of `limit` responses adds 1/limit
+            self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            self.increases += 1
+            self._wake()
+
+    def _baseline(self, endpoint: str, latencies: deque[float]) -> float | None:
+        if len(latencies) < self.min_samples:
+            return None
+        # Recompute the median every tenth of a window, not on every response
+        self._unsorted[endpoint] = unsorted = self._unsorted.get(endpoint, 0) + 1
+        if endpoint not in self._baselines or unsorted >= max(1, self.window // 10):
+            self._unsorted[endpoint] = 0
+            ordered = sorted(latencies)
+            self._baselines[endpoint] = ordered[len(ordered) // 2]
+        return self._baselines[endpoint]
+
+    def _decrease(self, started: float, reason: str) -> None:
+        if started < self._last_decrease:
+            # Sent before the last decrease took effect; already accounted for
+            return
+        self._last_decrease = time.monotonic()
+        limit = max(float(self.min_limit), self._limit * self.backoff)
+        if limit < self._limit:
+            self.decreases += 1
+            logger.debug(f"Concurrency limit {self.limit} -> {int(limit)} ({reason})")
+        self._limit = limit
@@ -0,0 +1,197 @@
+"""
+Connection pool, protocol and timeout settings of the transport.
+
+A `TransportProfile` describes how the HTTP connection pool is built. The
+defaults suit a typical application; presets cover deployments whose needs
+differ, and every field can be overridden from the environment:
+
+    LUMNISAI_TRANSPORT_PROFILE        preset name (default, serverless, high-concurrency, batch)
+    LUMNISAI_MAX_CONNECTIONS          int
+    LUMNISAI_MAX_KEEPALIVE_CONNECTIONS int
+    LUMNISAI_KEEPALIVE_EXPIRY         seconds
+    LUMNISAI_HTTP2                    true / false
+    LUMNISAI_CONNECT_TIMEOUT          seconds
+    LUMNISAI_READ_TIMEOUT             seconds
+    LUMNISAI_WRITE_TIMEOUT            seconds
+    LUMNISAI_POOL_TIMEOUT             seconds
+    LUMNISAI_TCP_KEEPALIVE            true / false
+    LUMNISAI_LOCAL_ADDRESS            IP address to bind outgoing connections to
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import os
+import socket
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+
+@dataclass(frozen=True)
+class TransportProfile:
+    """
+    How the transport's connection pool is built.
+
+    Timeouts left as None use the client's `timeout`.
+
+    Example:
+        profile = dataclasses.replace(PROFILES["high-concurrency"], max_connections=200)
+        client = AsyncClient(transport_profile=profile)
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+    write_timeout: float | None = None
+    pool_timeout: float | None = None
+    # Enable SO_KEEPALIVE so idle connections behind NATs and load
+    # balancers are probed rather than silently dropped
+    tcp_keepalive: bool = False
+    local_address: str | None = None
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def timeouts(self, default: float) -> httpx.Timeout:
+        def pick(value: float | None) -> float:
+            return default if value is None else value
+
+        return httpx.Timeout(
+            default,
+            connect=pick(self.connect_timeout),
+            read=pick(self.read_timeout),
+            write=pick(self.write_timeout),
+            pool=pick(self.pool_timeout),
+        )
+
+    def socket_options(self) -> list[tuple[int, int, int]] | None:
+        if not self.tcp_keepalive:
+            return None
+        options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        # Probe after 60s idle, every 15s, and give up after 4 misses
+        for name, value in (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 15), ("TCP_KEEPCNT", 4)):
+            if hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+        return options
+
+    def http_transport(
+        self,
+        *,
+        limits: httpx.Limits | None = None,
+        http2: bool | None = None,
+    ) -> httpx.AsyncHTTPTransport | None:
+        """
+        A network transport carrying the socket-level settings, or None when
+        the profile has none and httpx's default transport will do.
+        """
+        if not self.tcp_keepalive and self.local_address is None:
+            return None
+        return httpx.AsyncHTTPTransport(
+            http2=self.http2 if http2 is None else http2,
+            limits=limits or self.limits(),
+            local_address=self.local_address,
+            socket_options=self.socket_options(),
+        )
+
+
+PROFILES: dict[str, TransportProfile] = {
+    "default": TransportProfile(),
+    # Short-lived, mostly sequential invocations whose process may be frozen
+    # between calls: a small pool, and connections dropped before the
+    # platform's idle timeout can leave them half-closed
+    "serverless": TransportProfile(
+        max_connections=10,
+        max_keepalive_connections=5,
+        keepalive_expiry=5.0,
+        http2=False,
+        connect_timeout=5.0,
+    ),
+    # Long-running workers with many concurrent requests
+    "high-concurrency": TransportProfile(
+        max_connections=500,
+        max_keepalive_connections=100,
+        keepalive_expiry=60.0,
+        connect_timeout=10.0,
+        pool_timeout=60.0,
+        tcp_keepalive=True,
+    ),
+    # Batch jobs: large payloads and slow server-side processing
+    "batch": TransportProfile(
+        max_connections=50,
+        max_keepalive_connections=50,
+        keepalive_expiry=120.0,
+        http2=False,
+        connect_timeout=10.0,
+        read_timeout=300.0,
+        write_timeout=300.0,
+        tcp_keepalive=True,
+    ),
+}
+
+_ENV_FIELDS: dict[str, str] = {
+    "LUMNISAI_MAX_CONNECTIONS": "max_connections",
+    "LUMNISAI_MAX_KEEPALIVE_CONNECTIONS": "max_keepalive_connections",
+    "LUMNISAI_KEEPALIVE_EXPIRY": "keepalive_expiry",
+    "LUMNISAI_HTTP2": "http2",
+    "LUMNISAI_CONNECT_TIMEOUT": "connect_timeout",
+    "LUMNISAI_READ_TIMEOUT": "read_timeout",
+    "LUMNISAI_WRITE_TIMEOUT": "write_timeout",
+    "LUMNISAI_POOL_TIMEOUT": "pool_timeout",
+    "LUMNISAI_TCP_KEEPALIVE": "tcp_keepalive",
+    "LUMNISAI_LOCAL_ADDRESS": "local_address",
+}
+
+
+def _parse(field: dataclasses.Field[Any], name: str, value: str) -> Any:
+    kind = str(field.type)
+    try:
+        if kind.startswith("bool"):
+            if value.lower() in ("1", "true", "yes", "on"):
+                return True
+            if value.lower() in ("0", "false", "no", "off"):
+                return False
+            raise ValueError(value)
+        if kind.startswith("int"):
+            return int(value)
+        if kind.startswith("float"):
+            return float(value)
+    except ValueError as e:
+        raise ValueError(f"Invalid value for {name}: {value!r}") from e
+    return value
+
+
+def resolve_profile(
+    profile: TransportProfile | str | None = None,
+    environ: Mapping[str, str] | None = None,
+) -> TransportProfile:
+    """
+    The profile to use: `profile` if it is a TransportProfile, otherwise the
+    named preset (or LUMNISAI_TRANSPORT_PROFILE, or "default") with the
+    LUMNISAI_* overrides from the environment applied.
+    """
+    if isinstance(profile, TransportProfile):
+        return profile
+    environ = os.environ if environ is None else environ
+    name = profile or environ.get("LUMNISAI_TRANSPORT_PROFILE") or "default"
+    try:
+        resolved = PROFILES[name]
+    except KeyError:
+        raise ValueError(f"Unknown transport profile {name!r}; expected one of {sorted(PROFILES)}") from None
+
+    fields = {field.name: field for field in dataclasses.fields(TransportProfile)}
+    overrides = {
+        attribute: _parse(fields[attribute], variable, environ[variable])
+        for variable, attribute in _ENV_FIELDS.items()
+        if environ.get(variable)
+    }
+    return dataclasses.replace(resolved, **overrides) if overrides else resolved
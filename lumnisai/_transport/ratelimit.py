@@ -0,0 +1,218 @@
+"""
+Request rate limiting shared by every process on a host.
+
+Each gunicorn or Celery worker has its own client, so no single one sees the
+tenant's total request rate, and a 429 answered to one worker does not stop
+the others. `SharedRateLimiter` keeps a token bucket and a cooldown deadline
+in a small memory-mapped file guarded by an advisory file lock; every client
+pointed at the same file draws from the same bucket, and a Retry-After
+received by any of them pauses all of them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import mmap
+import os
+import re
+import struct
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, TypeVar
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+    import msvcrt
+
+logger = logging.getLogger("lumnisai.transport")
+
+# tokens, last refill, cooldown deadline; times are time.time(), since
+# time.monotonic() is not comparable across reboots and, on some platforms,
+# across processes
+_STATE = struct.Struct("<ddd")
+
+_T = TypeVar("_T")
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class SharedRateLimiter:
+    """
+    Token bucket shared through a file by all processes that open it.
+
+    Args:
+        rate: Requests per second allowed across all processes
+        burst: Most requests that may be sent back to back; defaults to `rate`
+        name: Name of the bucket, e.g. the tenant ID; processes using the
+            same name (and directory) share it
+        directory: Where the bucket file lives; defaults to the system temp
+            directory
+        max_cooldown: Longest pause a Retry-After may impose, in seconds
+
+    Every process sharing a bucket should use the same rate and burst. The
+    limiter waits before each attempt until a token is available, and any
+    429 or 503 response with a Retry-After header pauses every process
+    until the deadline it gives. Times are read from the wall clock; a
+    clock that steps backwards neither adds tokens nor stretches a pause
+    beyond `max_cooldown`. Waiting for the file lock happens on a worker
+    thread, never on the event loop.
+
+    Example:
+        limiter = SharedRateLimiter(rate=20, name=tenant_id)
+        client = AsyncClient(rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: float | None = None,
+        name: str = "default",
+        directory: str | Path | None = None,
+        max_cooldown: float = 300.0,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self.max_cooldown = max_cooldown
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+        self.path = Path(directory or tempfile.gettempdir()) / f"lumnisai-ratelimit-{safe_name}.bin"
+        # Attempts that had to wait for a token or a cooldown, and cooldowns
+        # started by this process
+        self.throttled = 0
+        self.cooldowns = 0
+        # The file lock only excludes other processes
+        self._thread_lock = threading.Lock()
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        with self._locked_file():
+            if os.fstat(self._fd).st_size < _STATE.size:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                os.write(self._fd, _STATE.pack(self.burst, time.time(), 0.0))
+        self._map = mmap.mmap(self._fd, _STATE.size)
+
+    @contextmanager
+    def _locked_file(self, *, blocking: bool = True) -> Iterator[None]:
+        """Hold the file lock; raises BlockingIOError if `blocking` is off and it is taken."""
+        if not self._thread_lock.acquire(blocking=blocking):
+            raise BlockingIOError("rate limiter lock is held")
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                try:
+                    msvcrt.locking(self._fd, msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+                except OSError as e:
+                    if blocking:
+                        raise
+                    raise BlockingIOError("rate limiter lock is held") from e
+                try:
+                    yield
+                finally:
+                    os.lseek(self._fd, 0, os.SEEK_SET)
+                    msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            self._thread_lock.release()
+
+    async def _off_loop(self, func: Callable[..., _T], *args: Any) -> _T:
+        # Try the lock without waiting; when another process or thread holds
+        # it, wait for it on a worker thread so the event loop keeps running
+        try:
+            return func(*args, blocking=False)
+        except BlockingIOError:
+            return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args))
+
+    def _remaining(self, cooldown_until: float, now: float) -> float:
+        remaining = cooldown_until - now
+        # A deadline further away than any pause we set was written before
+        # the clock stepped back; don't let it stall every process
+        return remaining if 0.0 < remaining <= self.max_cooldown else 0.0
+
+    def _take(self, *, blocking: bool = True) -> tuple[float, bool]:
+        """
+        Take a token, or reserve the next one. Returns the seconds until it
+        may be used and whether it was reserved; during a cooldown nothing
+        is reserved and the caller asks again when it ends.
+        """
+        with self._locked_file(blocking=blocking):
+            tokens, refilled_at, cooldown_until = _STATE.unpack_from(self._map)
+            now = time.time()
+            remaining = self._remaining(cooldown_until, now)
+            if remaining:
+                return remaining, False
+            # Tokens go negative while reserved by waiting requests. Time
+            # that went backwards adds none, and the refill time moves back
+            # with it
+            tokens = min(self.burst, tokens + max(0.0, now - refilled_at) * self.rate) - 1.0
+            _STATE.pack_into(self._map, 0, tokens, now, cooldown_until)
+            return max(0.0, -tokens / self.rate), True
+
+    async def acquire(self) -> None:
+        """Wait until the shared bucket allows one more request."""
+        wait, reserved = await self._off_loop(self._take)
+        if wait:
+            self.throttled += 1
+        while wait:
+            await asyncio.sleep(wait)
+            if reserved:
+                return
+            wait, reserved = await self._off_loop(self._take)
+
+    def _cooldown(self, seconds: float, *, blocking: bool = True) -> None:
+        seconds = min(seconds, self.max_cooldown)
+        with self._locked_file(blocking=blocking):
+            tokens, refilled_at, cooldown_until = _STATE.unpack_from(self._map)
+            now = time.time()
+            deadline = now + seconds
+            if deadline <= now + self._remaining(cooldown_until, now):
+                return
+            _STATE.pack_into(self._map, 0, tokens, refilled_at, deadline)
+        self.cooldowns += 1
+        logger.info(f"Rate limited; pausing requests sharing {self.path.name} for {seconds:g}s")
+
+    def cooldown(self, seconds: float) -> None:
+        """Pause every process sharing the bucket for `seconds`, at most `max_cooldown`."""
+        self._cooldown(seconds)
+
+    async def pause(self, seconds: float) -> None:
+        """`cooldown()` for async callers: never blocks the event loop on the file lock."""
+        await self._off_loop(self._cooldown, seconds)
+
+    @property
+    def cooldown_remaining(self) -> float:
+        """Seconds left in the current cooldown, across all processes."""
+        with self._locked_file():
+            _, _, cooldown_until = _STATE.unpack_from(self._map)
+        return self._remaining(cooldown_until, time.time())
+
+    def close(self) -> None:
+        if not self._map.closed:
+            self._map.close()
+            os.close(self._fd)
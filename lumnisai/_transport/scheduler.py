@@ -0,0 +1,253 @@
+"""
+Priority classes and weighted fair admission to the connection pool.
+
+Interactive calls and batch jobs often share one client. Without a
+scheduler, a batch job that fills the pool makes every interactive request
+wait behind it. Requests are tagged with a `Priority` (interactive by
+default, or whatever `request_priority()` set for the current task) and
+admitted through one queue per class: free slots go to the waiting classes
+in proportion to their weights, and a number of slots is reserved for
+interactive requests so they never queue behind a full pool of batch work.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from .limiter import ConcurrencyLimiter
+
+
+class Priority(str, Enum):
+    """
+    Priority class of a request.
+
+    `invoke()` sends its status polls as POLLING. Long polls (requests with a
+    `wait` parameter) are exempt from scheduling: they spend their time
+    parked on the server rather than using its capacity, so they take no
+    slot and only the short polls of the fallback path queue as POLLING.
+    """
+
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+    POLLING = "polling"
+
+
+DEFAULT_WEIGHTS: dict[Priority, float] = {
+    Priority.INTERACTIVE: 8.0,
+    Priority.BATCH: 2.0,
+    Priority.POLLING: 1.0,
+}
+
+_priority: ContextVar[Priority] = ContextVar("lumnisai_priority", default=Priority.INTERACTIVE)
+
+
+@contextmanager
+def request_priority(priority: Priority | str) -> Iterator[None]:
+    """
+    Send the requests made inside the block with `priority`.
+
+    Example:
+        with request_priority("batch"):
+            await asyncio.gather(*(client.files.upload(...) for ...))
+    """
+    token = _priority.set(Priority(priority))
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+class PriorityStats(BaseModel):
+    """Admission counters of one priority class; times are in milliseconds."""
+
+    priority: Priority
+    in_flight: int
+    queue_depth: int
+    admitted: int
+    queued: int
+    queue_time_ms: float
+    max_queue_time_ms: float
+
+
+class _Class:
+
+    __slots__ = (
+        "admitted",
+        "in_flight",
+        "max_wait",
+        "pass_",
+        "priority",
+        "queued",
+        "reserved",
+        "wait",
+        "waiters",
+        "weight",
+    )
+
+    def __init__(self, priority: Priority, weight: float, reserved: int):
+        self.priority = priority
+        self.weight = weight
+        self.reserved = reserved
+        self.in_flight = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        # Stride scheduling: the class with the lowest pass is served next
+        self.pass_ = 0.0
+        self.admitted = 0
+        self.queued = 0
+        self.wait = 0.0
+        self.max_wait = 0.0
+
+
+class PriorityScheduler:
+    """
+    Weighted fair admission of requests by priority class.
+
+    Args:
+        capacity: Requests allowed in flight across all classes; matches the
+            connection pool by default
+        weights: Share of freed slots each class gets while several are
+            waiting. Defaults to `DEFAULT_WEIGHTS` (8:2:1).
+        reserved: Slots only a class may use, by class. Defaults to 10 for
+            interactive requests.
+
+    When the client also has a `ConcurrencyLimiter`, the scheduler admits
+    up to the limiter's current limit instead of `capacity`, so queueing
+    happens here, in priority order, rather than in the limiter's FIFO.
+
+    Example:
+        scheduler = PriorityScheduler(capacity=50, reserved={"interactive": 5})
+        client = AsyncClient(scheduler=scheduler)
+        with request_priority("batch"):
+            await run_batch(client)
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: int = 100,
+        weights: Mapping[Priority | str, float] | None = None,
+        reserved: Mapping[Priority | str, int] | None = None,
+    ):
+        if weights is None:
+            weights = DEFAULT_WEIGHTS
+        if reserved is None:
+            reserved = {Priority.INTERACTIVE: 10}
+        weights = {Priority(key): value for key, value in weights.items()}
+        reserved = {Priority(key): value for key, value in reserved.items()}
+        if sum(reserved.values()) >= capacity:
+            raise ValueError("reserved slots must leave some capacity unreserved")
+        self.capacity = capacity
+        self.limiter: ConcurrencyLimiter | None = None
+        self._classes = {
+            priority: _Class(priority, weights.get(priority, DEFAULT_WEIGHTS[priority]), reserved.get(priority, 0))
+            for priority in Priority
+        }
+        self.in_flight = 0
+        # Pass of the class served last; classes start queueing from here
+        self._clock = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(cls.waiters) for cls in self._classes.values())
+
+    def stats(self) -> list[PriorityStats]:
+        return [
+            PriorityStats(
+                priority=cls.priority,
+                in_flight=cls.in_flight,
+                queue_depth=len(cls.waiters),
+                admitted=cls.admitted,
+                queued=cls.queued,
+                queue_time_ms=cls.wait * 1000,
+                max_queue_time_ms=cls.max_wait * 1000,
+            )
+            for cls in self._classes.values()
+        ]
+
+    def _capacity(self) -> int:
+        if self.limiter is None:
+            return self.capacity
+        return min(self.capacity, self.limiter.limit)
+
+    def _admissible(self, cls: _Class) -> bool:
+        capacity = self._capacity()
+        # Slots reserved for other classes that they are not using. When
+        # the limiter has shrunk the capacity below the reservations, keep
+        # one slot open so unreserved classes still run and the limit can
+        # grow back
+        held_back = sum(
+            max(0, other.reserved - other.in_flight) for other in self._classes.values() if other is not cls
+        )
+        return self.in_flight < capacity - min(held_back, capacity - 1)
+
+    def _admit(self, cls: _Class) -> None:
+        self.in_flight += 1
+        cls.in_flight += 1
+        cls.admitted += 1
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority | None = None) -> AsyncIterator[None]:
+        """Hold one admission slot for an attempt, queueing by priority if needed."""
+        cls = self._classes[priority or _priority.get()]
+        if not cls.waiters and self._admissible(cls):
+            self._admit(cls)
+        else:
+            await self._queue(cls)
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            cls.in_flight -= 1
+            self._wake()
+
+    async def _queue(self, cls: _Class) -> None:
+        if not cls.waiters:
+            # A class that starts queueing gets no credit for the time it
+            # was not competing
+            cls.pass_ = max(cls.pass_, self._clock)
+        waiter = asyncio.get_running_loop().create_future()
+        cls.waiters.append(waiter)
+        cls.queued += 1
+        started = time.monotonic()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Admitted just as we were cancelled: hand the slot on
+                self.in_flight -= 1
+                cls.in_flight -= 1
+                self._wake()
+            else:
+                try:
+                    cls.waiters.remove(waiter)
+                except ValueError:
+                    pass
+            raise
+        waited = time.monotonic() - started
+        cls.wait += waited
+        cls.max_wait = max(cls.max_wait, waited)
+
+    def _wake(self) -> None:
+        while True:
+            candidates = [cls for cls in self._classes.values() if cls.waiters and self._admissible(cls)]
+            if not candidates:
+                return
+            cls = min(candidates, key=lambda candidate: candidate.pass_)
+            waiter = cls.waiters.popleft()
+            if not waiter.done():
+                self._clock = cls.pass_
+                cls.pass_ += 1.0 / cls.weight
+                self._admit(cls)
+                waiter.set_result(None)
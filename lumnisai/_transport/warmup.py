@@ -0,0 +1,111 @@
+"""
+Connection prewarming.
+
+A freshly started client has an empty pool, so the first burst of traffic
+pays a TCP and TLS handshake per connection. Prewarming sends concurrent
+GET /v1/health requests through a lane's pool, which opens up to that many
+connections before real traffic arrives, and checks that the protocol the
+lane asked for was negotiated. HTTP/2 multiplexes concurrent requests over
+one connection, so an HTTP/2 lane warms a single connection per host.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from typing import Any
+
+import httpx
+from pydantic import BaseModel
+
+
+class LaneWarmup(BaseModel):
+    """Outcome of prewarming one lane's connection pool."""
+
+    lane: str
+    host: str
+    requested: int
+    succeeded: int
+    connections_opened: int
+    http_version: str | None = None
+    # Whether HTTP/2 was negotiated; None when the lane does not use it
+    http2: bool | None = None
+    elapsed_ms: float
+    errors: list[str] = []
+
+
+class WarmupReport(BaseModel):
+    """Result of `AsyncClient.prewarm()`."""
+
+    elapsed_ms: float
+    lanes: list[LaneWarmup]
+
+    @property
+    def ready(self) -> bool:
+        """Every lane answered at least one request with the protocol it asked for."""
+        return all(lane.succeeded > 0 and lane.http2 is not False for lane in self.lanes)
+
+    def __str__(self):
+        lines = [f"Prewarmed {len(self.lanes)} lane(s) in {self.elapsed_ms:.0f}ms"]
+        for lane in self.lanes:
+            line = (
+                f"  {lane.lane} ({lane.host}): {lane.connections_opened} connections opened, "
+                f"{lane.succeeded}/{lane.requested} requests ok, {lane.http_version or 'no response'}"
+            )
+            if lane.http2 is False:
+                line += ", HTTP/2 not negotiated"
+            if lane.errors:
+                line += f", errors: {'; '.join(lane.errors)}"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+async def prewarm_lane(
+    lane: str,
+    client: httpx.AsyncClient,
+    request_params: dict[str, Any],
+    connections: int,
+    *,
+    http2: bool,
+) -> LaneWarmup:
+    """Open up to `connections` connections in `client`'s pool concurrently."""
+    opened = 0
+
+    async def trace(event_name: str, info: dict[str, Any]) -> None:
+        nonlocal opened
+        if event_name == "connection.connect_tcp.complete":
+            opened += 1
+
+    started = time.perf_counter()
+    results = await asyncio.gather(
+        *(client.request(**request_params, extensions={"trace": trace}) for _ in range(connections)),
+        return_exceptions=True,
+    )
+    elapsed = time.perf_counter() - started
+
+    errors: Counter[str] = Counter()
+    versions: Counter[str] = Counter()
+    succeeded = 0
+    for result in results:
+        if isinstance(result, BaseException):
+            errors[f"{type(result).__name__}: {result}"] += 1
+            continue
+        versions[result.http_version] += 1
+        if result.is_success:
+            succeeded += 1
+        else:
+            errors[f"HTTP {result.status_code}"] += 1
+
+    http_version = versions.most_common(1)[0][0] if versions else None
+    return LaneWarmup(
+        lane=lane,
+        host=httpx.URL(request_params["url"]).host,
+        requested=connections,
+        succeeded=succeeded,
+        connections_opened=opened,
+        http_version=http_version,
+        http2=(http_version == "HTTP/2") if http2 and http_version is not None else None,
+        elapsed_ms=elapsed * 1000,
+        errors=[f"{error} (x{count})" if count > 1 else error for error, count in errors.items()],
+    )
@@ -0,0 +1,273 @@
+"""
+Columnar aggregation of response latency statistics.
+
+Responses are reduced to a handful of primitive columns stored in compact
+arrays, so memory grows with the number of rows at a few dozen bytes each
+instead of one Pydantic model per response. Aggregation is vectorized with
+numpy when it is installed and falls back to pure Python otherwise.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Sequence
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Literal
+
+from pydantic import TypeAdapter
+
+from .models.response import (
+    DurationStats,
+    ResponseAnalytics,
+    ResponseGroupStats,
+    ThroughputBucket,
+)
+
+
+@lru_cache(maxsize=None)
+def _has_numpy() -> bool:
+    # numpy is imported on first use; it would dominate `import lumnisai`
+    try:
+        import numpy  # noqa: F401
+    except ImportError:  # pragma: no cover - exercised when numpy is absent
+        return False
+    return True
+
+
+GroupBy = Literal["user", "status", "model"]
+
+# Statuses the SDK does not know are counted as "unknown"
+STATUSES = ("queued", "in_progress", "succeeded", "failed", "cancelled", "unknown")
+_STATUS_INDEX = {status: index for index, status in enumerate(STATUSES)}
+_SUCCEEDED = _STATUS_INDEX["succeeded"]
+_FAILED = _STATUS_INDEX["failed"]
+_CANCELLED = _STATUS_INDEX["cancelled"]
+_UNKNOWN = _STATUS_INDEX["unknown"]
+
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+_PERCENTILES = (50, 95, 99)
+
+
+def _timestamp(value: Any) -> float:
+    """Epoch seconds of an ISO timestamp; naive timestamps are taken as UTC."""
+    if not value:
+        return math.nan
+    parsed = _DATETIME_ADAPTER.validate_python(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _model_key(options: dict[str, Any] | None) -> str:
+    # The smart model does the bulk of an agent run, so it identifies the run
+    if not options:
+        return "default"
+    overrides = options.get("model_overrides") or {}
+    return options.get("model") or overrides.get("smart_model") or "default"
+
+
+class ResponseColumns:
+    """Primitive columns extracted from raw response dicts."""
+
+    def __init__(self, group_by: GroupBy | None = None):
+        self.group_by = group_by
+        self.created_at = array("d")
+        self.completed_at = array("d")
+        self.first_progress_at = array("d")
+        self.status = array("b")
+        self.group = array("q")
+        self.group_keys: list[str] = []
+        self._group_index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.created_at)
+
+    def append(self, item: dict[str, Any]) -> None:
+        progress = item.get("progress") or []
+        self.created_at.append(_timestamp(item.get("created_at")))
+        self.completed_at.append(_timestamp(item.get("completed_at")))
+        self.first_progress_at.append(_timestamp(progress[0].get("ts")) if progress else math.nan)
+        self.status.append(_STATUS_INDEX.get(item.get("status"), _UNKNOWN))
+
+        if self.group_by == "user":
+            key = str(item.get("user_id") or "none")
+        elif self.group_by == "status":
+            key = str(item.get("status"))
+        elif self.group_by == "model":
+            key = _model_key(item.get("options"))
+        else:
+            key = ""
+        index = self._group_index.get(key)
+        if index is None:
+            index = self._group_index[key] = len(self.group_keys)
+            self.group_keys.append(key)
+        self.group.append(index)
+
+    def summarize(
+        self,
+        start: date,
+        end: date,
+        *,
+        bucket: timedelta = timedelta(hours=1),
+    ) -> ResponseAnalytics:
+        origin = datetime.combine(start, time.min, tzinfo=timezone.utc).timestamp()
+        bucket_seconds = bucket.total_seconds()
+        bucket_count = max(1, math.ceil(((end - start).days + 1) * 86400 / bucket_seconds))
+        aggregate = _aggregate_numpy if _has_numpy() else _aggregate_python
+        overall, groups, buckets = aggregate(self, origin, bucket_seconds, bucket_count)
+
+        return ResponseAnalytics(
+            start=start,
+            end=end,
+            group_by=self.group_by,
+            total=len(self),
+            overall=overall,
+            groups=groups if self.group_by else [],
+            throughput=[
+                ThroughputBucket(
+                    start=datetime.fromtimestamp(origin + i * bucket_seconds, tz=timezone.utc),
+                    created=created,
+                    completed=completed,
+                    failed=failed,
+                )
+                for i, (created, completed, failed) in enumerate(buckets)
+            ],
+        )
+
+
+def _group_stats(
+    key: str,
+    status_counts: Sequence[int],
+    queue_times: Any,
+    run_times: Any,
+    percentile: Any,
+) -> ResponseGroupStats:
+    terminal = status_counts[_SUCCEEDED] + status_counts[_FAILED] + status_counts[_CANCELLED]
+
+    def duration_stats(values: Any) -> DurationStats:
+        if len(values) == 0:
+            return DurationStats(count=0)
+        p50, p95, p99 = percentile(values)
+        return DurationStats(
+            count=len(values),
+            mean=float(sum(values) / len(values)),
+            p50=p50,
+            p95=p95,
+            p99=p99,
+            max=float(max(values)),
+        )
+
+    return ResponseGroupStats(
+        key=key,
+        total=int(sum(status_counts)),
+        status_counts={
+            status: int(count) for status, count in zip(STATUSES, status_counts) if count
+        },
+        failure_rate=status_counts[_FAILED] / terminal if terminal else None,
+        queue_time=duration_stats(queue_times),
+        run_time=duration_stats(run_times),
+    )
+
+
+def _aggregate_numpy(columns: ResponseColumns, origin: float, bucket_seconds: float, bucket_count: int):
+    import numpy as np
+
+    created = np.frombuffer(columns.created_at, dtype=np.float64)
+    completed = np.frombuffer(columns.completed_at, dtype=np.float64)
+    first_progress = np.frombuffer(columns.first_progress_at, dtype=np.float64)
+    status = np.frombuffer(columns.status, dtype=np.int8)
+    group = np.frombuffer(columns.group, dtype=np.int64)
+
+    # Queue time ends and run time starts at the first progress entry, so
+    # the two add up to the response's turnaround
+    queue_times = first_progress - created
+    run_times = completed - first_progress
+    queue_valid = ~np.isnan(queue_times)
+    run_valid = ~np.isnan(run_times)
+
+    def percentile(values: Any) -> list[float]:
+        return [float(v) for v in np.percentile(values, _PERCENTILES)]
+
+    def stats_for(key: str, mask: Any) -> ResponseGroupStats:
+        return _group_stats(
+            key,
+            np.bincount(status[mask], minlength=len(STATUSES)),
+            queue_times[mask & queue_valid],
+            run_times[mask & run_valid],
+            percentile,
+        )
+
+    overall = stats_for("all", np.ones(len(created), dtype=bool))
+    groups = [stats_for(key, group == index) for index, key in enumerate(columns.group_keys)]
+
+    def bucket_counts(timestamps: Any) -> Any:
+        indexes = np.floor((timestamps[~np.isnan(timestamps)] - origin) / bucket_seconds).astype(np.int64)
+        indexes = indexes[(indexes >= 0) & (indexes < bucket_count)]
+        return np.bincount(indexes, minlength=bucket_count)
+
+    buckets = zip(
+        bucket_counts(created).tolist(),
+        bucket_counts(completed).tolist(),
+        bucket_counts(np.where(status == _FAILED, completed, np.nan)).tolist(),
+    )
+    return overall, groups, list(buckets)
+
+
+def _aggregate_python(columns: ResponseColumns, origin: float, bucket_seconds: float, bucket_count: int):
+    group_count = len(columns.group_keys)
+    status_counts = [[0] * len(STATUSES) for _ in range(group_count)]
+    queue_times: list[list[float]] = [[] for _ in range(group_count)]
+    run_times: list[list[float]] = [[] for _ in range(group_count)]
+    buckets = [[0, 0, 0] for _ in range(bucket_count)]
+
+    def bucket_index(timestamp: float) -> int | None:
+        if math.isnan(timestamp):
+            return None
+        index = math.floor((timestamp - origin) / bucket_seconds)
+        return index if 0 <= index < bucket_count else None
+
+    for i in range(len(columns)):
+        g = columns.group[i]
+        status = columns.status[i]
+        created = columns.created_at[i]
+        completed = columns.completed_at[i]
+        first_progress = columns.first_progress_at[i]
+
+        status_counts[g][status] += 1
+        if not math.isnan(first_progress):
+            queue_times[g].append(first_progress - created)
+        if not math.isnan(completed) and not math.isnan(first_progress):
+            run_times[g].append(completed - first_progress)
+
+        if (index := bucket_index(created)) is not None:
+            buckets[index][0] += 1
+        if (index := bucket_index(completed)) is not None:
+            buckets[index][1] += 1
+            if status == _FAILED:
+                buckets[index][2] += 1
+
+    def percentile(values: list[float]) -> list[float]:
+        # Linear interpolation between closest ranks, as numpy.percentile does
+        ordered = sorted(values)
+        result = []
+        for q in _PERCENTILES:
+            position = (len(ordered) - 1) * q / 100
+            lower = math.floor(position)
+            upper = min(lower + 1, len(ordered) - 1)
+            result.append(ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower))
+        return result
+
+    groups = [
+        _group_stats(key, status_counts[g], queue_times[g], run_times[g], percentile)
+        for g, key in enumerate(columns.group_keys)
+    ]
+    overall = _group_stats(
+        "all",
+        [sum(counts[s] for counts in status_counts) for s in range(len(STATUSES))],
+        [value for values in queue_times for value in values],
+        [value for values in run_times for value in values],
+        percentile,
+    )
+    return overall, groups, [tuple(bucket) for bucket in buckets]
@@ -1,18 +1,21 @@
 
 import asyncio
+import hashlib
 import inspect
 import logging
-from collections.abc import AsyncGenerator, Callable
+from collections.abc import AsyncGenerator, Callable, Mapping
 from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from datetime import date
 from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     BinaryIO,
     Literal,
     overload,
 )
 from uuid import UUID
 
+import httpx
 from pydantic import BaseModel as PydanticBaseModel
 
 from ._transport import HTTPTransport
@@ -27,9 +30,12 @@ from .models import (
     ModelPreferenceCreate,
     ModelPreferencesResponse,
     ProgressEntry,
+    ResponseAnalytics,
     ResponseObject,
     ResponseListResponse,
+    ResponseTimeline,
     MCPTestConnectionResponse,
+    ThreadSyncResult,
 )
 from .models.skills import (
     SkillGuideline,
@@ -45,24 +51,44 @@ from .models.files import (
     FileMetadata,
     FileScope,
     FileSearchResponse,
+    FileStatisticsResponse,
     FileUploadResponse,
     ProcessingStatus,
     ProcessingStatusResponse,
 )
-from .resources import (
-    ExternalApiKeysResource,
-    FilesResource,
-    IntegrationsResource,
-    MCPServersResource,
-    ModelPreferencesResource,
-    ResponsesResource,
-    SkillsResource,
-    TenantResource,
-    ThreadsResource,
-    UsersResource,
+from ._transport import (
+    BulkLane,
+    CircuitBreaker,
+    ConcurrencyLimiter,
+    HedgePolicy,
+    HTTPCache,
+    Priority,
+    PriorityScheduler,
+    SharedRateLimiter,
+    TransportHooks,
+    TransportProfile,
+    TransportStats,
+    TransportStatsSnapshot,
+    WarmupReport,
+    request_priority,
 )
+from .store import ResponseStore
+from .timeline import TimelineRecorder
+from .tracing import NOOP_TRACER, Tracer
 from .types import ApiKeyMode, ApiProvider, ModelType, Scope
 
+if TYPE_CHECKING:
+    from .resources.external_api_keys import ExternalApiKeysResource
+    from .resources.files import FilesResource
+    from .resources.integrations import IntegrationsResource
+    from .resources.mcp_servers import MCPServersResource
+    from .resources.model_preferences import ModelPreferencesResource
+    from .resources.responses import ResponsesResource
+    from .resources.skills import SkillsResource
+    from .resources.tenant import TenantResource
+    from .resources.threads import ThreadsResource
+    from .resources.users import UsersResource
+
 logger = logging.getLogger("lumnisai")
 
 
@@ -77,7 +103,25 @@ class AsyncClient:
         timeout: float = 30.0,
         scope: Scope = Scope.TENANT,
         max_retries: int = 3,
+        response_store: "ResponseStore | str | Path | None" = None,
+        hooks: TransportHooks | None = None,
+        collect_stats: bool = False,
+        tracing: bool = False,
+        http_transport: httpx.AsyncBaseTransport | None = None,
+        http_cache: HTTPCache | bool | None = None,
+        coalesce_requests: bool = True,
+        hedging: HedgePolicy | bool | None = None,
+        circuit_breaker: CircuitBreaker | bool | None = None,
+        concurrency_limiter: ConcurrencyLimiter | bool | None = None,
+        rate_limiter: SharedRateLimiter | None = None,
+        scheduler: PriorityScheduler | bool | None = None,
+        bulk_lane: BulkLane | bool | None = None,
+        transport_profile: TransportProfile | str | None = None,
+        prewarm: int | Mapping[str, int] = 0,
         _scoped_user_id: str | None = None,
+        _stats: TransportStats | None = None,
+        _tracer: Tracer | None = None,
+        _timeline_callbacks: list[Callable[[ResponseTimeline], None]] | None = None,
     ):
         self._config = Config(
             api_key=api_key,
@@ -85,9 +129,46 @@ class AsyncClient:
             tenant_id=tenant_id,
             timeout=timeout,
             max_retries=max_retries,
+            transport_profile=transport_profile,
         )
         self._scoped_user_id = _scoped_user_id
         self._default_scope = scope
+        if response_store is not None and not isinstance(response_store, ResponseStore):
+            response_store = ResponseStore(response_store)
+        self._response_store = response_store
+        self._hooks = hooks if hooks is not None else TransportHooks()
+        self._stats = _stats
+        if collect_stats and self._stats is None:
+            self._stats = TransportStats()
+            self._stats.attach(self._hooks)
+        self._tracer = _tracer or NOOP_TRACER
+        if tracing and _tracer is None:
+            self._tracer = Tracer()
+            self._tracer.attach(self._hooks)
+        self._http_transport = http_transport
+        if isinstance(http_cache, bool):
+            http_cache = HTTPCache() if http_cache else None
+        self._http_cache = http_cache
+        self._coalesce_requests = coalesce_requests
+        if isinstance(hedging, bool):
+            hedging = HedgePolicy() if hedging else None
+        self._hedging = hedging
+        if isinstance(circuit_breaker, bool):
+            circuit_breaker = CircuitBreaker() if circuit_breaker else None
+        self._circuit_breaker = circuit_breaker
+        if isinstance(concurrency_limiter, bool):
+            concurrency_limiter = ConcurrencyLimiter() if concurrency_limiter else None
+        self._concurrency_limiter = concurrency_limiter
+        self._rate_limiter = rate_limiter
+        if isinstance(scheduler, bool):
+            scheduler = PriorityScheduler() if scheduler else None
+        self._scheduler = scheduler
+        if isinstance(bulk_lane, bool):
+            bulk_lane = BulkLane() if bulk_lane else None
+        self._bulk_lane = bulk_lane
+        self._prewarm = prewarm
+        self.warmup_report: WarmupReport | None = None
+        self._timeline_callbacks = _timeline_callbacks if _timeline_callbacks is not None else []
         self._transport: HTTPTransport | None = None
         self._initialized = False
 
@@ -101,6 +182,7 @@ class AsyncClient:
         if not self._initialized:
             await self._ensure_transport()
             self._initialized = True
+        await self._prewarm_once()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -119,99 +201,212 @@ class AsyncClient:
                 api_key=self._config.api_key,
                 timeout=self._config.timeout,
                 max_retries=self._config.max_retries,
+                hooks=self._hooks,
+                tracer=self._tracer,
+                http_transport=self._http_transport,
+                cache=self._http_cache,
+                coalesce_requests=self._coalesce_requests,
+                hedging=self._hedging,
+                circuit_breaker=self._circuit_breaker,
+                limiter=self._concurrency_limiter,
+                rate_limiter=self._rate_limiter,
+                scheduler=self._scheduler,
+                bulk_lane=self._bulk_lane,
+                profile=self._config.transport_profile,
             )
             self._initialized = True
 
     async def init(self) -> None:
         await self._ensure_transport()
         self._initialized = True
+        await self._prewarm_once()
+
+    async def _prewarm_once(self) -> None:
+        if self._prewarm and self.warmup_report is None:
+            await self.prewarm(self._prewarm)
+
+    async def prewarm(self, connections: int | Mapping[str, int] = 10) -> WarmupReport:
+        """
+        Open connections before traffic arrives, so the first burst of
+        requests does not pay a TLS handshake each.
+
+        Args:
+            connections: Connections to open in the API lane, or a mapping
+                of lane ("api", "bulk") to connections
+
+        Returns:
+            WarmupReport with the time taken, connections opened and the
+            negotiated HTTP version per lane; `report.ready` is False if a
+            lane could not be reached or did not negotiate HTTP/2 when
+            configured for it.
+
+        Example:
+            async with AsyncClient(prewarm=20) as client:
+                assert client.warmup_report.ready
+        """
+        await self._ensure_transport()
+        self.warmup_report = await self._transport.prewarm(connections)
+        return self.warmup_report
+
+    @property
+    def hooks(self) -> TransportHooks:
+        """Transport lifecycle hooks; see TransportHooks for the events."""
+        return self._hooks
+
+    def on_timeline(self, callback: Callable[[ResponseTimeline], None]) -> Callable[[ResponseTimeline], None]:
+        """
+        Register a callback receiving the lifecycle timeline of every invoke(),
+        streaming or not. Non-streaming invoke() also attaches it to the
+        returned response as `response.timeline`.
+        """
+        self._timeline_callbacks.append(callback)
+        return callback
+
+    def _emit_timeline(self, timeline: ResponseTimeline) -> None:
+        logger.debug(str(timeline), extra={"response_id": str(timeline.response_id)})
+        for callback in self._timeline_callbacks:
+            try:
+                callback(timeline)
+            except Exception as e:
+                logger.warning(f"Timeline callback failed: {type(e).__name__}: {e}")
+
+    def stats(self) -> TransportStatsSnapshot:
+        """
+        Per-endpoint latency histograms, byte counts, retries and pool wait
+        time collected since the client was created, plus the state of the
+        concurrency limiter and priority scheduler when the client has them.
+
+        Requires the client to be created with collect_stats=True.
+        """
+        if self._stats is None:
+            raise ValueError("Transport statistics are disabled; create the client with collect_stats=True")
+        snapshot = self._stats.snapshot()
+        if self._concurrency_limiter is not None:
+            snapshot.concurrency = self._concurrency_limiter.stats()
+        if self._scheduler is not None:
+            snapshot.priorities = self._scheduler.stats()
+        return snapshot
+
+    def _store_scope(self) -> str:
+        # Rows in a shared response store are keyed by the credentials, server
+        # and for_user scope that fetched them, so one client never serves
+        # another tenant's or user's responses from it
+        credentials = f"{self._config.base_url}|{self._config.api_key}|{self._config.tenant_id or ''}"
+        digest = hashlib.sha256(credentials.encode()).hexdigest()[:16]
+        return f"{digest}/{self._scoped_user_id or ''}"
 
     @property
-    def responses(self) -> ResponsesResource:
+    def responses(self) -> "ResponsesResource":
         if not self._transport:
             raise RuntimeError(
                 "AsyncClient not initialized. Use 'async with client:' context manager "
                 "or call 'await client.init()' before accessing resources directly. "
                 "For direct API calls, use 'await client.invoke()' which auto-initializes."
             )
-        return ResponsesResource(self._transport, tenant_id=self._config.tenant_id)
+        from .resources.responses import ResponsesResource
+
+        return ResponsesResource(
+            self._transport,
+            tenant_id=self._config.tenant_id,
+            store=self._response_store,
+            store_scope=self._store_scope(),
+        )
 
     @property
-    def threads(self) -> ThreadsResource:
+    def threads(self) -> "ThreadsResource":
         if not self._transport:
             raise RuntimeError(
                 "AsyncClient not initialized. Use 'async with client:' context manager "
                 "or call 'await client.init()' before accessing resources directly. "
                 "For direct API calls, use 'await client.invoke()' which auto-initializes."
             )
-        return ThreadsResource(self._transport, tenant_id=self._config.tenant_id)
+        from .resources.threads import ThreadsResource
+
+        return ThreadsResource(
+            self._transport,
+            tenant_id=self._config.tenant_id,
+            store=self._response_store,
+            store_scope=self._store_scope(),
+        )
 
     @property
-    def external_api_keys(self) -> ExternalApiKeysResource:
+    def external_api_keys(self) -> "ExternalApiKeysResource":
         if not self._transport:
             raise RuntimeError(
                 "AsyncClient not initialized. Use 'async with client:' context manager "
                 "or call 'await client.init()' before accessing resources directly. "
                 "For direct API calls, use 'await client.invoke()' which auto-initializes."
             )
+        from .resources.external_api_keys import ExternalApiKeysResource
+
         return ExternalApiKeysResource(self._transport, tenant_id=self._config.tenant_id)
 
     @property
-    def api_keys(self) -> ExternalApiKeysResource:
+    def api_keys(self) -> "ExternalApiKeysResource":
         """Alias for external_api_keys for easier access."""
         return self.external_api_keys
 
     @property
-    def tenant(self) -> TenantResource:
+    def tenant(self) -> "TenantResource":
         if not self._transport:
             raise RuntimeError(
                 "AsyncClient not initialized. Use 'async with client:' context manager "
                 "or call 'await client.init()' before accessing resources directly. "
                 "For direct API calls, use 'await client.invoke()' which auto-initializes."
             )
+        from .resources.tenant import TenantResource
+
         return TenantResource(self._transport, tenant_id=self._config.tenant_id)
 
     @property
-    def users(self) -> UsersResource:
+    def users(self) -> "UsersResource":
         if not self._transport:
             raise RuntimeError(
                 "AsyncClient not initialized. Use 'async with client:' context manager "
                 "or call 'await client.init()' before accessing resources directly. "
                 "For direct API calls, use 'await client.invoke()' which auto-initializes."
             )
+        from .resources.users import UsersResource
+
         return UsersResource(self._transport, tenant_id=self._config.tenant_id)
 
     @property
-    def integrations(self) -> IntegrationsResource:
+    def integrations(self) -> "IntegrationsResource":
         if not self._transport:
             raise RuntimeError(
                 "AsyncClient not initialized. Use 'async with client:' context manager "
                 "or call 'await client.init()' before accessing resources directly. "
                 "For direct API calls, use 'await client.invoke()' which auto-initializes."
             )
+        from .resources.integrations import IntegrationsResource
+
         return IntegrationsResource(self._transport, tenant_id=self._config.tenant_id)
 
     @property
-    def model_preferences(self) -> ModelPreferencesResource:
+    def model_preferences(self) -> "ModelPreferencesResource":
         if not self._transport:
             raise RuntimeError(
                 "AsyncClient not initialized. Use 'async with client:' context manager "
                 "or call 'await client.init()' before accessing resources directly. "
                 "For direct API calls, use 'await client.invoke()' which auto-initializes."
             )
+        from .resources.model_preferences import ModelPreferencesResource
+
         return ModelPreferencesResource(self._transport, tenant_id=self._config.tenant_id)
 
     @property
-    def mcp_servers(self) -> MCPServersResource:
+    def mcp_servers(self) -> "MCPServersResource":
         if not self._transport:
             raise RuntimeError(
                 "AsyncClient not initialized. Use 'async with client:' context manager "
                 "or call 'await client.init()' before accessing resources directly."
             )
+        from .resources.mcp_servers import MCPServersResource
+
         return MCPServersResource(self._transport, tenant_id=self._config.tenant_id)
 
     @property
-    def files(self) -> FilesResource:
+    def files(self) -> "FilesResource":
         """
         Access file management operations.
         
@@ -223,10 +418,12 @@ class AsyncClient:
                 "AsyncClient not initialized. Use 'async with client:' context manager "
                 "or call 'await client.init()' before accessing resources directly."
             )
+        from .resources.files import FilesResource
+
         return FilesResource(self._transport, tenant_id=self._config.tenant_id)
 
     @property
-    def skills(self) -> SkillsResource:
+    def skills(self) -> "SkillsResource":
         """
         Access skills management operations.
         
@@ -238,6 +435,8 @@ class AsyncClient:
                 "AsyncClient not initialized. Use 'async with client:' context manager "
                 "or call 'await client.init()' before accessing resources directly."
             )
+        from .resources.skills import SkillsResource
+
         return SkillsResource(self._transport, tenant_id=self._config.tenant_id)
 
     def for_user(self, user_id: str) -> "AsyncClient":
@@ -248,7 +447,22 @@ class AsyncClient:
             timeout=self._config.timeout,
             scope=Scope.USER,
             max_retries=self._config.max_retries,
+            response_store=self._response_store,
+            hooks=self._hooks,
+            http_transport=self._http_transport,
+            http_cache=self._http_cache,
+            coalesce_requests=self._coalesce_requests,
+            hedging=self._hedging,
+            circuit_breaker=self._circuit_breaker,
+            concurrency_limiter=self._concurrency_limiter,
+            rate_limiter=self._rate_limiter,
+            scheduler=self._scheduler,
+            bulk_lane=self._bulk_lane,
+            transport_profile=self._config.transport_profile,
             _scoped_user_id=user_id,
+            _stats=self._stats,
+            _tracer=self._tracer,
+            _timeline_callbacks=self._timeline_callbacks,
         )
 
     @asynccontextmanager
@@ -329,31 +543,47 @@ class AsyncClient:
 
         if stream:
             # Return async generator for streaming
-            return self._create_stream_generator(
-                input_data=resolved_input,
-                user_id=user_id,
-                scope=scope or self._default_scope,
+            return self._traced_stream(
+                self._create_stream_generator(
+                    input_data=resolved_input,
+                    user_id=user_id,
+                    scope=scope or self._default_scope,
+                    thread_id=thread_id,
+                    idempotency_key=idempotency_key,
+                    poll_interval=poll_interval,
+                    wait_timeout=wait_timeout,
+                    **options
+                ),
+                user_id=user_id or self._scoped_user_id,
                 thread_id=thread_id,
-                idempotency_key=idempotency_key,
-                poll_interval=poll_interval,
-                wait_timeout=wait_timeout,
-                **options
             )
         else:
             # Return single response (blocking)
             progress_callback = self._create_simple_progress_callback() if show_progress else None
-            return await self._invoke_async(
-                input_data=resolved_input,
-                user_id=user_id,
-                scope=scope or self._default_scope,
-                thread_id=thread_id,
-                idempotency_key=idempotency_key,
-                wait=True,
-                progress_callback=progress_callback,
-                poll_interval=poll_interval,
-                wait_timeout=wait_timeout,
-                **options
-            )
+            with self._tracer.span(
+                "lumnisai.invoke", user_id=user_id or self._scoped_user_id, thread_id=thread_id
+            ):
+                return await self._invoke_async(
+                    input_data=resolved_input,
+                    user_id=user_id,
+                    scope=scope or self._default_scope,
+                    thread_id=thread_id,
+                    idempotency_key=idempotency_key,
+                    wait=True,
+                    progress_callback=progress_callback,
+                    poll_interval=poll_interval,
+                    wait_timeout=wait_timeout,
+                    **options
+                )
+
+    def _traced_stream(
+        self,
+        updates: AsyncGenerator[ProgressEntry, None],
+        **attributes,
+    ) -> AsyncGenerator[ProgressEntry, None]:
+        # The span lasts while the caller consumes the stream, and every poll
+        # request made for the next update is recorded under it
+        return self._tracer.stream("lumnisai.invoke", updates, stream=True, **attributes)
 
 
     async def invoke_stream(
@@ -444,6 +674,26 @@ class AsyncClient:
         await self._ensure_transport()
         return await self.threads.delete(thread_id)
 
+    async def sync_threads(self, user_id: str | None = None, *, concurrency: int = 4) -> ThreadSyncResult:
+        """Incrementally synchronize threads into the local response store."""
+        await self._ensure_transport()
+        return await self.threads.sync(user_id, concurrency=concurrency)
+
+    async def get_response_analytics(
+        self,
+        start: date,
+        end: date,
+        *,
+        group_by: Literal["user", "status", "model"] | None = None,
+        user_id: str | None = None,
+        shards: int = 4,
+    ) -> ResponseAnalytics:
+        """Aggregate latency, failure rate and throughput of responses over a date range."""
+        await self._ensure_transport()
+        return await self.responses.analytics(
+            start, end, group_by=group_by, user_id=user_id, shards=shards
+        )
+
     # User management flattened methods
     async def create_user(self, *, email: str, first_name: str | None = None, last_name: str | None = None):
         await self._ensure_transport()
@@ -851,6 +1101,21 @@ class AsyncClient:
             user_id=user_id,
         )
 
+    async def get_file_statistics(
+        self,
+        *,
+        user_id: UUID | str | None = None,
+        scope: FileScope | None = None,
+        concurrency: int = 4,
+    ) -> FileStatisticsResponse:
+        """Get aggregated storage statistics for files."""
+        await self._ensure_transport()
+        return await self.files.statistics(
+            user_id=user_id,
+            scope=scope,
+            concurrency=concurrency,
+        )
+
     # Skills management convenience methods
     async def create_skill(
         self,
@@ -1015,6 +1280,7 @@ class AsyncClient:
                 processed_options["response_format"] = response_format.model_json_schema()
 
         # Create the response
+        recorder = TimelineRecorder()
         response = await self.responses.create(
             messages=formatted_messages,
             user_id=effective_user_id,
@@ -1025,19 +1291,24 @@ class AsyncClient:
 
         # Print response ID for tracking
         print(f"Response ID: {response.response_id}")
+        recorder.created(response.status)
+        self._tracer.set_attribute("response_id", response.response_id)
 
         # Stream updates until completion
         last_message_count = 0
         tool_call_counts = {}  # Track tool calls per message index
 
         while True:
-            try:
-                # Try long-polling first for efficiency
-                current = await self.responses.get(response.response_id, wait=wait_timeout)
-            except Exception as e:
-                # Fall back to regular polling if long-polling fails
-                logger.debug(f"Long-polling failed, falling back to regular polling: {type(e).__name__}: {e}")
-                current = await self.responses.get(response.response_id)
+            # Status polls queue behind interactive and batch requests
+            with request_priority(Priority.POLLING):
+                try:
+                    # Try long-polling first for efficiency
+                    current = await self.responses.get(response.response_id, wait=wait_timeout)
+                except Exception as e:
+                    # Fall back to regular polling if long-polling fails
+                    logger.debug(f"Long-polling failed, falling back to regular polling: {type(e).__name__}: {e}")
+                    current = await self.responses.get(response.response_id)
+            recorder.observe(current)
 
             # Yield only new progress entries
             current_msg_count = len(current.progress) if current.progress else 0
@@ -1076,6 +1347,8 @@ class AsyncClient:
 
             # Check if completed
             if current.status in ("succeeded", "failed", "cancelled"):
+                self._emit_timeline(recorder.finish(current))
+
                 # Yield final completion entry with output_text if succeeded
                 if current.status == "succeeded" and current.output_text:
                     from datetime import datetime
@@ -1088,6 +1361,7 @@ class AsyncClient:
                     )
                     yield final_entry
 
+                self._tracer.set_attribute("status", current.status)
                 logger.info(
                     f"Response {response.response_id} completed with status: {current.status}",
                     extra={
@@ -1145,6 +1419,7 @@ class AsyncClient:
                 processed_options["response_format"] = response_format.model_json_schema()
 
         # Create the response
+        recorder = TimelineRecorder()
         response = await self.responses.create(
             messages=formatted_messages,
             user_id=effective_user_id,
@@ -1155,6 +1430,8 @@ class AsyncClient:
 
         # Print response ID for tracking
         print(f"Response ID: {response.response_id}")
+        recorder.created(response.status)
+        self._tracer.set_attribute("response_id", response.response_id)
 
         # Wait for completion if requested
         if wait:
@@ -1163,7 +1440,11 @@ class AsyncClient:
                 progress_callback=progress_callback,
                 poll_interval=poll_interval,
                 wait_timeout=wait_timeout,
+                recorder=recorder,
             )
+            final_response._timeline = recorder.finish(final_response)
+            self._emit_timeline(final_response._timeline)
+            self._tracer.set_attribute("status", final_response.status)
             logger.info(
                 f"Response {response.response_id} completed with status: {final_response.status}",
                 extra={
@@ -1182,6 +1463,7 @@ class AsyncClient:
         progress_callback: Callable[[ResponseObject], None] | None = None,
         poll_interval: float = DEFAULT_POLL_INTERVAL,
         wait_timeout: float | None = LONG_POLL_TIMEOUT,
+        recorder: TimelineRecorder | None = None,
     ) -> ResponseObject:
         update_channel = asyncio.Queue(maxsize=1)
         final_response = None
@@ -1229,13 +1511,17 @@ class AsyncClient:
             last_message_count = 0
 
             while True:
-                try:
-                    # Try long-polling first for efficiency
-                    current = await self.responses.get(response_id, wait=wait_timeout)
-                except Exception as e:
-                    # Fall back to regular polling if long-polling fails
-                    logger.debug(f"Long-polling failed, falling back to regular polling: {type(e).__name__}: {e}")
-                    current = await self.responses.get(response_id)
+                # Status polls queue behind interactive and batch requests
+                with request_priority(Priority.POLLING):
+                    try:
+                        # Try long-polling first for efficiency
+                        current = await self.responses.get(response_id, wait=wait_timeout)
+                    except Exception as e:
+                        # Fall back to regular polling if long-polling fails
+                        logger.debug(f"Long-polling failed, falling back to regular polling: {type(e).__name__}: {e}")
+                        current = await self.responses.get(response_id)
+                if recorder is not None:
+                    recorder.observe(current)
 
                 # Check if we should emit progress update
                 current_msg_count = len(current.progress) if current.progress else 0
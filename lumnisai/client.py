@@ -1,8 +1,9 @@
 import asyncio
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterator, Mapping
 from contextlib import AbstractContextManager, contextmanager
 from datetime import date
 from functools import wraps
+from pathlib import Path
 from typing import (
     Any,
     Literal,
@@ -11,8 +12,26 @@ from typing import (
 )
 from uuid import UUID
 
+import httpx
+
+from ._transport import (
+    BulkLane,
+    CircuitBreaker,
+    ConcurrencyLimiter,
+    HedgePolicy,
+    HTTPCache,
+    PriorityScheduler,
+    SharedRateLimiter,
+    TransportHooks,
+    TransportProfile,
+    TransportStats,
+    TransportStatsSnapshot,
+    WarmupReport,
+)
 from .async_client import AsyncClient
 from .models import AgentConfig, ProgressEntry, ResponseObject, ResponseListResponse
+from .store import ResponseStore
+from .tracing import Tracer
 from .types import ApiKeyMode, ApiProvider, Scope
 
 T = TypeVar("T")
@@ -186,7 +205,25 @@ class Client:
         timeout: float = 30.0,
         max_retries: int = 3,
         scope: Scope = Scope.TENANT,
+        response_store: "ResponseStore | str | Path | None" = None,
+        hooks: TransportHooks | None = None,
+        collect_stats: bool = False,
+        tracing: bool = False,
+        http_transport: httpx.AsyncBaseTransport | None = None,
+        http_cache: HTTPCache | bool | None = None,
+        coalesce_requests: bool = True,
+        hedging: HedgePolicy | bool | None = None,
+        circuit_breaker: CircuitBreaker | bool | None = None,
+        concurrency_limiter: ConcurrencyLimiter | bool | None = None,
+        rate_limiter: SharedRateLimiter | None = None,
+        scheduler: PriorityScheduler | bool | None = None,
+        bulk_lane: BulkLane | bool | None = None,
+        transport_profile: TransportProfile | str | None = None,
+        prewarm: int | Mapping[str, int] = 0,
         _scoped_user_id: str | None = None,
+        _stats: TransportStats | None = None,
+        _tracer: Tracer | None = None,
+        _timeline_callbacks: list | None = None,
     ):
         self._async_client = AsyncClient(
             api_key=api_key,
@@ -195,10 +232,30 @@ class Client:
             timeout=timeout,
             max_retries=max_retries,
             scope=scope,
+            response_store=response_store,
+            hooks=hooks,
+            collect_stats=collect_stats,
+            tracing=tracing,
+            http_transport=http_transport,
+            http_cache=http_cache,
+            coalesce_requests=coalesce_requests,
+            hedging=hedging,
+            circuit_breaker=circuit_breaker,
+            concurrency_limiter=concurrency_limiter,
+            rate_limiter=rate_limiter,
+            scheduler=scheduler,
+            bulk_lane=bulk_lane,
+            transport_profile=transport_profile,
+            prewarm=prewarm,
             _scoped_user_id=_scoped_user_id,
+            _stats=_stats,
+            _tracer=_tracer,
+            _timeline_callbacks=_timeline_callbacks,
         )
         self._ensure_transport = sync_wrapper(self._async_client._ensure_transport)
         self._ensure_transport()
+        if prewarm:
+            self.prewarm(prewarm)
 
     def __enter__(self):
         return self
@@ -209,6 +266,27 @@ class Client:
     def close(self):
         sync_wrapper(self._async_client.close)()
 
+    def prewarm(self, connections: int | Mapping[str, int] = 10) -> WarmupReport:
+        """Open connections before traffic arrives; see AsyncClient.prewarm()."""
+        return sync_wrapper(self._async_client.prewarm)(connections)
+
+    @property
+    def warmup_report(self) -> WarmupReport | None:
+        return self._async_client.warmup_report
+
+    @property
+    def hooks(self) -> TransportHooks:
+        """Transport lifecycle hooks; see TransportHooks for the events."""
+        return self._async_client.hooks
+
+    def on_timeline(self, callback):
+        """Register a callback receiving the lifecycle timeline of every invoke()."""
+        return self._async_client.on_timeline(callback)
+
+    def stats(self) -> TransportStatsSnapshot:
+        """Transport statistics; requires collect_stats=True."""
+        return self._async_client.stats()
+
     @property
     def responses(self):
         return SyncResourceProxy(self._async_client.responses)
@@ -274,7 +352,22 @@ class Client:
             timeout=self._async_client._config.timeout,
             max_retries=self._async_client._config.max_retries,
             scope=self._async_client._default_scope,
+            response_store=self._async_client._response_store,
+            hooks=self._async_client._hooks,
+            http_transport=self._async_client._http_transport,
+            http_cache=self._async_client._http_cache,
+            coalesce_requests=self._async_client._coalesce_requests,
+            hedging=self._async_client._hedging,
+            circuit_breaker=self._async_client._circuit_breaker,
+            concurrency_limiter=self._async_client._concurrency_limiter,
+            rate_limiter=self._async_client._rate_limiter,
+            scheduler=self._async_client._scheduler,
+            bulk_lane=self._async_client._bulk_lane,
+            transport_profile=self._async_client._config.transport_profile,
             _scoped_user_id=user_id,
+            _stats=self._async_client._stats,
+            _tracer=self._async_client._tracer,
+            _timeline_callbacks=self._async_client._timeline_callbacks,
         )
 
     @contextmanager
@@ -420,6 +513,16 @@ class Client:
         delete_thread_async = sync_wrapper(self._async_client.delete_thread)
         return delete_thread_async(thread_id)
 
+    def sync_threads(self, user_id: str | None = None, *, concurrency: int = 4):
+        """Incrementally synchronize threads into the local response store."""
+        sync_threads_async = sync_wrapper(self._async_client.sync_threads)
+        return sync_threads_async(user_id, concurrency=concurrency)
+
+    def get_response_analytics(self, start, end, *, group_by=None, user_id=None, shards=4):
+        """Aggregate latency, failure rate and throughput of responses over a date range."""
+        get_response_analytics_async = sync_wrapper(self._async_client.get_response_analytics)
+        return get_response_analytics_async(start, end, group_by=group_by, user_id=user_id, shards=shards)
+
     # User management flattened methods
     def create_user(self, *, email: str, first_name: str | None = None, last_name: str | None = None):
         create_user_async = sync_wrapper(self._async_client.create_user)
@@ -677,6 +780,11 @@ class Client:
         get_file_status_async = sync_wrapper(self._async_client.get_file_status)
         return get_file_status_async(file_id, user_id=user_id)
 
+    def get_file_statistics(self, *, user_id=None, scope=None, concurrency=4):
+        """Get aggregated storage statistics for files."""
+        get_file_statistics_async = sync_wrapper(self._async_client.get_file_statistics)
+        return get_file_statistics_async(user_id=user_id, scope=scope, concurrency=concurrency)
+
     # Skills management convenience methods
     def create_skill(
         self,
@@ -2,6 +2,7 @@
 import os
 from uuid import UUID
 
+from ._transport.profile import TransportProfile, resolve_profile
 from .constants import CUSTOMER_API_URL, DEFAULT_MAX_RETRIES, DEFAULT_TIMEOUT
 
 
@@ -15,6 +16,7 @@ class Config:
         tenant_id: str | None = None,
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_MAX_RETRIES,
+        transport_profile: TransportProfile | str | None = None,
     ):
         # API key
         self.api_key = api_key or os.environ.get("LUMNISAI_API_KEY")
@@ -41,3 +43,6 @@ class Config:
         # HTTP settings
         self.timeout = timeout
         self.max_retries = max_retries
+        # Connection pool, HTTP version and timeouts; a preset name or
+        # LUMNISAI_TRANSPORT_PROFILE, with LUMNISAI_* overrides
+        self.transport_profile = resolve_profile(transport_profile)
@@ -10,6 +10,7 @@ class ErrorCode(Enum):
     NETWORK_ERROR = "NETWORK_ERROR"
     TIMEOUT = "TIMEOUT"
     CONNECTION_ERROR = "CONNECTION_ERROR"
+    CIRCUIT_OPEN = "CIRCUIT_OPEN"
 
     # Authentication errors
     INVALID_API_KEY = "INVALID_API_KEY"
@@ -121,6 +122,26 @@ class TransportError(LumnisAIError):
         super().__init__(message, code=code or ErrorCode.NETWORK_ERROR, **kwargs)
 
 
+class CircuitOpenError(TransportError):
+    """Raised without sending a request while an endpoint group's circuit is open."""
+
+    def __init__(
+        self,
+        endpoint_group: str,
+        *,
+        retry_after: float | None = None,
+        **kwargs,
+    ):
+        super().__init__(
+            f"Circuit open for {endpoint_group!r} endpoints; failing fast",
+            code=ErrorCode.CIRCUIT_OPEN,
+            **kwargs,
+        )
+        self.endpoint_group = endpoint_group
+        # Seconds until a probe request is let through, when known
+        self.retry_after = retry_after
+
+
 class ValidationError(LumnisAIError):
 
     def __init__(
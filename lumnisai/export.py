@@ -0,0 +1,403 @@
+"""
+Streaming export of conversation history.
+
+Walks every thread and its responses and writes one record per response to
+JSON Lines, or to Parquet when pyarrow is installed. Records are written as
+threads complete, so memory stays flat regardless of the size of the export,
+and progress is checkpointed so an interrupted export can be resumed.
+
+Usage from the command line:
+
+    python -m lumnisai.export history.jsonl --checkpoint history.ckpt
+    python -m lumnisai.export history/ --format parquet --user-id user-123
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from .models.response import ResponseObject
+from .models.thread import ThreadObject
+
+if TYPE_CHECKING:
+    from .resources.threads import ThreadsResource
+
+logger = logging.getLogger("lumnisai.export")
+
+ExportFormat = Literal["jsonl", "parquet"]
+
+# Maximum page size accepted by the thread listing endpoints
+_PAGE_SIZE = 100
+
+# Nested fields are stored in Parquet as JSON strings
+_PARQUET_JSON_COLUMNS = (
+    "input_messages",
+    "progress",
+    "structured_response",
+    "artifacts",
+    "error",
+    "options",
+)
+
+
+class ExportResult(BaseModel):
+    """Summary of a finished export."""
+
+    destination: str
+    format: ExportFormat
+    threads_exported: int
+    threads_skipped: int
+    responses_exported: int
+
+    def __str__(self):
+        return f"Exported {self.responses_exported} responses from {self.threads_exported} threads to {self.destination} ({self.threads_skipped} threads already exported)"
+
+
+class _Checkpoint:
+    """Export progress persisted atomically next to the output."""
+
+    def __init__(self, path: Path | None):
+        self.path = path
+        self.completed_threads: set[str] = set()
+        self.responses_exported = 0
+        self.bytes_committed = 0
+        self.parts: list[str] = []
+
+        if path is not None and path.exists():
+            state = json.loads(path.read_text())
+            self.completed_threads = set(state["completed_threads"])
+            self.responses_exported = state["responses_exported"]
+            self.bytes_committed = state.get("bytes_committed", 0)
+            self.parts = state.get("parts", [])
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        state = {
+            "completed_threads": sorted(self.completed_threads),
+            "responses_exported": self.responses_exported,
+            "bytes_committed": self.bytes_committed,
+            "parts": self.parts,
+        }
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(state))
+        os.replace(tmp_path, self.path)
+
+
+class _JsonlWriter:
+
+    def __init__(self, destination: Path, checkpoint: _Checkpoint):
+        self._checkpoint = checkpoint
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(destination, "ab")
+        # Drop anything written after the last checkpoint of a previous run
+        self._file.truncate(checkpoint.bytes_committed)
+        self._file.seek(checkpoint.bytes_committed)
+
+    @staticmethod
+    def encode(response: ResponseObject) -> bytes:
+        return response.model_dump_json().encode() + b"\n"
+
+    def write(self, records: list[bytes]) -> None:
+        self._file.writelines(records)
+
+    def commit(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._checkpoint.bytes_committed = self._file.tell()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+
+    def __init__(self, destination: Path, checkpoint: _Checkpoint):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(
+                "Parquet export requires pyarrow. Install it with: pip install pyarrow"
+            ) from e
+
+        self._pa = pa
+        self._pq = pq
+        self._checkpoint = checkpoint
+        self._destination = destination
+        destination.mkdir(parents=True, exist_ok=True)
+
+        # Parts not recorded in the checkpoint were left by an interrupted run
+        for part in destination.glob("part-*.parquet"):
+            if part.name not in checkpoint.parts:
+                part.unlink()
+
+        self._schema = pa.schema(
+            [
+                ("response_id", pa.string()),
+                ("thread_id", pa.string()),
+                ("tenant_id", pa.string()),
+                ("user_id", pa.string()),
+                ("status", pa.string()),
+                ("created_at", pa.timestamp("us", tz="UTC")),
+                ("completed_at", pa.timestamp("us", tz="UTC")),
+                ("response_title", pa.string()),
+                ("output_text", pa.string()),
+            ]
+            + [(name, pa.string()) for name in _PARQUET_JSON_COLUMNS]
+        )
+        self._columns: dict[str, list[Any]] = {name: [] for name in self._schema.names}
+
+    @staticmethod
+    def encode(response: ResponseObject) -> dict[str, Any]:
+        data = response.model_dump(mode="json")
+        record = {
+            "response_id": data["response_id"],
+            "thread_id": data["thread_id"],
+            "tenant_id": data["tenant_id"],
+            "user_id": data["user_id"],
+            "status": data["status"],
+            "created_at": response.created_at,
+            "completed_at": response.completed_at,
+            "response_title": data["response_title"],
+            "output_text": data["output_text"],
+        }
+        for name in _PARQUET_JSON_COLUMNS:
+            value = data[name]
+            record[name] = json.dumps(value) if value is not None else None
+        return record
+
+    def write(self, records: list[dict[str, Any]]) -> None:
+        for record in records:
+            for name, column in self._columns.items():
+                column.append(record[name])
+
+    def commit(self) -> None:
+        if not self._columns["response_id"]:
+            return
+        part_name = f"part-{len(self._checkpoint.parts):05d}.parquet"
+        table = self._pa.table(self._columns, schema=self._schema)
+        self._pq.write_table(table, self._destination / part_name)
+        self._checkpoint.parts.append(part_name)
+        self._columns = {name: [] for name in self._schema.names}
+
+    def close(self) -> None:
+        pass
+
+
+async def _iter_thread_responses(
+    threads: ThreadsResource,
+    thread_id: UUID,
+) -> AsyncIterator[list[ResponseObject]]:
+    """Yield pages of a thread's responses, prefetching the next page."""
+    offset = 0
+    next_page = asyncio.ensure_future(
+        threads.get_responses(thread_id, limit=_PAGE_SIZE, offset=offset)
+    )
+    try:
+        while next_page is not None:
+            page = await next_page
+            offset += len(page)
+            next_page = None
+            if len(page) == _PAGE_SIZE:
+                next_page = asyncio.ensure_future(
+                    threads.get_responses(thread_id, limit=_PAGE_SIZE, offset=offset)
+                )
+            yield page
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
+async def _iter_threads(
+    threads: ThreadsResource,
+    user_id: str | UUID | None,
+    concurrency: int,
+) -> AsyncIterator[ThreadObject]:
+    first_page = await threads.list(user_id=user_id, limit=_PAGE_SIZE)
+    for thread in first_page.threads:
+        yield thread
+
+    async def fetch_page(page: int):
+        return await threads.list(user_id=user_id, limit=_PAGE_SIZE, offset=page * _PAGE_SIZE)
+
+    page_count = math.ceil(first_page.total / _PAGE_SIZE)
+    async for page in threads._iter_pages(
+        fetch_page, range(1, page_count), concurrency=concurrency
+    ):
+        for thread in page.threads:
+            yield thread
+
+
+def _has_output(destination: Path, format: ExportFormat) -> bool:
+    if format == "parquet":
+        return destination.is_dir() and any(destination.glob("part-*.parquet"))
+    return destination.exists() and destination.stat().st_size > 0
+
+
+async def export_threads(
+    threads: ThreadsResource,
+    destination: str | Path,
+    *,
+    user_id: str | UUID | None = None,
+    format: ExportFormat = "jsonl",
+    concurrency: int = 4,
+    checkpoint: str | Path | None = None,
+    checkpoint_every: int = 100,
+    overwrite: bool = False,
+) -> ExportResult:
+    """
+    Export every response of every thread to a file.
+
+    Threads are exported by `concurrency` workers, each paging through the
+    responses of one thread at a time with the next page prefetched. Records of
+    a thread are written once the whole thread has been read, and progress is
+    checkpointed every `checkpoint_every` threads. Re-running with the same
+    checkpoint resumes after the last checkpointed thread; anything written
+    after that checkpoint is discarded and exported again. An export that is
+    not resuming refuses to replace existing output unless `overwrite` is set.
+
+    Args:
+        threads: Threads resource of an initialized client
+        destination: Output file for JSON Lines, or output directory of part
+            files for Parquet
+        user_id: Only export threads of this user
+        format: "jsonl" or "parquet" (requires pyarrow)
+        concurrency: Number of threads exported in parallel
+        checkpoint: Path of the checkpoint file; no resume support if None
+        checkpoint_every: Number of threads between checkpoints
+        overwrite: Replace output left by an earlier export that is not
+            being resumed
+
+    Returns:
+        ExportResult summarizing the export
+    """
+    destination = Path(destination).expanduser()
+    checkpoint_path = Path(checkpoint).expanduser() if checkpoint else None
+    resuming = checkpoint_path is not None and checkpoint_path.exists()
+    if not resuming and not overwrite and _has_output(destination, format):
+        raise FileExistsError(
+            f"{destination} already contains an export; pass overwrite=True to replace it "
+            "or the checkpoint of that export to resume it"
+        )
+    state = _Checkpoint(checkpoint_path)
+    writer_cls = _ParquetWriter if format == "parquet" else _JsonlWriter
+    writer = writer_cls(destination, state)
+
+    thread_queue: asyncio.Queue[ThreadObject | None] = asyncio.Queue(maxsize=concurrency * 2)
+    done_queue: asyncio.Queue[tuple[str, list[Any]] | None] = asyncio.Queue(maxsize=concurrency)
+    threads_skipped = 0
+    threads_exported = 0
+
+    async def produce() -> None:
+        nonlocal threads_skipped
+        async for thread in _iter_threads(threads, user_id, concurrency):
+            if str(thread.thread_id) in state.completed_threads:
+                threads_skipped += 1
+                continue
+            await thread_queue.put(thread)
+        for _ in range(concurrency):
+            await thread_queue.put(None)
+
+    async def export_worker() -> None:
+        while (thread := await thread_queue.get()) is not None:
+            records: list[Any] = []
+            async for page in _iter_thread_responses(threads, thread.thread_id):
+                records.extend(writer.encode(response) for response in page)
+            await done_queue.put((str(thread.thread_id), records))
+        await done_queue.put(None)
+
+    async def write() -> None:
+        nonlocal threads_exported
+        workers_left = concurrency
+        while workers_left:
+            finished = await done_queue.get()
+            if finished is None:
+                workers_left -= 1
+                continue
+            thread_id, records = finished
+            writer.write(records)
+            state.completed_threads.add(thread_id)
+            state.responses_exported += len(records)
+            threads_exported += 1
+            if threads_exported % checkpoint_every == 0:
+                writer.commit()
+                state.save()
+
+    tasks = [
+        asyncio.ensure_future(produce()),
+        *(asyncio.ensure_future(export_worker()) for _ in range(concurrency)),
+        asyncio.ensure_future(write()),
+    ]
+    try:
+        # The stages wait on each other through bounded queues, so one that
+        # fails would leave the others blocked: stop at the first error
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+        writer.commit()
+        state.save()
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        writer.close()
+
+    logger.info(
+        f"Exported {threads_exported} threads to {destination}",
+        extra={"responses_exported": state.responses_exported},
+    )
+    return ExportResult(
+        destination=str(destination),
+        format=format,
+        threads_exported=threads_exported,
+        threads_skipped=threads_skipped,
+        responses_exported=state.responses_exported,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m lumnisai.export",
+        description="Export Lumnis conversation history to JSON Lines or Parquet.",
+    )
+    parser.add_argument("destination", help="Output file (jsonl) or directory (parquet)")
+    parser.add_argument("--format", choices=["jsonl", "parquet"], default="jsonl")
+    parser.add_argument("--user-id", help="Only export threads of this user")
+    parser.add_argument("--concurrency", type=int, default=4, help="Threads exported in parallel")
+    parser.add_argument("--checkpoint", help="Checkpoint file used to resume an interrupted export")
+    parser.add_argument("--overwrite", action="store_true", help="Replace the output of an earlier export")
+    parser.add_argument("--api-key", help="API key (defaults to LUMNISAI_API_KEY)")
+    parser.add_argument("--base-url", help="API base URL (defaults to LUMNISAI_BASE_URL)")
+    args = parser.parse_args(argv)
+
+    from .async_client import AsyncClient
+
+    async def run() -> ExportResult:
+        async with AsyncClient(api_key=args.api_key, base_url=args.base_url) as client:
+            return await client.threads.export(
+                args.destination,
+                user_id=args.user_id,
+                format=args.format,
+                concurrency=args.concurrency,
+                checkpoint=args.checkpoint,
+                overwrite=args.overwrite,
+            )
+
+    print(asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,92 +1,212 @@
-from .agent_config import AgentConfig, AgentMode
-from .external_api_keys import (
-    ApiKeyModeRequest,
-    ApiKeyModeResponse,
-    ExternalApiKeyResponse,
-    StoreApiKeyRequest,
-)
-from .model_names import AnthropicModels, DeepSeekModels, GoogleModels, Models, OpenAIModels
-from .files import (
-    BulkDeleteRequest,
-    BulkDeleteResponse,
-    BulkUploadResponse,
-    ContentType,
-    DuplicateHandling,
-    FileChunk,
-    FileContentRequest,
-    FileContentResponse,
-    FileListResponse,
-    FileMetadata,
-    FileScope,
-    FileScopeUpdateRequest,
-    FileSearchRequest,
-    FileSearchResponse,
-    FileSearchResult,
-    FileStatisticsResponse,
-    FileUploadRequest,
-    FileUploadResponse,
-    ProcessingStatus,
-    ProcessingStatusResponse,
-)
-from .integrations import (
-    AppEnabledResponse,
-    CallbackRequest,
-    ConnectionStatus,
-    GetToolsRequest,
-    GetToolsResponse,
-    InitiateConnectionRequest,
-    InitiateConnectionResponse,
-    ListAppsResponse,
-    ListConnectionsResponse,
-    SetAppEnabledResponse,
-    Tool,
-    ToolParameter,
-)
-from .mcp_servers import (
-    MCPServer,
-    MCPServerCreate,
-    MCPServerCreateRequest,
-    MCPServerListResponse,
-    MCPServerResponse,
-    MCPServerUpdate,
-    MCPServerUpdateRequest,
-    MCPToolListResponse,
-    MCPToolResponse,
-    Scope,
-    MCPTestConnectionResponse,
-    TransportType,
-)
-from .model_preferences import (
-    ModelAvailability,
-    ModelOverrides,
-    ModelPreference,
-    ModelPreferenceCreate,
-    ModelPreferencesResponse,
-    SupportedModelsResponse,
-    UpdateModelPreferencesRequest,
-)
-from .response import (
-    CancelResponse,
-    CreateFeedbackRequest,
-    CreateFeedbackResponse,
-    CreateResponseRequest,
-    CreateResponseResponse,
-    FeedbackObject,
-    ListFeedbackResponse,
-    Message,
-    ProgressEntry,
-    ResponseObject,
-    ResponseListResponse,
-)
-from .tenant import TenantInfo
-from .thread import ThreadListResponse, ThreadObject, UpdateThreadRequest
-from .skills import (
-    SkillGuideline,
-    SkillGuidelineCreate,
-    SkillGuidelineListResponse,
-    SkillGuidelineUpdate,
-)
-from .user import PaginationInfo, User, UserCreate, UsersListResponse, UserUpdate
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .agent_config import AgentConfig, AgentMode
+    from .external_api_keys import (
+        ApiKeyModeRequest,
+        ApiKeyModeResponse,
+        ExternalApiKeyResponse,
+        StoreApiKeyRequest,
+    )
+    from .model_names import AnthropicModels, DeepSeekModels, GoogleModels, Models, OpenAIModels
+    from .files import (
+        BulkDeleteRequest,
+        BulkDeleteResponse,
+        BulkUploadResponse,
+        ContentType,
+        DuplicateHandling,
+        FileChunk,
+        FileContentRequest,
+        FileContentResponse,
+        FileListResponse,
+        FileMetadata,
+        FileScope,
+        FileScopeUpdateRequest,
+        FileSearchRequest,
+        FileSearchResponse,
+        FileSearchResult,
+        FileStatisticsResponse,
+        FileUploadRequest,
+        FileUploadResponse,
+        ProcessingStatus,
+        ProcessingStatusResponse,
+    )
+    from .integrations import (
+        AppEnabledResponse,
+        CallbackRequest,
+        ConnectionStatus,
+        GetToolsRequest,
+        GetToolsResponse,
+        InitiateConnectionRequest,
+        InitiateConnectionResponse,
+        ListAppsResponse,
+        ListConnectionsResponse,
+        SetAppEnabledResponse,
+        Tool,
+        ToolParameter,
+    )
+    from .mcp_servers import (
+        MCPServer,
+        MCPServerCreate,
+        MCPServerCreateRequest,
+        MCPServerListResponse,
+        MCPServerResponse,
+        MCPServerUpdate,
+        MCPServerUpdateRequest,
+        MCPToolListResponse,
+        MCPToolResponse,
+        Scope,
+        MCPTestConnectionResponse,
+        TransportType,
+    )
+    from .model_preferences import (
+        ModelAvailability,
+        ModelOverrides,
+        ModelPreference,
+        ModelPreferenceCreate,
+        ModelPreferencesResponse,
+        SupportedModelsResponse,
+        UpdateModelPreferencesRequest,
+    )
+    from .response import (
+        CancelResponse,
+        CreateFeedbackRequest,
+        CreateFeedbackResponse,
+        CreateResponseRequest,
+        CreateResponseResponse,
+        DurationStats,
+        FeedbackObject,
+        ListFeedbackResponse,
+        Message,
+        ProgressEntry,
+        ResponseAnalytics,
+        ResponseGroupStats,
+        ResponseObject,
+        ResponseListResponse,
+        ResponseTimeline,
+        StatusTransition,
+        ThroughputBucket,
+        ToolCallTiming,
+    )
+    from .tenant import TenantInfo
+    from .thread import ThreadListResponse, ThreadObject, ThreadSyncResult, UpdateThreadRequest
+    from .skills import (
+        SkillGuideline,
+        SkillGuidelineCreate,
+        SkillGuidelineListResponse,
+        SkillGuidelineUpdate,
+    )
+    from .user import PaginationInfo, User, UserCreate, UsersListResponse, UserUpdate
+
+# Public names by submodule, imported on first access
+_SUBMODULES = {
+    ".agent_config": ("AgentConfig", "AgentMode"),
+    ".external_api_keys": (
+        "ApiKeyModeRequest",
+        "ApiKeyModeResponse",
+        "ExternalApiKeyResponse",
+        "StoreApiKeyRequest",
+    ),
+    ".model_names": (
+        "AnthropicModels",
+        "DeepSeekModels",
+        "GoogleModels",
+        "Models",
+        "OpenAIModels",
+    ),
+    ".files": (
+        "BulkDeleteRequest",
+        "BulkDeleteResponse",
+        "BulkUploadResponse",
+        "ContentType",
+        "DuplicateHandling",
+        "FileChunk",
+        "FileContentRequest",
+        "FileContentResponse",
+        "FileListResponse",
+        "FileMetadata",
+        "FileScope",
+        "FileScopeUpdateRequest",
+        "FileSearchRequest",
+        "FileSearchResponse",
+        "FileSearchResult",
+        "FileStatisticsResponse",
+        "FileUploadRequest",
+        "FileUploadResponse",
+        "ProcessingStatus",
+        "ProcessingStatusResponse",
+    ),
+    ".integrations": (
+        "AppEnabledResponse",
+        "CallbackRequest",
+        "ConnectionStatus",
+        "GetToolsRequest",
+        "GetToolsResponse",
+        "InitiateConnectionRequest",
+        "InitiateConnectionResponse",
+        "ListAppsResponse",
+        "ListConnectionsResponse",
+        "SetAppEnabledResponse",
+        "Tool",
+        "ToolParameter",
+    ),
+    ".mcp_servers": (
+        "MCPServer",
+        "MCPServerCreate",
+        "MCPServerCreateRequest",
+        "MCPServerListResponse",
+        "MCPServerResponse",
+        "MCPServerUpdate",
+        "MCPServerUpdateRequest",
+        "MCPToolListResponse",
+        "MCPToolResponse",
+        "Scope",
+        "MCPTestConnectionResponse",
+        "TransportType",
+    ),
+    ".model_preferences": (
+        "ModelAvailability",
+        "ModelOverrides",
+        "ModelPreference",
+        "ModelPreferenceCreate",
+        "ModelPreferencesResponse",
+        "SupportedModelsResponse",
+        "UpdateModelPreferencesRequest",
+    ),
+    ".response": (
+        "CancelResponse",
+        "CreateFeedbackRequest",
+        "CreateFeedbackResponse",
+        "CreateResponseRequest",
+        "CreateResponseResponse",
+        "DurationStats",
+        "FeedbackObject",
+        "ListFeedbackResponse",
+        "Message",
+        "ProgressEntry",
+        "ResponseAnalytics",
+        "ResponseGroupStats",
+        "ResponseObject",
+        "ResponseListResponse",
+        "ResponseTimeline",
+        "StatusTransition",
+        "ThroughputBucket",
+        "ToolCallTiming",
+    ),
+    ".tenant": ("TenantInfo",),
+    ".thread": ("ThreadListResponse", "ThreadObject", "ThreadSyncResult", "UpdateThreadRequest"),
+    ".skills": (
+        "SkillGuideline",
+        "SkillGuidelineCreate",
+        "SkillGuidelineListResponse",
+        "SkillGuidelineUpdate",
+    ),
+    ".user": ("PaginationInfo", "User", "UserCreate", "UsersListResponse", "UserUpdate"),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _SUBMODULES, globals())
 
 __all__ = [
     "AgentConfig",
@@ -109,6 +229,7 @@ __all__ = [
     "CreateResponseRequest",
     "CreateResponseResponse",
     "DuplicateHandling",
+    "DurationStats",
     "ExternalApiKeyResponse",
     "FileChunk",
     "FileContentRequest",
@@ -156,8 +277,11 @@ __all__ = [
     "ProcessingStatus",
     "ProcessingStatusResponse",
     "ProgressEntry",
+    "ResponseAnalytics",
+    "ResponseGroupStats",
     "ResponseObject",
     "ResponseListResponse",
+    "ResponseTimeline",
     "Scope",
     # External API key models
     "SetAppEnabledResponse",
@@ -166,6 +290,7 @@ __all__ = [
     "SkillGuidelineCreate",
     "SkillGuidelineListResponse",
     "SkillGuidelineUpdate",
+    "StatusTransition",
     "StoreApiKeyRequest",
     "SupportedModelsResponse",
     # Tenant models
@@ -174,6 +299,9 @@ __all__ = [
     "ThreadListResponse",
     # Thread models
     "ThreadObject",
+    "ThreadSyncResult",
+    "ThroughputBucket",
+    "ToolCallTiming",
     "Tool",
     "ToolParameter",
     "TransportType",
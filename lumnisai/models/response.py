@@ -1,10 +1,10 @@
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Literal
 from uuid import UUID
 import json
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from .agent_config import AgentConfig
 from .model_preferences import ModelOverrides
@@ -78,9 +78,17 @@ class ResponseObject(BaseModel):
     created_at: datetime
     completed_at: datetime | None = None
 
+    # Lifecycle timeline, set on responses returned by invoke()
+    _timeline: "ResponseTimeline | None" = PrivateAttr(default=None)
+
     @property
     def content(self) -> str | None:
         return self.output_text
+
+    @property
+    def timeline(self) -> "ResponseTimeline | None":
+        """Where the time of an invoke() went; None for responses fetched directly."""
+        return self._timeline
     
     def __str__(self):
         return f"Response ID: {self.response_id}\nThread ID: {self.thread_id}\nStatus: {self.status}\nCreated At: {self.created_at}\nCompleted At: {self.completed_at}"
@@ -106,6 +114,60 @@ class ResponseObject(BaseModel):
         """Extract sub-agent executions from the progress entries."""
         return [sa_execution for sa_execution in self.progress if sa_execution.tool_calls and 'name' in sa_execution.tool_calls[-1] and sa_execution.tool_calls[-1]['name'] == "FINAL_RESPONSE"]
 
+class StatusTransition(BaseModel):
+    status: str
+    observed_after: float = Field(description="Seconds since invoke() started")
+
+
+class ToolCallTiming(BaseModel):
+    names: list[str]
+    started_at: datetime
+    seconds: float | None = Field(None, description="Until the next progress entry or completion")
+
+
+class ResponseTimeline(BaseModel):
+    """
+    Lifecycle of one invoke(), combining what the client observed while polling
+    with the server timestamps of the response and its progress entries.
+
+    Client-side durations (create, first progress, total) include network and
+    polling latency; server-side ones (queued, run, gaps, tool calls) do not.
+    """
+
+    response_id: UUID
+    status: str
+    create_seconds: float | None = Field(None, description="Duration of the create request")
+    queued_seconds: float | None = Field(None, description="created_at to the first progress entry")
+    time_to_first_progress: float | None = Field(None, description="Seconds until a poll first saw progress")
+    run_seconds: float | None = Field(None, description="First progress entry to completed_at")
+    total_seconds: float = Field(description="Wall time of invoke() until completion was observed")
+    progress_gaps: list[float] = Field(default_factory=list, description="Seconds between consecutive progress entries")
+    tool_calls: list[ToolCallTiming] = Field(default_factory=list)
+    polls: int = 0
+    wasted_polls: int = Field(0, description="Polls that saw no new progress and no status change")
+    transitions: list[StatusTransition] = Field(default_factory=list)
+
+    @property
+    def client_overhead_seconds(self) -> float | None:
+        """Time spent outside the server-side queue and run: create, polling and network."""
+        if self.queued_seconds is None or self.run_seconds is None:
+            return None
+        return max(0.0, self.total_seconds - self.queued_seconds - self.run_seconds)
+
+    def __str__(self):
+        def fmt(value: float | None) -> str:
+            return f"{value:.2f}s" if value is not None else "n/a"
+
+        slowest = max((t.seconds or 0.0 for t in self.tool_calls), default=None)
+        return (
+            f"Response {self.response_id} ({self.status}): total {fmt(self.total_seconds)}, "
+            f"create {fmt(self.create_seconds)}, queued {fmt(self.queued_seconds)}, "
+            f"run {fmt(self.run_seconds)}, overhead {fmt(self.client_overhead_seconds)}, "
+            f"{len(self.tool_calls)} tool calls (slowest {fmt(slowest)}), "
+            f"{self.polls} polls ({self.wasted_polls} wasted)"
+        )
+
+
 class CancelResponse(BaseModel):
     status: Literal["cancelled"]
     message: str
@@ -179,3 +241,54 @@ class ListFeedbackResponse(BaseModel):
     note: str = "Shows all feedback (consumed and unconsumed) for this response"
 
 
+class DurationStats(BaseModel):
+    """Distribution of a duration, in seconds."""
+
+    count: int
+    mean: float | None = None
+    p50: float | None = None
+    p95: float | None = None
+    p99: float | None = None
+    max: float | None = None
+
+
+class ResponseGroupStats(BaseModel):
+    """Latency and outcome statistics for one group of responses."""
+
+    key: str
+    total: int
+    status_counts: dict[str, int]
+    failure_rate: float | None = Field(None, description="Failed / (succeeded + failed + cancelled)")
+    queue_time: DurationStats = Field(description="created_at to first progress entry")
+    run_time: DurationStats = Field(description="First progress entry to completed_at")
+
+
+class ThroughputBucket(BaseModel):
+    """Responses created and completed within one time bucket."""
+
+    start: datetime
+    created: int
+    completed: int
+    failed: int
+
+
+class ResponseAnalytics(BaseModel):
+    """Aggregated latency, failure and throughput statistics over a date range."""
+
+    start: date
+    end: date
+    group_by: str | None = None
+    total: int
+    overall: ResponseGroupStats
+    groups: list[ResponseGroupStats] = Field(default_factory=list)
+    throughput: list[ThroughputBucket] = Field(default_factory=list)
+
+    def __str__(self):
+        lines = [f"Responses {self.start} - {self.end}: {self.total}"]
+        for stats in [self.overall, *self.groups]:
+            run = stats.run_time
+            rate = f"{stats.failure_rate:.1%}" if stats.failure_rate is not None else "n/a"
+            p50 = f"{run.p50:.1f}s" if run.p50 is not None else "n/a"
+            p95 = f"{run.p95:.1f}s" if run.p95 is not None else "n/a"
+            lines.append(f"  {stats.key}: {stats.total} responses, failure rate {rate}, run time p50 {p50} p95 {p95}")
+        return "\n".join(lines)
@@ -3,6 +3,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from .response import ResponseObject
+
 
 class ThreadObject(BaseModel):
     model_config = ConfigDict(json_encoders={datetime: lambda v: v.isoformat(), UUID: lambda v: str(v)})
@@ -29,3 +31,15 @@ class ThreadListResponse(BaseModel):
 
 class UpdateThreadRequest(BaseModel):
     title: str | None = Field(None, max_length=500, description="Thread title")
+
+
+class ThreadSyncResult(BaseModel):
+    """Outcome of an incremental thread synchronization."""
+
+    threads_checked: int
+    changed_threads: list[ThreadObject] = Field(default_factory=list)
+    new_responses: list[ResponseObject] = Field(default_factory=list)
+    removed_thread_ids: list[UUID] = Field(default_factory=list)
+
+    def __str__(self):
+        return f"Checked {self.threads_checked} threads: {len(self.changed_threads)} changed, {len(self.new_responses)} new responses, {len(self.removed_thread_ids)} removed"
@@ -1,14 +1,34 @@
+from typing import TYPE_CHECKING
 
-from .external_api_keys import ExternalApiKeysResource
-from .files import FilesResource
-from .integrations import IntegrationsResource
-from .mcp_servers import MCPServersResource
-from .model_preferences import ModelPreferencesResource
-from .responses import ResponsesResource
-from .skills import SkillsResource
-from .tenant import TenantResource
-from .threads import ThreadsResource
-from .users import UsersResource
+from .._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .external_api_keys import ExternalApiKeysResource
+    from .files import FilesResource
+    from .integrations import IntegrationsResource
+    from .mcp_servers import MCPServersResource
+    from .model_preferences import ModelPreferencesResource
+    from .responses import ResponsesResource
+    from .skills import SkillsResource
+    from .tenant import TenantResource
+    from .threads import ThreadsResource
+    from .users import UsersResource
+
+# Public names by submodule, imported on first access
+_SUBMODULES = {
+    ".external_api_keys": ("ExternalApiKeysResource",),
+    ".files": ("FilesResource",),
+    ".integrations": ("IntegrationsResource",),
+    ".mcp_servers": ("MCPServersResource",),
+    ".model_preferences": ("ModelPreferencesResource",),
+    ".responses": ("ResponsesResource",),
+    ".skills": ("SkillsResource",),
+    ".tenant": ("TenantResource",),
+    ".threads": ("ThreadsResource",),
+    ".users": ("UsersResource",),
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _SUBMODULES, globals())
 
 __all__ = [
     "ExternalApiKeysResource",
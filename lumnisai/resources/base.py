@@ -1,11 +1,15 @@
-
-from typing import TYPE_CHECKING, TypeVar
+import asyncio
+import itertools
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING, Any, TypeVar
 from uuid import UUID
 
 if TYPE_CHECKING:
     from .._transport import HTTPTransport
 
 T = TypeVar("T", bound="BaseResource")
+P = TypeVar("P")
 
 
 class BaseResource:
@@ -17,3 +21,28 @@ class BaseResource:
     @property
     def tenant_id(self) -> UUID | None:
         return self._tenant_id
+
+    @staticmethod
+    async def _iter_pages(
+        fetch_page: Callable[[Any], Awaitable[P]],
+        pages: Iterable[Any],
+        *,
+        concurrency: int = 4,
+    ) -> AsyncIterator[P]:
+        # Keep up to `concurrency` page requests in flight and yield results in
+        # page order, so callers can stream large listings with bounded memory
+        page_iter = iter(pages)
+        in_flight: deque[asyncio.Future[P]] = deque(
+            asyncio.ensure_future(fetch_page(page))
+            for page in itertools.islice(page_iter, max(1, concurrency))
+        )
+
+        try:
+            while in_flight:
+                result = await in_flight.popleft()
+                for page in itertools.islice(page_iter, 1):
+                    in_flight.append(asyncio.ensure_future(fetch_page(page)))
+                yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
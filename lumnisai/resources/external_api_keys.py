@@ -45,14 +45,13 @@ class ExternalApiKeysResource(BaseResource):
             expires_at=expires_at,
         )
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "POST",
             "/v1/external-api-keys",
             json=request_data.model_dump(exclude_none=True, mode="json"),
+            model=ExternalApiKeyResponse,
         )
 
-        return ExternalApiKeyResponse(**response_data)
-
     async def list(self) -> list[ExternalApiKeyResponse]:
         response_data = await self._transport.request(
             "GET",
@@ -65,13 +64,12 @@ class ExternalApiKeysResource(BaseResource):
         self,
         key_id: str | UUID,
     ) -> ExternalApiKeyResponse:
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             f"/v1/external-api-keys/{key_id}",
+            model=ExternalApiKeyResponse,
         )
 
-        return ExternalApiKeyResponse(**response_data)
-
     async def delete(
         self,
         provider: str | ApiProvider,
@@ -93,13 +91,12 @@ class ExternalApiKeysResource(BaseResource):
         return response_data
 
     async def get_mode(self) -> ApiKeyModeResponse:
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             "/v1/external-api-keys/mode",
+            model=ApiKeyModeResponse,
         )
 
-        return ApiKeyModeResponse(**response_data)
-
     async def set_mode(
         self,
         mode: str | ApiKeyMode,
@@ -108,10 +105,9 @@ class ExternalApiKeysResource(BaseResource):
             mode=mode.value if isinstance(mode, ApiKeyMode) else mode
         )
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "PATCH",
             "/v1/external-api-keys/mode",
             json=request_data.model_dump(),
+            model=ApiKeyModeResponse,
         )
-
-        return ApiKeyModeResponse(**response_data)
@@ -7,14 +7,21 @@ Supports both user-scoped and tenant-scoped files with semantic search capabilit
 
 from __future__ import annotations
 
+import math
+from collections import Counter
+from datetime import datetime
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO
 from uuid import UUID
 
+from pydantic import TypeAdapter
+
 from ..exceptions import (
     FileAccessDeniedError,
     FileNotFoundError,
     LumnisAIError,
+    NotFoundError,
+    ValidationError,
 )
 from ..models.files import (
     BulkDeleteRequest,
@@ -30,12 +37,24 @@ from ..models.files import (
     FileScopeUpdateRequest,
     FileSearchRequest,
     FileSearchResponse,
+    FileStatisticsResponse,
     FileUploadResponse,
     ProcessingStatus,
     ProcessingStatusResponse,
 )
 from .base import BaseResource
 
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+# Status codes indicating the server has no statistics endpoint
+_STATISTICS_UNAVAILABLE_STATUSES = {404, 405}
+
+# Files in these states have finished processing, so updated_at marks completion
+_PROCESSED_STATUSES = {
+    ProcessingStatus.COMPLETED.value,
+    ProcessingStatus.PARTIAL_SUCCESS.value,
+}
+
 
 class FilesResource(BaseResource):
     """
@@ -181,14 +200,23 @@ class FilesResource(BaseResource):
             data["tags"] = ",".join(tags_list)
 
         # Make request
-        response_data = await self._transport.request(
-            "POST",
-            "/v1/files/upload",
-            files=files,
-            data=data,
-        )
+        with self._transport.tracer.span(
+            "lumnisai.files.upload",
+            file_name=file_name,
+            file_size=len(file_bytes),
+            scope=scope.value,
+            user_id=user_id_str,
+        ) as span:
+            uploaded = await self._transport.request(
+                "POST",
+                "/v1/files/upload",
+                files=files,
+                data=data,
+                model=FileUploadResponse,
+            )
+            span.set_attribute("lumnisai.file_id", str(uploaded.file_id))
 
-        return FileUploadResponse(**response_data)
+        return uploaded
 
     async def bulk_upload(
         self,
@@ -261,15 +289,14 @@ class FilesResource(BaseResource):
             data["tags"] = ",".join(tags_list)
 
         # Make request
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "POST",
             "/v1/files/bulk-upload",
             files=files_data,
             data=data,
+            model=BulkUploadResponse,
         )
 
-        return BulkUploadResponse(**response_data)
-
     # ========================================================================
     # FILE RETRIEVAL METHODS
     # ========================================================================
@@ -308,12 +335,12 @@ class FilesResource(BaseResource):
             params["user_id"] = str(user_id)
 
         try:
-            response_data = await self._transport.request(
+            return await self._transport.request(
                 "GET",
                 f"/v1/files/{file_id}",
                 params=params,
+                model=FileMetadata,
             )
-            return FileMetadata(**response_data)
         except LumnisAIError as e:
             self._handle_file_error(e)
 
@@ -357,7 +384,36 @@ class FilesResource(BaseResource):
             for file in response.files:
                 print(f"{file.file_name} - {file.file_size} bytes")
         """
-        params = {
+        params = self._list_params(
+            user_id=user_id,
+            scope=scope,
+            file_type=file_type,
+            status=status,
+            tags=tags,
+            page=page,
+            limit=limit,
+        )
+
+        return await self._transport.request(
+            "GET",
+            "/v1/files/",
+            params=params,
+            model=FileListResponse,
+        )
+
+    @staticmethod
+    def _list_params(
+        *,
+        user_id: UUID | str | None = None,
+        scope: FileScope | None = None,
+        file_type: str | None = None,
+        status: ProcessingStatus | None = None,
+        tags: list[str] | str | None = None,
+        page: int = 1,
+        limit: int = 20,
+    ) -> dict[str, Any]:
+        """Build query parameters for the file listing endpoint."""
+        params: dict[str, Any] = {
             "page": page,
             "limit": min(limit, 100),
         }
@@ -376,13 +432,7 @@ class FilesResource(BaseResource):
             else:
                 params["tags"] = ",".join(tags)
 
-        response_data = await self._transport.request(
-            "GET",
-            "/v1/files/",
-            params=params,
-        )
-
-        return FileListResponse(**response_data)
+        return params
 
     async def get_content(
         self,
@@ -432,14 +482,13 @@ class FilesResource(BaseResource):
         if end_line:
             params["end_line"] = end_line
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             f"/v1/files/{file_id}/content",
             params=params,
+            model=FileContentResponse,
         )
 
-        return FileContentResponse(**response_data)
-
     async def download(
         self,
         file_id: UUID | str,
@@ -556,13 +605,18 @@ class FilesResource(BaseResource):
             tags=tags_list,
         )
 
-        response_data = await self._transport.request(
-            "POST",
-            "/v1/files/search",
-            json=request_data.model_dump(exclude_none=True, mode="json"),
-        )
+        with self._transport.tracer.span(
+            "lumnisai.files.search", limit=request_data.limit, user_id=user_id
+        ) as span:
+            results = await self._transport.request(
+                "POST",
+                "/v1/files/search",
+                content=request_data.model_dump_json(exclude_none=True),
+                model=FileSearchResponse,
+            )
+            span.set_attribute("lumnisai.result_count", len(results.results))
 
-        return FileSearchResponse(**response_data)
+        return results
 
     # ========================================================================
     # FILE MANAGEMENT METHODS
@@ -602,14 +656,13 @@ class FilesResource(BaseResource):
             user_id=UUID(user_id) if user_id else None,
         )
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "PATCH",
             f"/v1/files/{file_id}/scope",
             json=request_data.model_dump(exclude_none=True, mode="json"),
+            model=FileMetadata,
         )
 
-        return FileMetadata(**response_data)
-
     async def delete(
         self,
         file_id: UUID | str,
@@ -689,15 +742,14 @@ class FilesResource(BaseResource):
         if user_id:
             params["user_id"] = str(user_id)
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "DELETE",
             "/v1/files/bulk",
             json=request_data.model_dump(exclude_none=True, mode="json"),
             params=params,
+            model=BulkDeleteResponse,
         )
 
-        return BulkDeleteResponse(**response_data)
-
     # ========================================================================
     # FILE PROCESSING STATUS METHODS
     # ========================================================================
@@ -732,10 +784,158 @@ class FilesResource(BaseResource):
         if user_id:
             params["user_id"] = str(user_id)
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             f"/v1/files/{file_id}/status",
             params=params,
+            model=ProcessingStatusResponse,
         )
 
-        return ProcessingStatusResponse(**response_data)
+    # ========================================================================
+    # FILE STATISTICS METHODS
+    # ========================================================================
+
+    async def statistics(
+        self,
+        *,
+        user_id: UUID | str | None = None,
+        scope: FileScope | None = None,
+        page_size: int = 100,
+        concurrency: int = 4,
+    ) -> FileStatisticsResponse:
+        """
+        Get aggregated storage statistics for files.
+
+        Uses the server-side statistics endpoint when it is available. Otherwise
+        the statistics are computed client-side by fetching all file listing
+        pages concurrently and aggregating them page by page, so memory stays
+        flat regardless of how many files the tenant has.
+
+        Args:
+            user_id: Restrict statistics to files accessible to this user
+            scope: Restrict statistics to files with this scope
+            page_size: Number of files per listing page (max 100)
+            concurrency: Maximum number of listing pages fetched at once
+
+        Returns:
+            FileStatisticsResponse with totals, breakdowns and averages.
+            storage_usage_percentage is only set by the server endpoint.
+
+        Example:
+            stats = await client.files.statistics()
+            print(f"{stats.total_files} files, {stats.total_size_bytes} bytes")
+            print(stats.files_by_status)
+        """
+        params: dict[str, Any] = {}
+        if user_id:
+            params["user_id"] = str(user_id)
+        if scope:
+            params["scope"] = scope.value
+
+        try:
+            return await self._transport.request(
+                "GET",
+                "/v1/files/statistics",
+                params=params,
+                model=FileStatisticsResponse,
+            )
+        except (NotFoundError, ValidationError) as e:
+            if e.status_code not in _STATISTICS_UNAVAILABLE_STATUSES:
+                raise
+
+        return await self._aggregate_statistics(
+            user_id=user_id,
+            scope=scope,
+            page_size=page_size,
+            concurrency=concurrency,
+        )
+
+    async def _aggregate_statistics(
+        self,
+        *,
+        user_id: UUID | str | None,
+        scope: FileScope | None,
+        page_size: int,
+        concurrency: int,
+    ) -> FileStatisticsResponse:
+        """Compute file statistics client-side from the raw listing pages."""
+        page_size = max(1, min(page_size, 100))
+
+        async def fetch_page(page: int) -> dict[str, Any]:
+            return await self._transport.request(
+                "GET",
+                "/v1/files/",
+                params=self._list_params(
+                    user_id=user_id, scope=scope, page=page, limit=page_size
+                ),
+            )
+
+        # Only primitive columns are kept; FileMetadata models are never built
+        total_files = 0
+        total_size_bytes = 0
+        processing_seconds_total = 0.0
+        processing_samples = 0
+        files_by_type: Counter[str] = Counter()
+        files_by_status: Counter[str] = Counter()
+        files_by_scope: Counter[str] = Counter()
+
+        def aggregate(page_data: dict[str, Any]) -> None:
+            nonlocal total_files, total_size_bytes
+            nonlocal processing_seconds_total, processing_samples
+
+            for item in page_data.get("files", []):
+                total_files += 1
+                total_size_bytes += item.get("file_size") or 0
+                files_by_type[item.get("file_type") or "unknown"] += 1
+                status = item.get("processing_status") or "unknown"
+                files_by_status[status] += 1
+                files_by_scope[item.get("file_scope") or "unknown"] += 1
+
+                if status in _PROCESSED_STATUSES:
+                    seconds = _processing_seconds(item)
+                    if seconds is not None:
+                        processing_seconds_total += seconds
+                        processing_samples += 1
+
+        first_page = await fetch_page(1)
+        aggregate(first_page)
+
+        total_count = first_page.get("total_count", 0)
+        page_count = math.ceil(total_count / page_size)
+        async for page_data in self._iter_pages(
+            fetch_page, range(2, page_count + 1), concurrency=concurrency
+        ):
+            aggregate(page_data)
+
+        return FileStatisticsResponse(
+            total_files=total_files,
+            total_size_bytes=total_size_bytes,
+            files_by_type=dict(files_by_type),
+            files_by_status=dict(files_by_status),
+            files_by_scope=dict(files_by_scope),
+            average_file_size_bytes=(
+                total_size_bytes / total_files if total_files else 0.0
+            ),
+            average_processing_time_seconds=(
+                processing_seconds_total / processing_samples
+                if processing_samples
+                else None
+            ),
+            storage_usage_percentage=None,
+        )
+
+
+def _processing_seconds(item: dict[str, Any]) -> float | None:
+    """Processing duration of a finished file, from its raw listing entry."""
+    created_at = item.get("created_at")
+    updated_at = item.get("updated_at")
+    if not created_at or not updated_at:
+        return None
+    try:
+        elapsed = (
+            _DATETIME_ADAPTER.validate_python(updated_at)
+            - _DATETIME_ADAPTER.validate_python(created_at)
+        ).total_seconds()
+    except ValueError:
+        return None
+    return elapsed if elapsed >= 0 else None
@@ -52,14 +52,13 @@ class IntegrationsResource(BaseResource):
             connection_params=connection_params,
         )
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "POST",
             "/v1/integrations/connections/initiate",
             json=request_data.model_dump(exclude_none=True),
+            model=InitiateConnectionResponse,
         )
 
-        return InitiateConnectionResponse(**response_data)
-
     async def get_connection_status(
         self,
         user_id: str,
@@ -74,13 +73,12 @@ class IntegrationsResource(BaseResource):
         Returns:
             ConnectionStatus containing app status and connection details
         """
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             f"/v1/integrations/connections/{user_id}/{app_name.upper()}",
+            model=ConnectionStatus,
         )
 
-        return ConnectionStatus(**response_data)
-
     async def list_connections(
         self,
         user_id: str,
@@ -100,14 +98,13 @@ class IntegrationsResource(BaseResource):
         if app_filter:
             params["app_filter"] = app_filter
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             f"/v1/integrations/connections/{user_id}",
             params=params,
+            model=ListConnectionsResponse,
         )
 
-        return ListConnectionsResponse(**response_data)
-
     async def callback(
         self,
         *,
@@ -162,14 +159,13 @@ class IntegrationsResource(BaseResource):
             app_filter=[app.upper() for app in app_filter] if app_filter else None,
         )
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "POST",
             "/v1/integrations/tools",
             json=request_data.model_dump(exclude_none=True),
+            model=GetToolsResponse,
         )
 
-        return GetToolsResponse(**response_data)
-
     async def get_non_oauth_required_fields(
         self,
         app_name: str,
@@ -208,14 +204,13 @@ class IntegrationsResource(BaseResource):
         """
         params = {"include_available": include_available}
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             "/v1/integrations/apps",
             params=params,
+            model=ListAppsResponse,
         )
 
-        return ListAppsResponse(**response_data)
-
     async def is_app_enabled(
         self,
         app_name: str,
@@ -228,13 +223,12 @@ class IntegrationsResource(BaseResource):
         Returns:
             AppEnabledResponse containing enabled status
         """
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             f"/v1/integrations/apps/{app_name}/enabled",
+            model=AppEnabledResponse,
         )
 
-        return AppEnabledResponse(**response_data)
-
     async def set_app_enabled(
         self,
         app_name: str,
@@ -252,10 +246,9 @@ class IntegrationsResource(BaseResource):
         """
         params = {"enabled": enabled}
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "PUT",
             f"/v1/integrations/apps/{app_name}",
             params=params,
+            model=SetAppEnabledResponse,
         )
-
-        return SetAppEnabledResponse(**response_data)
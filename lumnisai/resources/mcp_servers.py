@@ -67,14 +67,13 @@ class MCPServersResource(BaseResource):
             headers=headers,
         )
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "POST",
             "/v1/mcp-servers",
             json=create_request.model_dump(exclude_none=True),
+            model=MCPServer,
         )
 
-        return MCPServer(**response_data)
-
     @overload
     async def list(
         self,
@@ -119,14 +118,13 @@ class MCPServersResource(BaseResource):
         if is_active is not None:
             params["is_active"] = str(is_active).lower()
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             "/v1/mcp-servers",
             params=params,
+            model=MCPServerListResponse,
         )
 
-        return MCPServerListResponse(**response_data)
-
     async def get(self, server_id: str | UUID) -> MCPServer:
         """Retrieve a specific MCP server configuration.
         
@@ -139,13 +137,12 @@ class MCPServersResource(BaseResource):
         Raises:
             LumnisNotFoundError: If server not found
         """
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             f"/v1/mcp-servers/{server_id}",
+            model=MCPServer,
         )
 
-        return MCPServer(**response_data)
-
     async def update(
         self,
         server_id: str | UUID,
@@ -187,14 +184,13 @@ class MCPServersResource(BaseResource):
             is_active=is_active,
         )
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "PATCH",
             f"/v1/mcp-servers/{server_id}",
             json=update_request.model_dump(exclude_none=True),
+            model=MCPServer,
         )
 
-        return MCPServer(**response_data)
-
     async def delete(self, server_id: str | UUID) -> None:
         """Permanently delete an MCP server configuration.
         
@@ -223,13 +219,12 @@ class MCPServersResource(BaseResource):
         Raises:
             LumnisNotFoundError: If server not found
         """
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             f"/v1/mcp-servers/{server_id}/tools",
+            model=MCPToolListResponse,
         )
 
-        return MCPToolListResponse(**response_data)
-
     async def test_connection(self, server_id: str | UUID) -> MCPTestConnectionResponse:
         """Test connection to an MCP server.
         
@@ -244,9 +239,8 @@ class MCPServersResource(BaseResource):
         Raises:
             LumnisNotFoundError: If server not found
         """
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "POST",
             f"/v1/mcp-servers/{server_id}/test",
+            model=MCPTestConnectionResponse,
         )
-
-        return MCPTestConnectionResponse(**response_data)
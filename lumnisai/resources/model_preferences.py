@@ -27,14 +27,13 @@ class ModelPreferencesResource(BaseResource):
         """
         params = {"include_defaults": include_defaults}
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             "/v1/model-preferences",
             params=params,
+            model=ModelPreferencesResponse,
         )
 
-        return ModelPreferencesResponse(**response_data)
-
     async def update_bulk(
         self,
         preferences: dict[str | ModelType, ModelPreferenceCreate | dict[str, str]]
@@ -70,13 +69,12 @@ class ModelPreferencesResource(BaseResource):
 
         request_data = UpdateModelPreferencesRequest(preferences=typed_preferences)
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "PUT",
             "/v1/model-preferences",
             json=request_data.model_dump(mode="json"),
+            model=ModelPreferencesResponse,
         )
 
-        return ModelPreferencesResponse(**response_data)
-
 
 
@@ -1,10 +1,17 @@
 
-from datetime import date
-from typing import Any, Literal
+import asyncio
+import math
+from collections import deque
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Literal
 from urllib.parse import urlparse
 from uuid import UUID
 
-from ..constants import DEFAULT_LIMIT
+from pydantic import TypeAdapter
+
+from ..analytics import GroupBy, ResponseColumns
+from ..constants import DEFAULT_LIMIT, MAX_LIMIT
 from ..exceptions import LocalFileNotSupported
 from ..models import (
     CancelResponse,
@@ -14,14 +21,36 @@ from ..models import (
     CreateResponseResponse,
     ListFeedbackResponse,
     Message,
+    ResponseAnalytics,
     ResponseObject,
     ResponseListResponse,
 )
 from .base import BaseResource
 
+if TYPE_CHECKING:
+    from .._transport import HTTPTransport
+    from ..store import ResponseStore
+
+_DATETIME_ADAPTER = TypeAdapter(datetime)
+
+ResponseStatus = Literal["queued", "in_progress", "succeeded", "failed", "cancelled"]
+
 
 class ResponsesResource(BaseResource):
 
+    def __init__(
+        self,
+        transport: "HTTPTransport",
+        *,
+        tenant_id: UUID | None = None,
+        store: "ResponseStore | None" = None,
+        store_scope: str = "",
+    ):
+        super().__init__(transport, tenant_id=tenant_id)
+        self._store = store
+        # Stored rows are only shared between clients of the same scope
+        self._store_scope = store_scope
+
     def _validate_file_reference(self, file_ref: str) -> None:
         # Allow artifact IDs first (before any other checks)
         if file_ref.startswith("artifact_"):
@@ -131,46 +160,53 @@ class ResponsesResource(BaseResource):
                     request_data.agent_config = agent_cfg
 
         # Make request
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "POST",
             "/v1/responses",
-            json=request_data.model_dump(exclude_none=True, mode="json"),
+            content=request_data.model_dump_json(exclude_none=True),
             idempotency_key=idempotency_key,
+            model=CreateResponseResponse,
         )
 
-        return CreateResponseResponse(**response_data)
-
     async def get(
         self,
         response_id: str | UUID,
         *,
         wait: int | None = None,
     ) -> ResponseObject:
+        # Terminal responses are immutable, so a stored copy is authoritative
+        if self._store is not None:
+            stored = self._store.get(response_id, scope=self._store_scope)
+            if stored is not None:
+                return stored
+
         # Build query params
         params = {}
         if wait is not None:
             params["wait"] = wait
 
         # Make request
-        response_data = await self._transport.request(
+        response = await self._transport.request(
             "GET",
             f"/v1/responses/{response_id}",
             params=params,
+            model=ResponseObject,
         )
 
-        return ResponseObject(**response_data)
+        if self._store is not None:
+            self._store.put(response, scope=self._store_scope)
+        return response
 
     async def cancel(
         self,
         response_id: str | UUID,
     ) -> CancelResponse:
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "POST",
             f"/v1/responses/{response_id}/cancel",
+            model=CancelResponse,
         )
 
-        return CancelResponse(**response_data)
-
     async def list_artifacts(
         self,
         response_id: str | UUID,
@@ -190,7 +226,7 @@ class ResponsesResource(BaseResource):
         self,
         *,
         user_id: str | UUID | None = None,
-        status: Literal["queued", "in_progress", "succeeded", "failed", "cancelled"] | None = None,
+        status: ResponseStatus | None = None,
         start_date: date | None = None,
         end_date: date | None = None,
         limit: int = DEFAULT_LIMIT,
@@ -210,7 +246,37 @@ class ResponsesResource(BaseResource):
         Returns:
             ResponseListResponse containing paginated results
         """
-        params = {
+        params = self._list_params(
+            user_id=user_id,
+            status=status,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset,
+        )
+
+        result = await self._transport.request(
+            "GET",
+            "/v1/responses",
+            params=params,
+            model=ResponseListResponse,
+        )
+
+        if self._store is not None:
+            self._store.put_many(result.responses, scope=self._store_scope)
+        return result
+
+    @staticmethod
+    def _list_params(
+        *,
+        user_id: str | UUID | None = None,
+        status: ResponseStatus | None = None,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        limit: int = DEFAULT_LIMIT,
+        offset: int = 0,
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {
             "limit": limit,
             "offset": offset,
         }
@@ -223,14 +289,185 @@ class ResponsesResource(BaseResource):
             params["start_date"] = start_date.isoformat()
         if end_date is not None:
             params["end_date"] = end_date.isoformat()
+
+        return params
+
+    async def scan(
+        self,
+        start: date,
+        end: date,
+        *,
+        shards: int = 4,
+        user_id: str | UUID | None = None,
+        status: ResponseStatus | None = None,
+        max_window_size: int = 1000,
+    ) -> AsyncIterator[ResponseObject]:
+        """
+        Stream all responses created between two dates, ordered by created_at.
         
-        response_data = await self._transport.request(
-            "GET",
-            "/v1/responses",
-            params=params,
-        )
+        The date range is split into windows that are paginated concurrently
+        (up to `shards` windows at a time) instead of walking the whole range
+        with ever deeper offsets. Windows holding more than `max_window_size`
+        responses are split in half until they fit or cover a single day.
+        Windows do not overlap, so emitting them in chronological order with
+        each window sorted yields a single stream ordered by created_at.
         
-        return ResponseListResponse(**response_data)
+        Args:
+            start: First day of the range (inclusive)
+            end: Last day of the range (inclusive)
+            shards: Maximum number of date windows fetched concurrently
+            user_id: Filter by user ID
+            status: Filter by response status
+            max_window_size: Windows with more responses than this are split
+
+        Yields:
+            ResponseObject for every response in the range, oldest first
+
+        Example:
+            async for response in client.responses.scan(date(2025, 1, 1), date(2025, 1, 31), shards=8):
+                print(response.response_id, response.created_at)
+        """
+        async for item in self._scan_raw(
+            start,
+            end,
+            shards=shards,
+            user_id=user_id,
+            status=status,
+            max_window_size=max_window_size,
+        ):
+            yield ResponseObject(**item)
+
+    async def _scan_raw(
+        self,
+        start: date,
+        end: date,
+        *,
+        shards: int = 4,
+        user_id: str | UUID | None = None,
+        status: ResponseStatus | None = None,
+        max_window_size: int = 1000,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Like scan(), but yields the raw response dicts without building models."""
+        if isinstance(start, datetime):
+            start = start.date()
+        if isinstance(end, datetime):
+            end = end.date()
+        if end < start:
+            return
+        shards = max(1, shards)
+
+        async def fetch_window(window: tuple[date, date]) -> tuple[date, date] | list[dict[str, Any]]:
+            window_start, window_end = window
+
+            async def fetch_page(offset: int) -> dict[str, Any]:
+                return await self._transport.request(
+                    "GET",
+                    "/v1/responses",
+                    params=self._list_params(
+                        user_id=user_id,
+                        status=status,
+                        start_date=window_start,
+                        end_date=window_end,
+                        limit=MAX_LIMIT,
+                        offset=offset,
+                    ),
+                )
+
+            first_page = await fetch_page(0)
+            total = first_page["total"]
+            if total > max_window_size and window_end > window_start:
+                # Too dense: hand the window back to be split
+                return window
+
+            items = first_page["responses"]
+            offsets = range(MAX_LIMIT, math.ceil(total / MAX_LIMIT) * MAX_LIMIT, MAX_LIMIT)
+            async for page in self._iter_pages(fetch_page, offsets, concurrency=2):
+                items.extend(page["responses"])
+
+            # Offsets can shift if responses are created while paginating
+            unique = {item["response_id"]: item for item in items}
+            return sorted(
+                unique.values(),
+                key=lambda item: _DATETIME_ADAPTER.validate_python(item["created_at"]),
+            )
+
+        # Windows in chronological order; the first `shards` entries are running
+        pending: deque[tuple[date, date] | asyncio.Future] = deque(
+            _split_date_range(start, end, shards)
+        )
+        try:
+            while pending:
+                for i in range(min(shards, len(pending))):
+                    if isinstance(pending[i], tuple):
+                        pending[i] = asyncio.ensure_future(fetch_window(pending[i]))
+
+                result = await pending.popleft()
+                if isinstance(result, tuple):
+                    pending.extendleft(reversed(_split_date_range(*result, 2)))
+                    continue
+                for item in result:
+                    yield item
+        finally:
+            for entry in pending:
+                if isinstance(entry, asyncio.Future):
+                    entry.cancel()
+
+    async def analytics(
+        self,
+        start: date,
+        end: date,
+        *,
+        group_by: GroupBy | None = None,
+        bucket: timedelta = timedelta(hours=1),
+        shards: int = 4,
+        user_id: str | UUID | None = None,
+        status: ResponseStatus | None = None,
+    ) -> ResponseAnalytics:
+        """
+        Aggregate latency, failure rate and throughput over a date range.
+
+        Responses are fetched with the same sharded listing as scan() and only
+        the timestamps, status and grouping key of each are kept, in compact
+        columns, so very large ranges can be analyzed without holding the
+        responses themselves. Percentiles are computed with numpy when it is
+        installed.
+
+        Queue time is measured from created_at to the first progress entry and
+        run time from the first progress entry to completed_at; responses that
+        finished without progress have no run time. Statuses the SDK does not
+        know are counted as "unknown".
+
+        Args:
+            start: First day of the range (inclusive)
+            end: Last day of the range (inclusive)
+            group_by: Break statistics down by "user", "status" or "model"
+            bucket: Width of the throughput buckets
+            shards: Maximum number of date windows fetched concurrently
+            user_id: Filter by user ID
+            status: Filter by response status
+
+        Returns:
+            ResponseAnalytics with overall and per-group statistics
+
+        Example:
+            stats = await client.responses.analytics(date(2025, 1, 1), date(2025, 1, 31), group_by="model")
+            print(stats)
+        """
+        if isinstance(start, datetime):
+            start = start.date()
+        if isinstance(end, datetime):
+            end = end.date()
+
+        columns = ResponseColumns(group_by)
+        async for item in self._scan_raw(
+            start,
+            end,
+            shards=shards,
+            user_id=user_id,
+            status=status,
+        ):
+            columns.append(item)
+        return columns.summarize(start, end, bucket=bucket)
 
     async def create_feedback(
         self,
@@ -272,13 +509,12 @@ class ResponsesResource(BaseResource):
         )
         
         # Make request
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "POST",
             f"/v1/responses/{response_id}/feedback",
-            json=request_data.model_dump(exclude_none=True, mode="json"),
+            content=request_data.model_dump_json(exclude_none=True),
+            model=CreateFeedbackResponse,
         )
-        
-        return CreateFeedbackResponse(**response_data)
 
     async def list_feedback(
         self,
@@ -305,10 +541,23 @@ class ResponsesResource(BaseResource):
             params["progress_id"] = str(progress_id)
         
         # Make request
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             f"/v1/responses/{response_id}/feedback",
             params=params,
+            model=ListFeedbackResponse,
         )
-        
-        return ListFeedbackResponse(**response_data)
+
+
+def _split_date_range(start: date, end: date, parts: int) -> list[tuple[date, date]]:
+    """Split an inclusive date range into at most `parts` contiguous windows."""
+    days = (end - start).days + 1
+    parts = min(parts, days)
+    windows = []
+    window_start = start
+    for i in range(parts):
+        window_days = days // parts + (1 if i < days % parts else 0)
+        window_end = window_start + timedelta(days=window_days - 1)
+        windows.append((window_start, window_end))
+        window_start = window_end + timedelta(days=1)
+    return windows
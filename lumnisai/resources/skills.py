@@ -34,13 +34,13 @@ class SkillsResource(BaseResource):
         if user_id:
             params["user_id"] = str(user_id)
             
-        response = await self._client._request(
-            method="POST",
-            url=f"{self._client._config.base_url}/v1/skills",
+        return await self._transport.request(
+            "POST",
+            "/v1/skills",
             json=skill_data.model_dump(exclude_none=True),
             params=params,
+            model=SkillGuideline,
         )
-        return SkillGuideline.model_validate(response)
 
     async def list(
         self,
@@ -70,12 +70,12 @@ class SkillsResource(BaseResource):
         if is_active is not None:
             params["is_active"] = is_active
             
-        response = await self._client._request(
-            method="GET",
-            url=f"{self._client._config.base_url}/v1/skills",
+        return await self._transport.request(
+            "GET",
+            "/v1/skills",
             params=params,
+            model=SkillGuidelineListResponse,
         )
-        return SkillGuidelineListResponse.model_validate(response)
 
     async def get(self, skill_id: str | UUID) -> SkillGuideline:
         """Get a skill guideline by ID.
@@ -86,11 +86,11 @@ class SkillsResource(BaseResource):
         Returns:
             The skill guideline
         """
-        response = await self._client._request(
-            method="GET",
-            url=f"{self._client._config.base_url}/v1/skills/{skill_id}",
+        return await self._transport.request(
+            "GET",
+            f"/v1/skills/{skill_id}",
+            model=SkillGuideline,
         )
-        return SkillGuideline.model_validate(response)
 
     async def update(
         self,
@@ -107,12 +107,12 @@ class SkillsResource(BaseResource):
         Returns:
             The updated skill guideline
         """
-        response = await self._client._request(
-            method="PUT",
-            url=f"{self._client._config.base_url}/v1/skills/{skill_id}",
+        return await self._transport.request(
+            "PUT",
+            f"/v1/skills/{skill_id}",
             json=updates.model_dump(exclude_none=True),
+            model=SkillGuideline,
         )
-        return SkillGuideline.model_validate(response)
 
     async def delete(self, skill_id: str | UUID) -> None:
         """Delete a skill guideline.
@@ -120,7 +120,7 @@ class SkillsResource(BaseResource):
         Args:
             skill_id: The skill ID to delete
         """
-        await self._client._request(
-            method="DELETE",
-            url=f"{self._client._config.base_url}/v1/skills/{skill_id}",
+        await self._transport.request(
+            "DELETE",
+            f"/v1/skills/{skill_id}",
         )
\ No newline at end of file
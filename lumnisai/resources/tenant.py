@@ -13,5 +13,4 @@ class TenantResource(BaseResource):
             # Use tenant context from API key authentication
             path = "/v1/tenant"
 
-        response_data = await self._transport.request("GET", path)
-        return TenantInfo(**response_data)
+        return await self._transport.request("GET", path, model=TenantInfo)
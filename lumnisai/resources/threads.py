@@ -1,18 +1,46 @@
 
+import asyncio
 import builtins
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
 from uuid import UUID
 
+from ..exceptions import NotFoundError
 from ..models import (
     ResponseObject,
     ThreadListResponse,
     ThreadObject,
+    ThreadSyncResult,
     UpdateThreadRequest,
 )
+from ..store import TERMINAL_STATUSES
 from .base import BaseResource
 
+if TYPE_CHECKING:
+    from .._transport import HTTPTransport
+    from ..export import ExportResult
+    from ..store import ResponseStore, ThreadWatermark
+
+# Maximum page size accepted by the thread listing endpoints
+_SYNC_PAGE_SIZE = 100
+
 
 class ThreadsResource(BaseResource):
 
+    def __init__(
+        self,
+        transport: "HTTPTransport",
+        *,
+        tenant_id: UUID | None = None,
+        store: "ResponseStore | None" = None,
+        store_scope: str = "",
+    ):
+        super().__init__(transport, tenant_id=tenant_id)
+        self._store = store
+        # Stored rows are only shared between clients of the same scope
+        self._store_scope = store_scope
+
     async def list(
         self,
         *,
@@ -24,25 +52,23 @@ class ThreadsResource(BaseResource):
         if user_id:
             params["user_id"] = str(user_id)
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             "/v1/threads",
             params=params,
+            model=ThreadListResponse,
         )
 
-        return ThreadListResponse(**response_data)
-
     async def get(
         self,
         thread_id: str | UUID,
     ) -> ThreadObject:
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             f"/v1/threads/{thread_id}",
+            model=ThreadObject,
         )
 
-        return ThreadObject(**response_data)
-
     async def get_responses(
         self,
         thread_id: str | UUID,
@@ -56,7 +82,10 @@ class ThreadsResource(BaseResource):
             params={"limit": limit, "offset": offset},
         )
 
-        return [ResponseObject(**item) for item in response_data]
+        responses = [ResponseObject(**item) for item in response_data]
+        if self._store is not None:
+            self._store.put_many(responses, scope=self._store_scope)
+        return responses
 
     async def update(
         self,
@@ -66,10 +95,182 @@ class ThreadsResource(BaseResource):
     ) -> ThreadObject:
         request_data = UpdateThreadRequest(title=title)
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "PATCH",
             f"/v1/threads/{thread_id}",
             json=request_data.model_dump(exclude_none=True),
+            model=ThreadObject,
+        )
+
+    async def export(
+        self,
+        destination: str | Path,
+        *,
+        user_id: str | UUID | None = None,
+        format: Literal["jsonl", "parquet"] = "jsonl",
+        concurrency: int = 4,
+        checkpoint: str | Path | None = None,
+        overwrite: bool = False,
+    ) -> "ExportResult":
+        """
+        Stream every response of every thread to JSON Lines or Parquet.
+
+        Memory stays flat regardless of export size, and passing a checkpoint
+        path makes an interrupted export resumable. Existing output is only
+        replaced when `overwrite` is set. See lumnisai.export.
+        """
+        from ..export import export_threads
+
+        return await export_threads(
+            self,
+            destination,
+            user_id=user_id,
+            format=format,
+            concurrency=concurrency,
+            checkpoint=checkpoint,
+            overwrite=overwrite,
+        )
+
+    async def sync(
+        self,
+        user_id: str | UUID | None = None,
+        *,
+        concurrency: int = 4,
+    ) -> ThreadSyncResult:
+        """
+        Bring the local thread snapshot up to date, fetching only what changed.
+
+        Every thread is listed, but responses are fetched only for threads whose
+        response_count or last_response_at moved since the previous sync, and
+        only beyond the responses already stored. Responses that were still
+        running at the previous sync are fetched again until they are terminal.
+        Responses of a thread are assumed to be returned oldest first.
+        A previously synced thread missing from the listing is looked up
+        before it is dropped from the snapshot, since threads created or
+        deleted during the listing shift its pages.
+
+        Requires the client to be configured with a response_store; the snapshot
+        of each user_id (or the whole tenant when None) is kept separately.
+
+        Args:
+            user_id: Synchronize the threads of this user
+            concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            ThreadSyncResult with the changed threads and their new responses
+        """
+        if self._store is None:
+            raise ValueError(
+                "threads.sync() requires a response store. "
+                "Pass response_store=... when creating the client."
+            )
+
+        snapshot_key = f"{self._store_scope}:{user_id or ''}"
+        watermarks = self._store.thread_watermarks(snapshot_key)
+
+        # List every thread; only the first page is needed to learn the total
+        first_page = await self.list(user_id=user_id, limit=_SYNC_PAGE_SIZE)
+        threads = builtins.list(first_page.threads)
+        page_count = math.ceil(first_page.total / _SYNC_PAGE_SIZE)
+
+        async def fetch_thread_page(page: int) -> ThreadListResponse:
+            return await self.list(
+                user_id=user_id, limit=_SYNC_PAGE_SIZE, offset=page * _SYNC_PAGE_SIZE
+            )
+
+        async for page in self._iter_pages(
+            fetch_thread_page, range(1, page_count), concurrency=concurrency
+        ):
+            threads.extend(page.threads)
+
+        # Offset pages are not a snapshot: threads created or deleted while
+        # they are fetched shift the later pages, so a thread can be listed
+        # twice, or be missing from the listing without having been deleted
+        threads = builtins.list({str(thread.thread_id): thread for thread in threads}.values())
+        listed_ids = {str(thread.thread_id) for thread in threads}
+        missing_ids = [thread_id for thread_id in watermarks if thread_id not in listed_ids]
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def check_missing(thread_id: str) -> ThreadObject | None:
+            async with semaphore:
+                try:
+                    return await self.get(thread_id)
+                except NotFoundError:
+                    return None
+
+        # Only threads the service no longer has are removed; the others are
+        # synced like the rest of the listing
+        removed_ids: builtins.list[str] = []
+        for thread_id, thread in zip(
+            missing_ids, await asyncio.gather(*(check_missing(thread_id) for thread_id in missing_ids))
+        ):
+            if thread is None:
+                removed_ids.append(thread_id)
+            else:
+                threads.append(thread)
+
+        changed = [
+            thread for thread in threads
+            if _thread_changed(thread, watermarks.get(str(thread.thread_id)))
+        ]
+
+        async def sync_thread(thread: ThreadObject) -> builtins.list[ResponseObject] | None:
+            watermark = watermarks.get(str(thread.thread_id))
+            synced_count = watermark.synced_count if watermark else 0
+            offset = synced_count
+            fetched: builtins.list[ResponseObject] = []
+
+            async with semaphore:
+                while True:
+                    try:
+                        page = await self.get_responses(
+                            thread.thread_id, limit=_SYNC_PAGE_SIZE, offset=offset
+                        )
+                    except NotFoundError:
+                        # Deleted since it was listed
+                        return None
+                    fetched.extend(page)
+                    offset += len(page)
+                    if len(page) < _SYNC_PAGE_SIZE:
+                        break
+
+            # Advance the watermark past the leading run of terminal responses;
+            # anything from the first running response on is fetched next time
+            for response in fetched:
+                if response.status not in TERMINAL_STATUSES:
+                    break
+                synced_count += 1
+            self._store.put_thread(snapshot_key, thread, synced_count=synced_count)
+            return fetched
+
+        new_responses: builtins.list[ResponseObject] = []
+        synced: builtins.list[ThreadObject] = []
+        for thread, fetched in zip(changed, await asyncio.gather(*(sync_thread(thread) for thread in changed))):
+            if fetched is None:
+                removed_ids.append(str(thread.thread_id))
+                continue
+            synced.append(thread)
+            new_responses.extend(fetched)
+        threads = [thread for thread in threads if str(thread.thread_id) not in removed_ids]
+
+        if removed_ids:
+            self._store.delete_threads(snapshot_key, removed_ids)
+
+        return ThreadSyncResult(
+            threads_checked=len(threads),
+            changed_threads=synced,
+            new_responses=new_responses,
+            removed_thread_ids=[UUID(thread_id) for thread_id in removed_ids],
         )
 
-        return ThreadObject(**response_data)
+
+def _thread_changed(thread: ThreadObject, watermark: "ThreadWatermark | None") -> bool:
+    if watermark is None:
+        return True
+    last_response_at = thread.last_response_at.isoformat() if thread.last_response_at else None
+    return (
+        watermark.last_response_at != last_response_at
+        or watermark.response_count != thread.response_count
+        or watermark.synced_count < thread.response_count
+    )
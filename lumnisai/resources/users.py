@@ -20,14 +20,13 @@ class UsersResource(BaseResource):
             last_name=last_name,
         )
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "POST",
             "/v1/users",
             json=user_data.model_dump(exclude_none=True),
+            model=User,
         )
 
-        return User(**response_data)
-
     async def get(
         self,
         user_identifier: str | UUID,
@@ -36,13 +35,12 @@ class UsersResource(BaseResource):
         if isinstance(user_identifier, str) and "@" in user_identifier:
             user_identifier = quote(user_identifier, safe="")
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             f"/v1/users/{user_identifier}",
+            model=User,
         )
 
-        return User(**response_data)
-
     async def update(
         self,
         user_identifier: str | UUID,
@@ -59,14 +57,13 @@ class UsersResource(BaseResource):
             last_name=last_name,
         )
 
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "PUT",
             f"/v1/users/{user_identifier}",
             json=update_data.model_dump(exclude_none=True),
+            model=User,
         )
 
-        return User(**response_data)
-
     async def delete(
         self,
         user_identifier: str | UUID,
@@ -86,10 +83,9 @@ class UsersResource(BaseResource):
         page: int = 1,
         page_size: int = 20,
     ) -> UsersListResponse:
-        response_data = await self._transport.request(
+        return await self._transport.request(
             "GET",
             "/v1/users",
             params={"page": page, "page_size": min(page_size, 100)},
+            model=UsersListResponse,
         )
-
-        return UsersListResponse(**response_data)
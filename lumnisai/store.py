@@ -0,0 +1,224 @@
+"""Local persistent storage for terminal responses."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import UUID
+
+from .models.response import ResponseObject
+from .models.thread import ThreadObject
+
+# Responses in these states never change again and are safe to serve locally
+TERMINAL_STATUSES = frozenset({"succeeded", "failed", "cancelled"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    scope TEXT NOT NULL,
+    response_id TEXT NOT NULL,
+    thread_id TEXT NOT NULL,
+    tenant_id TEXT NOT NULL,
+    user_id TEXT,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (scope, response_id)
+);
+CREATE INDEX IF NOT EXISTS responses_thread_idx ON responses (thread_id, created_at);
+CREATE TABLE IF NOT EXISTS threads (
+    snapshot_key TEXT NOT NULL,
+    thread_id TEXT NOT NULL,
+    response_count INTEGER NOT NULL,
+    last_response_at TEXT,
+    synced_count INTEGER NOT NULL,
+    body TEXT NOT NULL,
+    PRIMARY KEY (snapshot_key, thread_id)
+);
+"""
+
+
+@dataclass(frozen=True)
+class ThreadWatermark:
+    """What the store knew about a thread when it was last synchronized."""
+
+    response_count: int
+    last_response_at: str | None
+    # Length of the leading run of terminal responses already stored; responses
+    # from this offset on are fetched again on the next sync
+    synced_count: int
+
+
+class ResponseStore:
+    """
+    SQLite-backed store of terminal responses, keyed by response_id.
+
+    Once a response has succeeded, failed or been cancelled it is immutable, so
+    the client can record it the first time it is fetched and serve every later
+    read from disk. Pass a store to the client to enable this:
+
+        store = ResponseStore("~/.cache/lumnisai/responses.db")
+        async with AsyncClient(response_store=store) as client:
+            ...
+
+    Responses that are not terminal are never stored. Use ":memory:" for a
+    process-local store that is discarded when the process exits.
+
+    Rows are kept per scope: a client records what it fetches under its
+    credentials and `for_user` scope, and only reads back rows of that same
+    scope, so clients sharing a store never see each other's responses.
+    Reading with `scope=None` sees every scope.
+    """
+
+    def __init__(self, path: str | Path = ":memory:"):
+        path = str(path)
+        self.path = path if path == ":memory:" else str(Path(path).expanduser())
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+        # The connection is shared by the event loop thread and, for the sync
+        # client, the calling thread; a lock serializes access to it
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute(
+                "SELECT COUNT(DISTINCT response_id) FROM responses"
+            ).fetchone()
+        return count
+
+    def __contains__(self, response_id: object) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM responses WHERE response_id = ?", (str(response_id),)
+            ).fetchone()
+        return row is not None
+
+    def get(self, response_id: str | UUID, *, scope: str | None = None) -> ResponseObject | None:
+        """Return the stored response, or None if it has not been recorded."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM responses WHERE response_id = ? AND (? IS NULL OR scope = ?)",
+                (str(response_id), scope, scope),
+            ).fetchone()
+        if row is None:
+            return None
+        return ResponseObject.model_validate_json(row[0])
+
+    def put(self, response: ResponseObject, *, scope: str = "") -> bool:
+        """Record a response if it is terminal. Returns whether it was stored."""
+        return self.put_many([response], scope=scope) == 1
+
+    def put_many(self, responses: Iterable[ResponseObject], *, scope: str = "") -> int:
+        """Record all terminal responses in a single transaction."""
+        rows = [
+            (
+                scope,
+                str(response.response_id),
+                str(response.thread_id),
+                str(response.tenant_id),
+                str(response.user_id) if response.user_id else None,
+                response.status,
+                response.created_at.isoformat(),
+                response.model_dump_json(),
+            )
+            for response in responses
+            if response.status in TERMINAL_STATUSES
+        ]
+        if not rows:
+            return 0
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO responses "
+                    "(scope, response_id, thread_id, tenant_id, user_id, status, created_at, body) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+        return len(rows)
+
+    def thread_responses(
+        self, thread_id: str | UUID, *, scope: str | None = None
+    ) -> list[ResponseObject]:
+        """All stored responses of a thread, oldest first."""
+        with self._lock:
+            # A response recorded under several scopes is returned once
+            rows = self._conn.execute(
+                "SELECT body FROM responses WHERE thread_id = ? AND (? IS NULL OR scope = ?) "
+                "GROUP BY response_id ORDER BY created_at",
+                (str(thread_id), scope, scope),
+            ).fetchall()
+        return [ResponseObject.model_validate_json(body) for (body,) in rows]
+
+    def delete(self, response_id: str | UUID) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM responses WHERE response_id = ?", (str(response_id),)
+            )
+
+    # ------------------------------------------------------------------
+    # Thread snapshots (used by ThreadsResource.sync)
+    # ------------------------------------------------------------------
+
+    def thread_watermarks(self, snapshot_key: str) -> dict[str, ThreadWatermark]:
+        """Watermarks of every thread in a snapshot, keyed by thread_id."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT thread_id, response_count, last_response_at, synced_count "
+                "FROM threads WHERE snapshot_key = ?",
+                (snapshot_key,),
+            ).fetchall()
+        return {
+            thread_id: ThreadWatermark(response_count, last_response_at, synced_count)
+            for thread_id, response_count, last_response_at, synced_count in rows
+        }
+
+    def put_thread(self, snapshot_key: str, thread: ThreadObject, *, synced_count: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO threads "
+                "(snapshot_key, thread_id, response_count, last_response_at, synced_count, body) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    snapshot_key,
+                    str(thread.thread_id),
+                    thread.response_count,
+                    thread.last_response_at.isoformat() if thread.last_response_at else None,
+                    synced_count,
+                    thread.model_dump_json(),
+                ),
+            )
+
+    def delete_threads(self, snapshot_key: str, thread_ids: Iterable[str]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM threads WHERE snapshot_key = ? AND thread_id = ?",
+                [(snapshot_key, thread_id) for thread_id in thread_ids],
+            )
+
+    def threads(self, snapshot_key: str) -> list[ThreadObject]:
+        """Threads of a snapshot, most recently active first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT body FROM threads WHERE snapshot_key = ? "
+                "ORDER BY last_response_at DESC",
+                (snapshot_key,),
+            ).fetchall()
+        return [ThreadObject.model_validate_json(body) for (body,) in rows]
@@ -0,0 +1,1216 @@
+"""
+Deterministic in-memory fake of the Lumnis API.
+
+`FakeLumnisServer` keeps responses, threads, users, files, MCP servers and
+skills in memory and answers the SDK's requests through an httpx
+MockTransport, so tests and load experiments never touch the network:
+
+    from lumnisai.testing import FakeClock, FakeLumnisServer
+
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.script(progress=["Searching", "Summarizing"], output_text="42")
+    server.inject(status=503, count=2)
+
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        response = await client.invoke("What is the answer?", user_id="user@example.com", poll_interval=0)
+
+Agent runs follow a scripted timeline: queued for `queue_delay` seconds, then
+one progress entry every `progress_interval` seconds, then a terminal status.
+Long polls (`?wait=`) return as soon as the response changes, like the real
+service. Uploaded files move through pending, parsing and embedding to
+completed over `file_processing_seconds` and text files are chunked for a
+simple token-overlap search.
+
+With a seeded server and a `FakeClock` every ID, timestamp and injected fault
+is reproducible; simulated latency and long polls then advance the fake clock
+instead of sleeping, so a test that waits for a ten-minute run finishes
+immediately. Without a clock the server runs in real time.
+
+Faults added with `inject()` return an error status, add latency or raise a
+network error for a matching fraction of requests, which exercises retry
+and back-pressure behaviour without a live service.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+import uuid
+from collections import Counter, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import httpx
+
+from ._transport.instrumentation import endpoint_name
+
+Handler = Callable[..., Awaitable[httpx.Response]]
+
+# Lines of text per searchable file chunk
+CHUNK_LINES = 20
+
+_TOKEN_RE = re.compile(r"\w+")
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+")
+
+
+class FakeClock:
+    """
+    Virtual clock for `FakeLumnisServer`.
+
+    Time only moves when something sleeps on the clock or the test calls
+    advance(). `epoch` is the wall-clock time the clock starts at.
+    """
+
+    def __init__(self, epoch: datetime = datetime(2025, 1, 1, tzinfo=timezone.utc)):
+        self.epoch = epoch
+        self._now = 0.0
+
+    def now(self) -> float:
+        """Seconds since the clock started."""
+        return self._now
+
+    def advance(self, seconds: float) -> None:
+        self._now += max(seconds, 0.0)
+
+    async def sleep(self, seconds: float) -> None:
+        self.advance(seconds)
+        # Still yield so concurrent requests interleave as they would for real
+        await asyncio.sleep(0)
+
+
+class _RealClock:
+
+    def __init__(self) -> None:
+        self.epoch = datetime.now(timezone.utc)
+        self._started = time.monotonic()
+
+    def now(self) -> float:
+        return time.monotonic() - self._started
+
+    async def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            await asyncio.sleep(seconds)
+
+
+@dataclass
+class Fault:
+    """
+    A failure injected into matching requests.
+
+    Args:
+        status: HTTP status to return instead of the real response; None lets
+            the request through after `latency`
+        latency: Extra seconds before the request is answered
+        rate: Fraction of matching requests affected
+        count: Number of requests to affect before the fault expires; None
+            means unlimited
+        method: Only affect this HTTP method
+        path: Only affect paths matching this regular expression
+        retry_after: Value of the Retry-After header sent with `status`
+        error: httpx exception raised instead of answering, such as
+            httpx.ConnectError or httpx.ReadTimeout
+    """
+
+    status: int | None = None
+    latency: float = 0.0
+    rate: float = 1.0
+    count: int | None = None
+    method: str | None = None
+    path: str | None = None
+    retry_after: float | None = None
+    error: type[httpx.TransportError] | None = None
+    hits: int = 0
+
+    def matches(self, request: httpx.Request) -> bool:
+        if self.count is not None and self.hits >= self.count:
+            return False
+        if self.method is not None and request.method != self.method.upper():
+            return False
+        return self.path is None or re.search(self.path, request.url.path) is not None
+
+
+@dataclass
+class ResponseScript:
+    """
+    How the next created response plays out.
+
+    Args:
+        queue_delay: Seconds the response stays queued
+        progress: Message of each progress entry
+        progress_interval: Seconds between progress entries
+        status: Terminal status, "succeeded", "failed" or "cancelled"
+        output_text: Output of a succeeded response
+        error: Error body of a failed response
+        tool_calls: Tool calls attached to each progress entry
+    """
+
+    queue_delay: float = 0.0
+    progress: list[str] = field(default_factory=lambda: ["Step 1", "Step 2", "Step 3"])
+    progress_interval: float = 0.01
+    status: str = "succeeded"
+    output_text: str | None = "Done."
+    error: dict[str, Any] | None = None
+    tool_calls: list[dict[str, Any]] | None = field(
+        default_factory=lambda: [{"name": "web_search", "args": {"query": "lumnis"}}]
+    )
+
+
+@dataclass
+class _Run:
+    body: dict[str, Any]
+    script: ResponseScript
+    started: float
+
+    @property
+    def progress_at(self) -> list[float]:
+        # Seconds after `started` at which each progress entry appears
+        script = self.script
+        return [script.queue_delay + script.progress_interval * i for i in range(len(script.progress))]
+
+    @property
+    def completes_at(self) -> float:
+        script = self.script
+        return script.queue_delay + script.progress_interval * len(script.progress)
+
+
+class FakeLumnisServer:
+    """
+    Stateful fake of the Lumnis API.
+
+    Args:
+        seed: Seed for generated IDs and fault sampling
+        clock: FakeClock for virtual time; real time when omitted
+        latency: Seconds added to every request
+        queue_delay: Default seconds a new response stays queued
+        progress_interval: Default seconds between progress entries
+        progress_entries: Default number of progress entries per response
+        file_processing_seconds: Seconds an uploaded file takes to process
+        etags: Tag successful GETs with an ETag and answer a matching
+            If-None-Match with 304 Not Modified
+    """
+
+    def __init__(
+        self,
+        *,
+        seed: int | None = None,
+        clock: FakeClock | None = None,
+        latency: float = 0.0,
+        queue_delay: float = 0.0,
+        progress_interval: float = 0.01,
+        progress_entries: int = 3,
+        file_processing_seconds: float = 0.0,
+        etags: bool = True,
+    ):
+        self.clock = clock or _RealClock()
+        self.latency = latency
+        self.queue_delay = queue_delay
+        self.progress_interval = progress_interval
+        self.progress_entries = progress_entries
+        self.file_processing_seconds = file_processing_seconds
+        self.etags = etags
+
+        self._rng = random.Random(seed)
+        self.tenant_id = self._id()
+        self.requests = 0
+        # Requests per endpoint, e.g. calls["GET /v1/responses/{id}"]
+        self.calls: Counter[str] = Counter()
+        self.faults: list[Fault] = []
+
+        self._scripts: deque[ResponseScript] = deque()
+        self._runs: dict[str, _Run] = {}
+        self._idempotent: dict[str, httpx.Response] = {}
+        self._threads: dict[str, dict[str, Any]] = {}
+        self._users: dict[str, dict[str, Any]] = {}
+        self._files: dict[str, dict[str, Any]] = {}
+        self._mcp_servers: dict[str, dict[str, Any]] = {}
+        self._skills: dict[str, dict[str, Any]] = {}
+
+        files = r"/v1/files/(?P<file_id>[^/]+)"
+        self._routes: list[tuple[str, re.Pattern[str], Handler]] = [
+            (method, re.compile(pattern), handler)
+            for method, pattern, handler in [
+                ("GET", r"/v1/health", self._health),
+                # Responses and threads
+                ("POST", r"/v1/responses", self._create_response),
+                ("GET", r"/v1/responses", self._list_responses),
+                ("GET", r"/v1/responses/(?P<response_id>[^/]+)", self._get_response),
+                ("POST", r"/v1/responses/(?P<response_id>[^/]+)/cancel", self._cancel_response),
+                ("GET", r"/v1/responses/(?P<response_id>[^/]+)/artifacts", self._list_artifacts),
+                ("GET", r"/v1/threads", self._list_threads),
+                ("GET", r"/v1/threads/(?P<thread_id>[^/]+)", self._get_thread),
+                ("PATCH", r"/v1/threads/(?P<thread_id>[^/]+)", self._update_thread),
+                ("GET", r"/v1/threads/(?P<thread_id>[^/]+)/responses", self._thread_responses),
+                # Users
+                ("POST", r"/v1/users", self._create_user),
+                ("GET", r"/v1/users", self._list_users),
+                ("GET", r"/v1/users/(?P<identifier>[^/]+)", self._get_user),
+                ("PUT", r"/v1/users/(?P<identifier>[^/]+)", self._update_user),
+                ("DELETE", r"/v1/users/(?P<identifier>[^/]+)", self._delete_user),
+                # Files; fixed paths come before {file_id}
+                ("POST", r"/v1/files/upload", self._upload_file),
+                ("POST", r"/v1/files/bulk-upload", self._bulk_upload_files),
+                ("POST", r"/v1/files/search", self._search_files),
+                ("GET", r"/v1/files/", self._list_files),
+                ("GET", r"/v1/files/statistics", self._file_statistics),
+                ("DELETE", r"/v1/files/bulk", self._bulk_delete_files),
+                ("GET", files, self._get_file),
+                ("GET", files + "/content", self._file_content),
+                ("GET", files + "/download", self._download_file),
+                ("GET", files + "/status", self._file_status),
+                ("PATCH", files + "/scope", self._update_file_scope),
+                ("DELETE", files, self._delete_file),
+                # MCP servers
+                ("POST", r"/v1/mcp-servers", self._create_mcp_server),
+                ("GET", r"/v1/mcp-servers", self._list_mcp_servers),
+                ("GET", r"/v1/mcp-servers/(?P<server_id>[^/]+)", self._get_mcp_server),
+                ("PATCH", r"/v1/mcp-servers/(?P<server_id>[^/]+)", self._update_mcp_server),
+                ("DELETE", r"/v1/mcp-servers/(?P<server_id>[^/]+)", self._delete_mcp_server),
+                ("GET", r"/v1/mcp-servers/(?P<server_id>[^/]+)/tools", self._mcp_server_tools),
+                ("POST", r"/v1/mcp-servers/(?P<server_id>[^/]+)/test", self._test_mcp_server),
+                # Skills
+                ("POST", r"/v1/skills", self._create_skill),
+                ("GET", r"/v1/skills", self._list_skills),
+                ("GET", r"/v1/skills/(?P<skill_id>[^/]+)", self._get_skill),
+                ("PUT", r"/v1/skills/(?P<skill_id>[^/]+)", self._update_skill),
+                ("DELETE", r"/v1/skills/(?P<skill_id>[^/]+)", self._delete_skill),
+            ]
+        ]
+
+    def transport(self) -> httpx.MockTransport:
+        """An httpx transport answering from this server; pass as `http_transport`."""
+        return httpx.MockTransport(self.handle)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        self.calls[endpoint_name(request.method, request.url.path)] += 1
+        if self.latency:
+            await self.clock.sleep(self.latency)
+
+        for fault in self.faults:
+            if not fault.matches(request) or self._rng.random() >= fault.rate:
+                continue
+            fault.hits += 1
+            if fault.latency:
+                await self.clock.sleep(fault.latency)
+            if fault.error is not None:
+                raise fault.error("Injected fault", request=request)
+            if fault.status is not None:
+                headers = {}
+                if fault.retry_after is not None:
+                    headers["Retry-After"] = f"{fault.retry_after:g}"
+                return self._error(fault.status, "Injected fault", headers=headers)
+
+        for method, pattern, handler in self._routes:
+            if request.method == method and (match := pattern.fullmatch(request.url.path)):
+                response = await handler(request, **match.groupdict())
+                if self.etags and method == "GET" and response.status_code == 200:
+                    return self._conditional(request, response)
+                return response
+        return self._error(404, f"No route for {request.method} {request.url.path}")
+
+    # ------------------------------------------------------------------
+    # Scripting and fault injection
+    # ------------------------------------------------------------------
+
+    def script(self, **kwargs: Any) -> ResponseScript:
+        """
+        Queue a script for the next created response.
+
+        Scripts are used in the order they were queued; responses created
+        with no script queued follow the server defaults. Accepts the fields
+        of `ResponseScript`.
+        """
+        script = ResponseScript(**kwargs)
+        self._scripts.append(script)
+        return script
+
+    def inject(self, **kwargs: Any) -> Fault:
+        """Add a fault; accepts the fields of `Fault` and returns it."""
+        fault = Fault(**kwargs)
+        self.faults.append(fault)
+        return fault
+
+    def clear_faults(self) -> None:
+        self.faults.clear()
+
+    def reset(self) -> None:
+        """Forget all stored objects; faults, queued scripts and counters are kept."""
+        for store in (
+            self._runs,
+            self._idempotent,
+            self._threads,
+            self._users,
+            self._files,
+            self._mcp_servers,
+            self._skills,
+        ):
+            store.clear()
+
+    # ------------------------------------------------------------------
+    # Seeding
+    # ------------------------------------------------------------------
+
+    def seed_responses(self, count: int, *, days: int = 30, thread_size: int = 10) -> None:
+        """Create `count` finished responses spread over the last `days` days."""
+        now = self._wall()
+        thread = None
+        for i in range(count):
+            if i % thread_size == 0:
+                thread = self._new_thread(None)
+            created = now - timedelta(seconds=(days * 86400) * (count - i) / count)
+            run = self._new_run(thread, self._default_script(), created=created)
+            run.started -= run.completes_at
+            self._render(run)
+
+    def seed_files(self, contents: dict[str, bytes | str], *, tags: list[str] | None = None) -> list[str]:
+        """Add already processed files by name and return their IDs."""
+        ids = []
+        for file_name, content in contents.items():
+            if isinstance(content, str):
+                content = content.encode()
+            entry = self._new_file(file_name, content, scope="tenant", user_id=None, tags=tags)
+            entry["processed_at"] = self.clock.now()
+            ids.append(entry["metadata"]["id"])
+        return ids
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    def _id(self) -> str:
+        return str(uuid.UUID(int=self._rng.getrandbits(128), version=4))
+
+    def _wall(self, at: float | None = None) -> datetime:
+        return self.clock.epoch + timedelta(seconds=self.clock.now() if at is None else at)
+
+    def _now(self) -> str:
+        return self._wall().isoformat()
+
+    def _json(self, body: Any, status_code: int = 200, headers: dict[str, str] | None = None) -> httpx.Response:
+        return httpx.Response(
+            status_code,
+            content=json.dumps(body).encode(),
+            headers={"Content-Type": "application/json", "X-Request-ID": self._id(), **(headers or {})},
+        )
+
+    def _conditional(self, request: httpx.Request, response: httpx.Response) -> httpx.Response:
+        etag = f'"{hashlib.blake2b(response.content, digest_size=8).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304, headers={"ETag": etag, "X-Request-ID": response.headers["X-Request-ID"]})
+        response.headers["ETag"] = etag
+        return response
+
+    def _error(self, status_code: int, message: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        return self._json({"error": {"code": f"HTTP_{status_code}", "message": message}}, status_code, headers)
+
+    def _page(self, request: httpx.Request, items: list[dict[str, Any]], key: str) -> httpx.Response:
+        offset = int(request.url.params.get("offset", 0))
+        limit = int(request.url.params.get("limit", 50))
+        return self._json({key: items[offset:offset + limit], "total": len(items), "limit": limit, "offset": offset})
+
+    def _resolve_user(self, identifier: str | None, *, create: bool = False) -> dict[str, Any] | None:
+        """Find a user by ID or email; the service creates users on first use by email."""
+        if not identifier:
+            return None
+        if identifier in self._users:
+            return self._users[identifier]
+        for user in self._users.values():
+            if user["email"] == identifier:
+                return user
+        if create:
+            if _EMAIL_RE.fullmatch(identifier):
+                return self._new_user(identifier)
+            if _is_uuid(identifier):
+                return self._new_user(f"{identifier[:8]}@example.com", user_id=identifier)
+        return None
+
+    def _new_user(self, email: str, *, user_id: str | None = None, **names: Any) -> dict[str, Any]:
+        now = self._now()
+        user = {
+            "id": user_id or self._id(),
+            "email": email,
+            "first_name": names.get("first_name"),
+            "last_name": names.get("last_name"),
+            "tenant_id": self.tenant_id,
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+        self._users[user["id"]] = user
+        return user
+
+    # ------------------------------------------------------------------
+    # Responses and threads
+    # ------------------------------------------------------------------
+
+    def _default_script(self) -> ResponseScript:
+        return ResponseScript(
+            queue_delay=self.queue_delay,
+            progress=[f"Step {i + 1}" for i in range(self.progress_entries)],
+            progress_interval=self.progress_interval,
+        )
+
+    def _new_thread(self, user_id: str | None) -> dict[str, Any]:
+        thread = {
+            "thread_id": self._id(),
+            "tenant_id": self.tenant_id,
+            "user_id": user_id,
+            "title": None,
+            "created_at": self._now(),
+            "updated_at": None,
+            "response_count": 0,
+            "last_response_at": None,
+            "response_ids": [],
+        }
+        self._threads[thread["thread_id"]] = thread
+        return thread
+
+    def _new_run(self, thread: dict[str, Any], script: ResponseScript, *, created: datetime | None = None) -> _Run:
+        response_id = self._id()
+        created_at = (created or self._wall()).isoformat()
+        run = _Run(
+            body={
+                "response_id": response_id,
+                "thread_id": thread["thread_id"],
+                "tenant_id": self.tenant_id,
+                "user_id": thread["user_id"],
+                "status": "queued",
+                "progress": [],
+                "output_text": None,
+                "error": None,
+                "created_at": created_at,
+                "completed_at": None,
+            },
+            script=script,
+            started=self.clock.now(),
+        )
+        self._runs[response_id] = run
+        thread["response_ids"].append(response_id)
+        thread["response_count"] += 1
+        thread["last_response_at"] = created_at
+        return run
+
+    def _render(self, run: _Run) -> dict[str, Any]:
+        # Materialize the scripted timeline up to now
+        body = run.body
+        if body["completed_at"] is not None:
+            return body
+        script = run.script
+        elapsed = self.clock.now() - run.started
+        progress_at = run.progress_at
+        visible = sum(1 for at in progress_at if at <= elapsed)
+        while len(body["progress"]) < visible:
+            index = len(body["progress"])
+            body["progress"].append(
+                {
+                    "ts": self._wall(run.started + progress_at[index]).isoformat(),
+                    "state": "processing",
+                    "message": script.progress[index],
+                    "tool_calls": script.tool_calls,
+                }
+            )
+        if elapsed >= run.completes_at:
+            self._finish(run, script.status, completed=run.started + run.completes_at)
+        elif visible and body["status"] == "queued":
+            body["status"] = "in_progress"
+        return body
+
+    def _finish(self, run: _Run, status: str, *, completed: float | None = None) -> None:
+        body = run.body
+        body["status"] = status
+        body["completed_at"] = self._wall(completed).isoformat()
+        if status == "succeeded":
+            body["output_text"] = run.script.output_text
+        elif status == "failed":
+            body["error"] = run.script.error or {"message": "Agent run failed"}
+
+    def _next_change(self, run: _Run) -> float | None:
+        if run.body["completed_at"] is not None:
+            return None
+        elapsed = self.clock.now() - run.started
+        upcoming = [at for at in (*run.progress_at, run.completes_at) if at > elapsed]
+        return min(upcoming) - elapsed if upcoming else None
+
+    async def _health(self, request: httpx.Request) -> httpx.Response:
+        return self._json({"status": "ok"})
+
+    async def _create_response(self, request: httpx.Request) -> httpx.Response:
+        key = request.headers.get("Idempotency-Key")
+        if key and key in self._idempotent:
+            return self._idempotent[key]
+
+        payload = json.loads(request.content or b"{}")
+        thread_id = payload.get("thread_id")
+        thread = self._threads.get(thread_id) if thread_id else None
+        if thread_id and thread is None:
+            return self._error(404, "Thread not found")
+        if thread is None:
+            user = self._resolve_user(payload.get("user_id"), create=True)
+            thread = self._new_thread(user["id"] if user else None)
+
+        run = self._new_run(thread, self._scripts.popleft() if self._scripts else self._default_script())
+        body = self._render(run)
+        response = self._json(
+            {
+                "response_id": body["response_id"],
+                "thread_id": body["thread_id"],
+                "tenant_id": self.tenant_id,
+                "status": body["status"],
+                "created_at": body["created_at"],
+            },
+            202,
+        )
+        if key:
+            self._idempotent[key] = response
+        return response
+
+    async def _get_response(self, request: httpx.Request, response_id: str) -> httpx.Response:
+        run = self._runs.get(response_id)
+        if run is None:
+            return self._error(404, "Response not found")
+
+        wait = request.url.params.get("wait")
+        if wait:
+            delay = self._next_change(run)
+            if delay is not None:
+                await self.clock.sleep(min(delay, float(wait)))
+        return self._json(self._render(run))
+
+    async def _cancel_response(self, request: httpx.Request, response_id: str) -> httpx.Response:
+        run = self._runs.get(response_id)
+        if run is None:
+            return self._error(404, "Response not found")
+        if self._render(run)["completed_at"] is not None:
+            return self._error(400, f"Response is already {run.body['status']}")
+        self._finish(run, "cancelled")
+        return self._json({"status": "cancelled", "message": "Response cancelled"})
+
+    async def _list_artifacts(self, request: httpx.Request, response_id: str) -> httpx.Response:
+        if response_id not in self._runs:
+            return self._error(404, "Response not found")
+        return self._page(request, [], "artifacts")
+
+    async def _list_responses(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        items = [self._render(run) for run in self._runs.values()]
+        if user := params.get("user_id"):
+            resolved = self._resolve_user(user)
+            items = [item for item in items if resolved and item["user_id"] == resolved["id"]]
+        if status := params.get("status"):
+            items = [item for item in items if item["status"] == status]
+        if start := params.get("start_date"):
+            items = [item for item in items if item["created_at"][:10] >= start]
+        if end := params.get("end_date"):
+            items = [item for item in items if item["created_at"][:10] <= end]
+        return self._page(request, items, "responses")
+
+    def _thread_body(self, thread: dict[str, Any]) -> dict[str, Any]:
+        return {key: value for key, value in thread.items() if key != "response_ids"}
+
+    async def _list_threads(self, request: httpx.Request) -> httpx.Response:
+        threads = list(self._threads.values())
+        if user := request.url.params.get("user_id"):
+            resolved = self._resolve_user(user)
+            threads = [thread for thread in threads if resolved and thread["user_id"] == resolved["id"]]
+        return self._page(request, [self._thread_body(thread) for thread in threads], "threads")
+
+    async def _get_thread(self, request: httpx.Request, thread_id: str) -> httpx.Response:
+        thread = self._threads.get(thread_id)
+        if thread is None:
+            return self._error(404, "Thread not found")
+        return self._json(self._thread_body(thread))
+
+    async def _update_thread(self, request: httpx.Request, thread_id: str) -> httpx.Response:
+        thread = self._threads.get(thread_id)
+        if thread is None:
+            return self._error(404, "Thread not found")
+        payload = json.loads(request.content or b"{}")
+        if "title" in payload:
+            thread["title"] = payload["title"]
+        thread["updated_at"] = self._now()
+        return self._json(self._thread_body(thread))
+
+    async def _thread_responses(self, request: httpx.Request, thread_id: str) -> httpx.Response:
+        thread = self._threads.get(thread_id)
+        if thread is None:
+            return self._error(404, "Thread not found")
+        offset = int(request.url.params.get("offset", 0))
+        limit = int(request.url.params.get("limit", 50))
+        ids = thread["response_ids"][offset:offset + limit]
+        return self._json([self._render(self._runs[response_id]) for response_id in ids])
+
+    # ------------------------------------------------------------------
+    # Users
+    # ------------------------------------------------------------------
+
+    async def _create_user(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content or b"{}")
+        if self._resolve_user(payload.get("email")) is not None:
+            return self._error(409, "User already exists")
+        user = self._new_user(
+            payload["email"], first_name=payload.get("first_name"), last_name=payload.get("last_name")
+        )
+        return self._json(user, 201)
+
+    async def _list_users(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        page_size = int(request.url.params.get("page_size", 20))
+        users = list(self._users.values())
+        start = (page - 1) * page_size
+        total_pages = -(-len(users) // page_size)
+        return self._json(
+            {
+                "users": users[start:start + page_size],
+                "pagination": {
+                    "page": page,
+                    "page_size": page_size,
+                    "total": len(users),
+                    "total_pages": total_pages,
+                    "has_next": page < total_pages,
+                    "has_prev": page > 1,
+                },
+            }
+        )
+
+    async def _get_user(self, request: httpx.Request, identifier: str) -> httpx.Response:
+        user = self._resolve_user(identifier)
+        if user is None:
+            return self._error(404, "User not found")
+        return self._json(user)
+
+    async def _update_user(self, request: httpx.Request, identifier: str) -> httpx.Response:
+        user = self._resolve_user(identifier)
+        if user is None:
+            return self._error(404, "User not found")
+        payload = json.loads(request.content or b"{}")
+        for key in ("first_name", "last_name"):
+            if key in payload:
+                user[key] = payload[key]
+        user["updated_at"] = self._now()
+        return self._json(user)
+
+    async def _delete_user(self, request: httpx.Request, identifier: str) -> httpx.Response:
+        user = self._resolve_user(identifier)
+        if user is None:
+            return self._error(404, "User not found")
+        del self._users[user["id"]]
+        return httpx.Response(204)
+
+    # ------------------------------------------------------------------
+    # Files
+    # ------------------------------------------------------------------
+
+    def _new_file(
+        self,
+        file_name: str,
+        content: bytes,
+        *,
+        scope: str,
+        user_id: str | None,
+        tags: list[str] | None,
+    ) -> dict[str, Any]:
+        file_id = self._id()
+        extension = file_name.rsplit(".", 1)[-1].lower() if "." in file_name else "bin"
+        try:
+            lines = content.decode().splitlines()
+        except UnicodeDecodeError:
+            lines = []
+        chunks = [
+            {
+                "id": self._id(),
+                "chunk_index": index,
+                "chunk_text": "\n".join(lines[start:start + CHUNK_LINES]),
+                "start_line": start + 1,
+                "end_line": min(start + CHUNK_LINES, len(lines)),
+                "token_count": None,
+                "metadata": None,
+            }
+            for index, start in enumerate(range(0, len(lines), CHUNK_LINES))
+        ]
+        for chunk in chunks:
+            chunk["token_count"] = len(_TOKEN_RE.findall(chunk["chunk_text"]))
+
+        now = self._now()
+        entry = {
+            "metadata": {
+                "id": file_id,
+                "tenant_id": self.tenant_id,
+                "user_id": user_id,
+                "file_name": file_name,
+                "original_file_name": file_name,
+                "file_type": extension,
+                "mime_type": "text/plain" if lines else "application/octet-stream",
+                "file_size": len(content),
+                "file_scope": scope,
+                "blob_url": None,
+                "processing_status": "pending",
+                "error_message": None,
+                "total_chunks": len(chunks),
+                "chunks_embedded": 0,
+                "tags": tags,
+                "created_at": now,
+                "updated_at": now,
+            },
+            "content": content,
+            "lines": lines,
+            "chunks": chunks,
+            "uploaded_at": self.clock.now(),
+            "processed_at": self.clock.now() + self.file_processing_seconds,
+        }
+        self._files[file_id] = entry
+        return entry
+
+    def _file_metadata(self, entry: dict[str, Any]) -> dict[str, Any]:
+        # Processing advances with the clock: pending, parsing, embedding, completed
+        metadata = entry["metadata"]
+        if metadata["processing_status"] == "completed":
+            return metadata
+        now = self.clock.now()
+        duration = entry["processed_at"] - entry["uploaded_at"]
+        fraction = 1.0 if duration <= 0 else (now - entry["uploaded_at"]) / duration
+        if fraction >= 1.0:
+            metadata["processing_status"] = "completed"
+            metadata["chunks_embedded"] = metadata["total_chunks"]
+            metadata["updated_at"] = self._wall(entry["processed_at"]).isoformat()
+        elif fraction >= 0.5:
+            metadata["processing_status"] = "embedding"
+            metadata["chunks_embedded"] = int(metadata["total_chunks"] * (fraction - 0.5) * 2)
+        elif fraction >= 0.1:
+            metadata["processing_status"] = "parsing"
+        return metadata
+
+    def _file(self, file_id: str) -> dict[str, Any] | None:
+        entry = self._files.get(file_id)
+        if entry is not None:
+            self._file_metadata(entry)
+        return entry
+
+    def _store_upload(self, file_name: str, content: bytes, form: dict[str, str]) -> tuple[dict[str, Any], int]:
+        scope = form.get("scope", "tenant")
+        user = self._resolve_user(form.get("user_id"), create=True)
+        tags = [tag for tag in form.get("tags", "").split(",") if tag] or None
+
+        existing = next(
+            (
+                entry for entry in self._files.values()
+                if entry["metadata"]["file_name"] == file_name
+                and entry["metadata"]["file_scope"] == scope
+            ),
+            None,
+        )
+        if existing is not None:
+            handling = form.get("duplicate_handling", "error")
+            if handling == "error":
+                return {"error": {"code": "HTTP_409", "message": f"File {file_name} already exists"}}, 409
+            if handling == "skip":
+                metadata = self._file_metadata(existing)
+                return {"file_id": metadata["id"], "file_name": file_name, "status": metadata["processing_status"],
+                        "message": "Duplicate file skipped"}, 200
+            if handling == "replace":
+                del self._files[existing["metadata"]["id"]]
+            else:
+                stem, dot, extension = file_name.rpartition(".")
+                if not dot:
+                    stem, extension = file_name, ""
+                names = {entry["metadata"]["file_name"] for entry in self._files.values()}
+                suffix = 1
+                while f"{stem}_({suffix}){dot}{extension}" in names:
+                    suffix += 1
+                file_name = f"{stem}_({suffix}){dot}{extension}"
+
+        entry = self._new_file(file_name, content, scope=scope, user_id=user["id"] if user else None, tags=tags)
+        metadata = self._file_metadata(entry)
+        return {"file_id": metadata["id"], "file_name": file_name, "status": metadata["processing_status"],
+                "message": "File uploaded successfully"}, 202
+
+    async def _upload_file(self, request: httpx.Request) -> httpx.Response:
+        form, files = _parse_multipart(request.headers.get("Content-Type", ""), await request.aread())
+        if not files:
+            return self._error(422, "No file provided")
+        _, file_name, content = files[0]
+        body, status_code = self._store_upload(file_name, content, form)
+        return self._json(body, status_code)
+
+    async def _bulk_upload_files(self, request: httpx.Request) -> httpx.Response:
+        form, files = _parse_multipart(request.headers.get("Content-Type", ""), await request.aread())
+        uploaded, failed = [], []
+        for _, file_name, content in files:
+            body, status_code = self._store_upload(file_name, content, {**form, "duplicate_handling": "suffix"})
+            if status_code < 400:
+                uploaded.append(body)
+            else:
+                failed.append({"file_name": file_name, "error": body["error"]["message"]})
+        return self._json(
+            {"uploaded": uploaded, "failed": failed, "total_uploaded": len(uploaded), "total_failed": len(failed)}
+        )
+
+    def _visible_files(self, request: httpx.Request) -> list[dict[str, Any]]:
+        params = request.url.params
+        user = self._resolve_user(params.get("user_id"))
+        entries = []
+        for entry in self._files.values():
+            metadata = self._file_metadata(entry)
+            if metadata["file_scope"] == "user" and (user is None or metadata["user_id"] != user["id"]):
+                continue
+            if (scope := params.get("scope")) and metadata["file_scope"] != scope:
+                continue
+            if (file_type := params.get("file_type")) and metadata["file_type"] != file_type:
+                continue
+            if (status := params.get("status")) and metadata["processing_status"] != status:
+                continue
+            if (tags := params.get("tags")) and not set(tags.split(",")) & set(metadata["tags"] or []):
+                continue
+            entries.append(entry)
+        return entries
+
+    async def _list_files(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params.get("page", 1))
+        limit = int(request.url.params.get("limit", 50))
+        files = [entry["metadata"] for entry in self._visible_files(request)]
+        start = (page - 1) * limit
+        return self._json(
+            {
+                "files": files[start:start + limit],
+                "total_count": len(files),
+                "page": page,
+                "limit": limit,
+                "has_more": start + limit < len(files),
+            }
+        )
+
+    async def _file_statistics(self, request: httpx.Request) -> httpx.Response:
+        files = [entry["metadata"] for entry in self._visible_files(request)]
+        total_size = sum(metadata["file_size"] for metadata in files)
+        processing = [
+            entry["processed_at"] - entry["uploaded_at"]
+            for entry in self._visible_files(request)
+            if entry["metadata"]["processing_status"] == "completed"
+        ]
+        return self._json(
+            {
+                "total_files": len(files),
+                "total_size_bytes": total_size,
+                "files_by_type": dict(Counter(metadata["file_type"] for metadata in files)),
+                "files_by_status": dict(Counter(metadata["processing_status"] for metadata in files)),
+                "files_by_scope": dict(Counter(metadata["file_scope"] for metadata in files)),
+                "average_file_size_bytes": total_size / len(files) if files else 0.0,
+                "average_processing_time_seconds": sum(processing) / len(processing) if processing else None,
+                "storage_usage_percentage": None,
+            }
+        )
+
+    async def _get_file(self, request: httpx.Request, file_id: str) -> httpx.Response:
+        entry = self._file(file_id)
+        if entry is None:
+            return self._error(404, "File not found")
+        return self._json(entry["metadata"])
+
+    async def _file_content(self, request: httpx.Request, file_id: str) -> httpx.Response:
+        entry = self._file(file_id)
+        if entry is None:
+            return self._error(404, "File not found")
+        if entry["metadata"]["processing_status"] != "completed":
+            return self._error(409, "File is still processing")
+        lines = entry["lines"]
+        start_line = int(request.url.params.get("start_line", 1))
+        end_line = int(request.url.params.get("end_line", len(lines)))
+        return self._json(
+            {
+                "file_id": file_id,
+                "content_type": request.url.params.get("content_type", "text"),
+                "text": "\n".join(lines[start_line - 1:end_line]),
+                "metadata": None,
+                "start_line": start_line,
+                "end_line": end_line,
+                "total_lines": len(lines),
+            }
+        )
+
+    async def _download_file(self, request: httpx.Request, file_id: str) -> httpx.Response:
+        entry = self._file(file_id)
+        if entry is None:
+            return self._error(404, "File not found")
+        return httpx.Response(200, content=entry["content"], headers={"Content-Type": entry["metadata"]["mime_type"]})
+
+    async def _file_status(self, request: httpx.Request, file_id: str) -> httpx.Response:
+        entry = self._file(file_id)
+        if entry is None:
+            return self._error(404, "File not found")
+        metadata = entry["metadata"]
+        remaining = max(0.0, entry["processed_at"] - self.clock.now())
+        total = metadata["total_chunks"]
+        done = metadata["processing_status"] == "completed"
+        return self._json(
+            {
+                "status": metadata["processing_status"],
+                "progress_percentage": 100.0 if done else (metadata["chunks_embedded"] / total * 100 if total else 0.0),
+                "chunks_embedded": metadata["chunks_embedded"],
+                "total_chunks": total,
+                "estimated_time_remaining_seconds": None if done else int(remaining + 0.999),
+                "error_message": metadata["error_message"],
+            }
+        )
+
+    async def _update_file_scope(self, request: httpx.Request, file_id: str) -> httpx.Response:
+        entry = self._file(file_id)
+        if entry is None:
+            return self._error(404, "File not found")
+        payload = json.loads(request.content or b"{}")
+        metadata = entry["metadata"]
+        metadata["file_scope"] = payload["scope"]
+        if payload.get("user_id"):
+            metadata["user_id"] = payload["user_id"]
+        metadata["updated_at"] = self._now()
+        return self._json(metadata)
+
+    async def _delete_file(self, request: httpx.Request, file_id: str) -> httpx.Response:
+        if self._files.pop(file_id, None) is None:
+            return self._error(404, "File not found")
+        return self._json({"message": "File deleted successfully"})
+
+    async def _bulk_delete_files(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content or b"{}")
+        deleted, failed = [], []
+        for file_id in payload.get("file_ids", []):
+            (deleted if self._files.pop(file_id, None) is not None else failed).append(file_id)
+        return self._json(
+            {
+                "deleted": deleted,
+                "failed": failed,
+                "hard_delete": request.url.params.get("hard_delete", "true") == "true",
+                "total_requested": len(deleted) + len(failed),
+            }
+        )
+
+    async def _search_files(self, request: httpx.Request) -> httpx.Response:
+        # Token overlap stands in for vector similarity
+        payload = json.loads(request.content or b"{}")
+        query = payload.get("query", "")
+        terms = set(_TOKEN_RE.findall(query.lower()))
+        min_score = payload.get("min_score") or 0.0
+        file_types = payload.get("file_types")
+        tags = set(payload.get("tags") or [])
+        user_id = payload.get("user_id")
+
+        results = []
+        for entry in self._files.values():
+            metadata = self._file_metadata(entry)
+            if metadata["processing_status"] != "completed":
+                continue
+            if metadata["file_scope"] == "user" and metadata["user_id"] != user_id:
+                continue
+            if file_types and metadata["file_type"] not in file_types:
+                continue
+            if tags and not tags & set(metadata["tags"] or []):
+                continue
+            chunks = []
+            for chunk in entry["chunks"]:
+                words = set(_TOKEN_RE.findall(chunk["chunk_text"].lower()))
+                score = len(terms & words) / len(terms) if terms else 0.0
+                if score > 0 and score >= min_score:
+                    chunks.append({**chunk, "similarity_score": score})
+            if chunks:
+                chunks.sort(key=lambda chunk: -chunk["similarity_score"])
+                results.append(
+                    {"file": metadata, "chunks": chunks, "overall_score": chunks[0]["similarity_score"]}
+                )
+
+        results.sort(key=lambda result: -result["overall_score"])
+        results = results[:payload.get("limit") or 10]
+        return self._json({"results": results, "total_count": len(results), "query": query, "processing_time_ms": 0})
+
+    # ------------------------------------------------------------------
+    # MCP servers
+    # ------------------------------------------------------------------
+
+    async def _create_mcp_server(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content or b"{}")
+        if any(server["name"] == payload.get("name") for server in self._mcp_servers.values()):
+            return self._error(409, f"MCP server {payload.get('name')} already exists")
+        user = None
+        if payload.get("scope") == "user":
+            user = self._resolve_user(payload.get("user_identifier"), create=True)
+            if user is None:
+                return self._error(422, "user_identifier is required for user scope")
+
+        now = self._now()
+        server = {
+            "id": self._id(),
+            "tenant_id": self.tenant_id,
+            "user_id": user["id"] if user else None,
+            "scope": payload.get("scope", "tenant"),
+            "name": payload["name"],
+            "description": payload.get("description"),
+            "transport": payload["transport"],
+            "command": payload.get("command"),
+            "args": payload.get("args"),
+            "url": payload.get("url"),
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+        self._mcp_servers[server["id"]] = server
+        return self._json(server, 201)
+
+    async def _list_mcp_servers(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        servers = list(self._mcp_servers.values())
+        if scope := params.get("scope"):
+            servers = [server for server in servers if server["scope"] == scope]
+        if identifier := params.get("user_identifier"):
+            user = self._resolve_user(identifier)
+            servers = [server for server in servers if user and server["user_id"] == user["id"]]
+        if (is_active := params.get("is_active")) is not None:
+            servers = [server for server in servers if server["is_active"] == (is_active == "true")]
+        skip = int(params.get("skip", 0))
+        limit = int(params.get("limit", 100))
+        return self._json({"servers": servers[skip:skip + limit], "total": len(servers), "skip": skip, "limit": limit})
+
+    async def _get_mcp_server(self, request: httpx.Request, server_id: str) -> httpx.Response:
+        server = self._mcp_servers.get(server_id)
+        if server is None:
+            return self._error(404, "MCP server not found")
+        return self._json(server)
+
+    async def _update_mcp_server(self, request: httpx.Request, server_id: str) -> httpx.Response:
+        server = self._mcp_servers.get(server_id)
+        if server is None:
+            return self._error(404, "MCP server not found")
+        payload = json.loads(request.content or b"{}")
+        for key in ("name", "description", "url", "is_active"):
+            if key in payload:
+                server[key] = payload[key]
+        server["updated_at"] = self._now()
+        return self._json(server)
+
+    async def _delete_mcp_server(self, request: httpx.Request, server_id: str) -> httpx.Response:
+        if self._mcp_servers.pop(server_id, None) is None:
+            return self._error(404, "MCP server not found")
+        return httpx.Response(204)
+
+    def _mcp_tools(self, server: dict[str, Any]) -> list[dict[str, Any]]:
+        return [
+            {
+                "name": f"{server['name']}_{action}",
+                "description": f"{action.capitalize()} through {server['name']}",
+                "input_schema": {"type": "object", "properties": {"query": {"type": "string"}}},
+            }
+            for action in ("search", "fetch")
+        ]
+
+    async def _mcp_server_tools(self, request: httpx.Request, server_id: str) -> httpx.Response:
+        server = self._mcp_servers.get(server_id)
+        if server is None:
+            return self._error(404, "MCP server not found")
+        tools = self._mcp_tools(server)
+        return self._json({"server_id": server_id, "server_name": server["name"], "tools": tools, "total": len(tools)})
+
+    async def _test_mcp_server(self, request: httpx.Request, server_id: str) -> httpx.Response:
+        server = self._mcp_servers.get(server_id)
+        if server is None:
+            return self._error(404, "MCP server not found")
+        if not server["is_active"]:
+            return self._json(
+                {"success": False, "message": "Connection failed", "tool_count": None,
+                 "error_details": "Server is inactive"}
+            )
+        return self._json(
+            {"success": True, "message": "Connection successful", "tool_count": len(self._mcp_tools(server)),
+             "error_details": None}
+        )
+
+    # ------------------------------------------------------------------
+    # Skills
+    # ------------------------------------------------------------------
+
+    async def _create_skill(self, request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content or b"{}")
+        user = self._resolve_user(request.url.params.get("user_id"), create=True)
+        now = self._now()
+        skill = {
+            "id": self._id(),
+            "name": payload["name"],
+            "description": payload["description"],
+            "content": payload["content"],
+            "category": payload.get("category"),
+            "version": payload.get("version", "1.0.0"),
+            "tenant_id": self.tenant_id,
+            "user_id": user["id"] if user else None,
+            "is_active": True,
+            "created_at": now,
+            "updated_at": now,
+        }
+        self._skills[skill["id"]] = skill
+        return self._json(skill, 201)
+
+    async def _list_skills(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        skills = list(self._skills.values())
+        if category := params.get("category"):
+            skills = [skill for skill in skills if skill["category"] == category]
+        if (is_active := params.get("is_active")) is not None:
+            skills = [skill for skill in skills if skill["is_active"] == (is_active == "true")]
+        page = int(params.get("page", 1))
+        page_size = int(params.get("page_size", 50))
+        start = (page - 1) * page_size
+        return self._json(
+            {"skills": skills[start:start + page_size], "total": len(skills), "page": page, "page_size": page_size}
+        )
+
+    async def _get_skill(self, request: httpx.Request, skill_id: str) -> httpx.Response:
+        skill = self._skills.get(skill_id)
+        if skill is None:
+            return self._error(404, "Skill not found")
+        return self._json(skill)
+
+    async def _update_skill(self, request: httpx.Request, skill_id: str) -> httpx.Response:
+        skill = self._skills.get(skill_id)
+        if skill is None:
+            return self._error(404, "Skill not found")
+        payload = json.loads(request.content or b"{}")
+        for key in ("name", "description", "content", "category", "version", "is_active"):
+            if key in payload:
+                skill[key] = payload[key]
+        skill["updated_at"] = self._now()
+        return self._json(skill)
+
+    async def _delete_skill(self, request: httpx.Request, skill_id: str) -> httpx.Response:
+        if self._skills.pop(skill_id, None) is None:
+            return self._error(404, "Skill not found")
+        return httpx.Response(204)
+
+
+def _is_uuid(value: str) -> bool:
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _parse_multipart(content_type: str, body: bytes) -> tuple[dict[str, str], list[tuple[str, str, bytes]]]:
+    """Split a multipart/form-data body into form fields and (field, filename, content) files."""
+    match = re.search(r'boundary="?([^";]+)"?', content_type)
+    if match is None:
+        return {}, []
+    delimiter = b"--" + match.group(1).encode()
+
+    form: dict[str, str] = {}
+    files: list[tuple[str, str, bytes]] = []
+    for part in body.split(delimiter)[1:]:
+        if part.startswith(b"--"):
+            break
+        # Each part is framed by the CRLF after the boundary and the CRLF before the next one
+        head, _, content = part[2:-2].partition(b"\r\n\r\n")
+        disposition = dict(re.findall(r'(\w+)="([^"]*)"', head.decode(errors="replace")))
+        if "filename" in disposition:
+            files.append((disposition.get("name", "file"), disposition["filename"], content))
+        elif "name" in disposition:
+            form[disposition["name"]] = content.decode()
+    return form, files
@@ -0,0 +1,106 @@
+"""Lifecycle timelines recorded by the invoke() poll loops."""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+from .models.response import (
+    ResponseObject,
+    ResponseTimeline,
+    StatusTransition,
+    ToolCallTiming,
+)
+
+
+class TimelineRecorder:
+    """
+    Collects what a poll loop observes about one response.
+
+    Call created() after the create request, observe() after every poll and
+    finish() with the terminal response.
+    """
+
+    def __init__(self) -> None:
+        self._started = time.monotonic()
+        self._create_seconds: float | None = None
+        self._time_to_first_progress: float | None = None
+        self._last_status: str | None = None
+        self._last_progress = 0
+        self._polls = 0
+        self._wasted_polls = 0
+        self._transitions: list[StatusTransition] = []
+
+    def _elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def _transition(self, status: str) -> bool:
+        if status == self._last_status:
+            return False
+        self._last_status = status
+        self._transitions.append(StatusTransition(status=status, observed_after=self._elapsed()))
+        return True
+
+    def created(self, status: str) -> None:
+        self._create_seconds = self._elapsed()
+        self._transition(status)
+
+    def observe(self, response: ResponseObject) -> None:
+        self._polls += 1
+        changed = self._transition(response.status)
+
+        progress_count = len(response.progress)
+        if progress_count > self._last_progress:
+            if self._time_to_first_progress is None:
+                self._time_to_first_progress = self._elapsed()
+            self._last_progress = progress_count
+            changed = True
+
+        if not changed:
+            self._wasted_polls += 1
+
+    def finish(self, response: ResponseObject) -> ResponseTimeline:
+        progress = response.progress
+        timestamps = [entry.ts for entry in progress]
+        if response.completed_at is not None:
+            timestamps.append(response.completed_at)
+
+        # A tool call runs from its progress entry until the next entry
+        tool_calls = [
+            ToolCallTiming(
+                names=[str(call.get("name", "unknown")) for call in entry.tool_calls],
+                started_at=entry.ts,
+                seconds=_seconds_between(entry.ts, timestamps[i + 1]) if i + 1 < len(timestamps) else None,
+            )
+            for i, entry in enumerate(progress)
+            if entry.tool_calls
+        ]
+
+        return ResponseTimeline(
+            response_id=response.response_id,
+            status=response.status,
+            create_seconds=self._create_seconds,
+            queued_seconds=_seconds_between(response.created_at, progress[0].ts) if progress else None,
+            time_to_first_progress=self._time_to_first_progress,
+            run_seconds=_seconds_between(progress[0].ts, response.completed_at) if progress else None,
+            total_seconds=self._elapsed(),
+            progress_gaps=[
+                _seconds_between(earlier.ts, later.ts)
+                for earlier, later in zip(progress, progress[1:])
+            ],
+            tool_calls=tool_calls,
+            polls=self._polls,
+            wasted_polls=self._wasted_polls,
+            transitions=self._transitions,
+        )
+
+
+def _seconds_between(start: datetime | None, end: datetime | None) -> float | None:
+    if start is None or end is None:
+        return None
+    # Progress timestamps may be naive while created_at is aware; naive is UTC
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    return (end - start).total_seconds()
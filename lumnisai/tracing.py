@@ -0,0 +1,207 @@
+"""
+Distributed tracing for SDK calls.
+
+When enabled with `AsyncClient(tracing=True)` and OpenTelemetry is installed
+(`pip install lumnisai[otel]`), the SDK emits a span for each high-level
+operation (invoke, file upload, file search) with a child CLIENT span per HTTP
+attempt, and injects W3C `traceparent`/`tracestate` headers into every request
+so the Lumnis service can join your trace. Spans are tagged with the
+response_id and the X-Request-ID returned by the service.
+
+Without OpenTelemetry, or with tracing disabled, every call here is a no-op.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any
+
+from ._transport.instrumentation import RequestInfo, TransportHooks
+
+try:
+    from opentelemetry import context, propagate, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # pragma: no cover - exercised when opentelemetry is absent
+    trace = None
+
+# X-Request-IDs of the responses received under the current SDK span
+_request_ids: ContextVar[list[str] | None] = ContextVar("lumnisai_request_ids", default=None)
+
+
+class _NoopSpan:
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def _attribute_value(value: Any) -> str | bool | int | float:
+    return value if isinstance(value, (str, bool, int, float)) else str(value)
+
+
+class Tracer:
+    """
+    Creates SDK spans and propagates trace context on outgoing requests.
+
+    A disabled tracer, or one created without OpenTelemetry installed, hands
+    out a shared no-op span and registers no transport hooks.
+    """
+
+    def __init__(self, enabled: bool = True, *, tracer_provider: Any = None):
+        self.enabled = enabled and trace is not None
+        self._tracer = None
+        if self.enabled:
+            from . import __version__
+
+            self._tracer = trace.get_tracer("lumnisai", __version__, tracer_provider=tracer_provider)
+
+    def attach(self, hooks: TransportHooks) -> None:
+        if not self.enabled:
+            return
+        hooks.on("request_start", self._on_request_start)
+        hooks.on("response_headers", self._on_response_headers)
+        hooks.on("response_end", self._on_response_end)
+        hooks.on("error", self._on_error)
+        hooks.on("cancelled", self._on_cancelled)
+
+    def span(self, name: str, **attributes: Any):
+        """Context manager for an SDK operation span; yields the span."""
+        if not self.enabled:
+            return nullcontext(_NOOP_SPAN)
+        return self._span(name, attributes)
+
+    @contextmanager
+    def _span(self, name: str, attributes: dict[str, Any]) -> Iterator[Any]:
+        request_ids: list[str] = []
+        token = _request_ids.set(request_ids)
+        try:
+            with self._tracer.start_as_current_span(name, attributes=_span_attributes(attributes)) as span:
+                try:
+                    yield span
+                finally:
+                    _tag_request_ids(span, request_ids)
+        finally:
+            _request_ids.reset(token)
+
+    async def stream(self, name: str, updates: AsyncIterator[Any], **attributes: Any) -> AsyncIterator[Any]:
+        """
+        Yield from `updates` under an SDK span that lasts until the stream ends.
+
+        The caller may consume the stream from other tasks, or abandon it and
+        leave it to be closed from the event loop's finalizer, so the span is
+        never left attached to a context across a `yield`: it is made current
+        only while the next update is produced.
+        """
+        if not self.enabled:
+            async for update in updates:
+                yield update
+            return
+
+        span = self._tracer.start_span(name, attributes=_span_attributes(attributes))
+        request_ids: list[str] = []
+        try:
+            while True:
+                with self._current(span, request_ids):
+                    try:
+                        update = await updates.__anext__()
+                    except StopAsyncIteration:
+                        break
+                    except Exception as e:
+                        span.record_exception(e)
+                        span.set_status(Status(StatusCode.ERROR, type(e).__name__))
+                        raise
+                yield update
+        finally:
+            aclose = getattr(updates, "aclose", None)
+            try:
+                if aclose is not None:
+                    with self._current(span, request_ids):
+                        await aclose()
+            finally:
+                _tag_request_ids(span, request_ids)
+                span.end()
+
+    @contextmanager
+    def _current(self, span: Any, request_ids: list[str]) -> Iterator[None]:
+        token = _request_ids.set(request_ids)
+        context_token = context.attach(trace.set_span_in_context(span))
+        try:
+            yield
+        finally:
+            context.detach(context_token)
+            _request_ids.reset(token)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Tag the current SDK span, e.g. with the response_id once known."""
+        if self.enabled and value is not None:
+            trace.get_current_span().set_attribute(f"lumnisai.{key}", _attribute_value(value))
+
+    # ------------------------------------------------------------------
+    # Transport hooks: one CLIENT span per HTTP attempt
+    # ------------------------------------------------------------------
+
+    def _on_request_start(self, info: RequestInfo) -> None:
+        span = self._tracer.start_span(
+            info.endpoint,
+            kind=SpanKind.CLIENT,
+            attributes={
+                "http.request.method": info.method,
+                "http.route": info.endpoint.split(" ", 1)[1],
+                "http.request.resend_count": info.attempt,
+            },
+        )
+        info.span = span
+        propagate.inject(info.headers, context=trace.set_span_in_context(span))
+
+    def _on_response_headers(self, info: RequestInfo) -> None:
+        span = info.span
+        if span is None:
+            return
+        span.set_attribute("http.response.status_code", info.status_code)
+        if info.request_id:
+            span.set_attribute("lumnisai.request_id", info.request_id)
+            request_ids = _request_ids.get()
+            if request_ids is not None:
+                request_ids.append(info.request_id)
+
+    def _on_response_end(self, info: RequestInfo) -> None:
+        if info.span is not None:
+            info.span.end()
+
+    def _on_error(self, info: RequestInfo) -> None:
+        span = info.span
+        if span is None:
+            return
+        if info.error is not None:
+            span.record_exception(info.error)
+            span.set_status(Status(StatusCode.ERROR, type(info.error).__name__))
+        span.end()
+
+    def _on_cancelled(self, info: RequestInfo) -> None:
+        if info.span is not None:
+            info.span.set_attribute("lumnisai.cancelled", True)
+            info.span.end()
+
+
+def _span_attributes(attributes: dict[str, Any]) -> dict[str, str | bool | int | float]:
+    return {
+        f"lumnisai.{key}": _attribute_value(value)
+        for key, value in attributes.items()
+        if value is not None
+    }
+
+
+def _tag_request_ids(span: Any, request_ids: list[str]) -> None:
+    if request_ids:
+        span.set_attribute("lumnisai.request_ids", request_ids)
+        span.set_attribute("lumnisai.request_id", request_ids[0])
+
+
+NOOP_TRACER = Tracer(enabled=False)
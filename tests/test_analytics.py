@@ -0,0 +1,68 @@
+"""Tests for response analytics."""
+
+from datetime import date
+
+import pytest
+
+from lumnisai import AsyncClient
+from lumnisai import analytics as analytics_module
+from lumnisai.analytics import ResponseColumns
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+def response(status, created, first_progress=None, completed=None):
+    return {
+        "status": status,
+        "created_at": f"2025-01-01T00:00:{created:02d}Z",
+        "completed_at": f"2025-01-01T00:00:{completed:02d}Z" if completed is not None else None,
+        "progress": [{"ts": f"2025-01-01T00:00:{first_progress:02d}Z"}] if first_progress is not None else [],
+    }
+
+
+@pytest.fixture(params=["numpy", "python"])
+def aggregation(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(analytics_module, "_has_numpy", lambda: False)
+    else:
+        pytest.importorskip("numpy")
+    return request.param
+
+
+def test_run_time_starts_at_first_progress(aggregation):
+    columns = ResponseColumns()
+    columns.append(response("succeeded", created=0, first_progress=10, completed=14))
+    columns.append(response("failed", created=0, first_progress=2, completed=8))
+    columns.append(response("failed", created=0, completed=1))
+    stats = columns.summarize(date(2025, 1, 1), date(2025, 1, 1)).overall
+
+    assert stats.queue_time.count == 2
+    assert stats.queue_time.max == 10
+    # The response that failed before any progress has no run time
+    assert stats.run_time.count == 2
+    assert stats.run_time.max == 6
+    assert stats.run_time.mean == 5
+
+
+def test_unrecognized_status_is_not_counted_as_queued(aggregation):
+    columns = ResponseColumns()
+    columns.append(response("queued", created=0))
+    columns.append(response("paused", created=0))
+    stats = columns.summarize(date(2025, 1, 1), date(2025, 1, 1)).overall
+
+    assert stats.status_counts == {"queued": 1, "unknown": 1}
+
+
+@pytest.mark.asyncio
+async def test_analytics_against_fake_server():
+    clock = FakeClock()
+    server = FakeLumnisServer(seed=1, clock=clock)
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        for _ in range(3):
+            server.script(queue_delay=5.0, progress=["a", "b", "c"], progress_interval=1.0)
+            await client.invoke("Hi", user_id="user@example.com", poll_interval=0)
+        stats = await client.responses.analytics(date(2025, 1, 1), date(2025, 1, 1))
+
+    assert stats.total == 3
+    assert stats.overall.status_counts == {"succeeded": 3}
+    assert stats.overall.queue_time.p50 == pytest.approx(5.0)
+    assert stats.overall.run_time.p50 == pytest.approx(3.0)
@@ -0,0 +1,35 @@
+"""Tests for the end-to-end benchmark suite."""
+
+import argparse
+
+import pytest
+
+from benchmarks.run import Result, bench_invoke, compare
+
+
+def test_compare_flags_regressions_in_the_metric_direction():
+    baseline = {"results": [
+        {"name": "throughput", "value": 100.0},
+        {"name": "p50", "value": 10.0},
+        {"name": "p95", "value": 20.0},
+    ]}
+    results = [
+        Result("throughput", 80.0, "invocations/s", True, {}),
+        Result("p50", 9.0, "ms", False, {}),
+        Result("p95", 25.0, "ms", False, {}),
+        Result("new_metric", 1.0, "ms", False, {}),
+    ]
+
+    regressions = compare(results, baseline, tolerance=0.15)
+
+    assert [line.split(":")[0] for line in regressions] == ["throughput", "p95"]
+
+
+@pytest.mark.asyncio
+async def test_invoke_benchmark_reports_every_concurrency_level():
+    args = argparse.Namespace(latency=0.0, progress_interval=0.0, progress_entries=1, concurrency=[1, 4])
+    results = await bench_invoke(args)
+
+    names = {result.name for result in results}
+    assert {"invoke.throughput[c=1]", "invoke.throughput[c=4]"} <= names
+    assert all(result.value > 0 for result in results)
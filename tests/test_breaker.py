@@ -0,0 +1,93 @@
+"""Tests for per-endpoint-group circuit breaking."""
+
+import asyncio
+
+import pytest
+
+from lumnisai import AsyncClient, CircuitBreaker, exceptions
+from lumnisai._transport import CircuitState
+from lumnisai.exceptions import CircuitOpenError, TransportError
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+MISSING = "00000000-0000-4000-8000-000000000000"
+
+
+def make_client(server, breaker):
+    return AsyncClient(
+        api_key="test", http_transport=server.transport(), circuit_breaker=breaker, max_retries=0
+    )
+
+
+@pytest.mark.asyncio
+async def test_failing_group_opens_without_affecting_others():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    (file_id,) = server.seed_files({"notes.txt": "hello"})
+    breaker = CircuitBreaker(min_calls=4, window=4, open_seconds=60)
+    server.inject(status=503, path=r"^/v1/files/")
+    async with make_client(server, breaker) as client:
+        for _ in range(4):
+            with pytest.raises(TransportError):
+                await client.files.get(file_id)
+        sent = server.calls["GET /v1/files/{id}"]
+
+        with pytest.raises(CircuitOpenError) as raised:
+            await client.files.get(file_id)
+        response = await client.invoke("Hi", user_id="user@example.com", poll_interval=0)
+
+    assert server.calls["GET /v1/files/{id}"] == sent
+    assert raised.value.endpoint_group == "files"
+    assert response.status == "succeeded"
+    assert breaker.states() == {"files": CircuitState.OPEN, "responses": CircuitState.CLOSED}
+    assert breaker.opened == 1
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_open_the_circuit():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    breaker = CircuitBreaker(min_calls=4, window=4)
+    async with make_client(server, breaker) as client:
+        for _ in range(8):
+            with pytest.raises(exceptions.FileNotFoundError):
+                await client.files.get(MISSING)
+
+    assert breaker.states() == {"files": CircuitState.CLOSED}
+    assert breaker.opened == 0
+
+
+@pytest.mark.asyncio
+async def test_successful_probe_closes_the_circuit():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    (file_id,) = server.seed_files({"notes.txt": "hello"})
+    breaker = CircuitBreaker(min_calls=2, window=2, open_seconds=0.05)
+    server.inject(status=503, path=r"^/v1/files/", count=2)
+    async with make_client(server, breaker) as client:
+        for _ in range(2):
+            with pytest.raises(TransportError):
+                await client.files.get(file_id)
+        assert breaker.states() == {"files": CircuitState.OPEN}
+
+        await asyncio.sleep(0.06)
+        assert breaker.states() == {"files": CircuitState.HALF_OPEN}
+        probed = await client.files.get(file_id)
+
+    assert str(probed.id) == file_id
+    assert breaker.states() == {"files": CircuitState.CLOSED}
+
+
+@pytest.mark.asyncio
+async def test_failed_probe_reopens_the_circuit():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    (file_id,) = server.seed_files({"notes.txt": "hello"})
+    breaker = CircuitBreaker(min_calls=2, window=2, open_seconds=0.05)
+    server.inject(status=503, path=r"^/v1/files/")
+    async with make_client(server, breaker) as client:
+        for _ in range(2):
+            with pytest.raises(TransportError):
+                await client.files.get(file_id)
+        await asyncio.sleep(0.06)
+        with pytest.raises(TransportError) as raised:
+            await client.files.get(file_id)
+
+    assert not isinstance(raised.value, CircuitOpenError)
+    assert breaker.states() == {"files": CircuitState.OPEN}
+    assert breaker.opened == 2
@@ -0,0 +1,70 @@
+"""Tests for the HTTP response cache."""
+
+import httpx
+import pytest
+
+from lumnisai import AsyncClient, HTTPCache, SkillGuidelineCreate
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+SKILL = SkillGuidelineCreate(name="Search", description="Find people", content="Use filters")
+
+
+def make_client(server, cache):
+    return AsyncClient(api_key="test", http_transport=server.transport(), http_cache=cache)
+
+
+@pytest.mark.asyncio
+async def test_etag_responses_are_revalidated():
+    server = FakeLumnisServer(seed=1, clock=FakeClock(), etags=True)
+    cache = HTTPCache({"GET /v1/skills": 60.0})
+    async with make_client(server, cache) as client:
+        await client.skills.create(skill_data=SKILL)
+        first = await client.skills.list()
+        second = await client.skills.list()
+
+    assert server.calls["GET /v1/skills"] == 2
+    assert (cache.misses, cache.revalidated, cache.hits) == (1, 1, 0)
+    assert second == first
+    assert second is not first
+
+
+@pytest.mark.asyncio
+async def test_fresh_responses_are_served_without_a_request():
+    server = FakeLumnisServer(seed=1, clock=FakeClock(), etags=False)
+    cache = HTTPCache({"GET /v1/skills": 60.0})
+    async with make_client(server, cache) as client:
+        await client.skills.create(skill_data=SKILL)
+        first = await client.skills.list()
+        first.skills.clear()
+        second = await client.skills.list()
+
+    assert server.calls["GET /v1/skills"] == 1
+    assert cache.hits == 1
+    # The caller's copy was mutated, not the cached body
+    assert len(second.skills) == 1
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_the_collection():
+    server = FakeLumnisServer(seed=1, clock=FakeClock(), etags=False)
+    cache = HTTPCache({"GET /v1/skills": 60.0})
+    async with make_client(server, cache) as client:
+        await client.skills.create(skill_data=SKILL)
+        await client.skills.list()
+        await client.skills.create(skill_data=SKILL)
+        listed = await client.skills.list()
+
+    assert server.calls["GET /v1/skills"] == 2
+    assert len(listed.skills) == 2
+    assert len(cache) == 1
+
+
+def test_entries_are_evicted_past_max_entries():
+    cache = HTTPCache({"GET /v1/skills": 60.0}, max_entries=2)
+    for page in range(3):
+        entry = cache.lookup("GET /v1/skills", "https://api.test/v1/skills", {"page": page}, "Bearer test")
+        cache.store(entry, httpx.Response(200, content=b"{}"), {"page": page})
+
+    assert len(cache) == 2
+    assert cache.lookup("GET /v1/skills", "https://api.test/v1/skills", {"page": 0}, "Bearer test").stored is False
+    assert cache.lookup("GET /v1/skills", "https://api.test/v1/skills", {"page": 2}, "Bearer test").stored is True
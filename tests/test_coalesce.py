@@ -0,0 +1,49 @@
+"""Tests for coalescing identical concurrent requests."""
+
+import asyncio
+
+import pytest
+
+from lumnisai import AsyncClient
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+async def make_response(server):
+    client = AsyncClient(api_key="test", http_transport=server.transport())
+    await client.init()
+    response = await client.invoke("Hi", user_id="user@example.com", poll_interval=0)
+    return client, response.response_id
+
+
+@pytest.mark.asyncio
+async def test_coalesced_callers_get_their_own_result():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    client, response_id = await make_response(server)
+    async with client:
+        fetches = server.calls["GET /v1/responses/{id}"]
+        first, second, third = await asyncio.gather(*(client.get_response(response_id) for _ in range(3)))
+
+        assert server.calls["GET /v1/responses/{id}"] == fetches + 1
+        assert client._transport.singleflight.coalesced == 2
+        assert first == second == third
+        assert len({id(first), id(second), id(third)}) == 3
+
+        first.output_text = "changed"
+        first.progress.clear()
+        assert second.output_text == third.output_text != "changed"
+        assert second.progress and third.progress
+
+
+@pytest.mark.asyncio
+async def test_calls_with_different_options_are_not_coalesced():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    client, response_id = await make_response(server)
+    async with client:
+        fetches = server.calls["GET /v1/responses/{id}"]
+        path = f"/v1/responses/{response_id}"
+        await asyncio.gather(
+            client._transport.request("GET", path),
+            client._transport.request("GET", path, timeout=1.0),
+        )
+
+    assert server.calls["GET /v1/responses/{id}"] == fetches + 2
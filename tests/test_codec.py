@@ -0,0 +1,60 @@
+"""Tests for the JSON codec of request and response bodies."""
+
+import json
+
+import pytest
+
+from lumnisai import AsyncClient
+from lumnisai._transport import codec
+from lumnisai.models import ResponseObject
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+BACKENDS = [("json", codec._stdlib_dumps, codec._stdlib_loads)]
+if codec.orjson is not None:
+    BACKENDS.append(("orjson", codec._orjson_dumps, codec._orjson_loads))
+if codec.msgspec is not None:
+    BACKENDS.append(("msgspec", codec._msgspec_dumps, codec._msgspec_loads))
+
+
+@pytest.mark.parametrize("name,dumps,loads", BACKENDS, ids=[name for name, _, _ in BACKENDS])
+def test_backends_agree_with_the_standard_library(name, dumps, loads):
+    body = {"text": "héllo ✓", "items": [1, 2.5, None, True], "nested": {"a": []}}
+
+    encoded = dumps(body)
+
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == body
+    assert loads(encoded) == body
+    assert loads(encoded.decode()) == body
+
+
+@pytest.mark.parametrize("name,dumps,loads", BACKENDS, ids=[name for name, _, _ in BACKENDS])
+def test_invalid_json_raises_value_error(name, dumps, loads):
+    with pytest.raises(ValueError):
+        loads(b"{not json")
+
+
+def test_validate_builds_the_model():
+    body = {
+        "response_id": "00000000-0000-4000-8000-000000000001",
+        "thread_id": "00000000-0000-4000-8000-000000000002",
+        "tenant_id": "00000000-0000-4000-8000-000000000003",
+        "status": "succeeded",
+        "progress": [],
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+
+    response = codec.validate(ResponseObject, json.dumps(body).encode())
+
+    assert response.status == "succeeded"
+    assert str(response.thread_id).endswith("2")
+
+
+@pytest.mark.asyncio
+async def test_request_bodies_round_trip_through_the_client():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        response = await client.invoke("Résumé ✓", user_id="user@example.com", poll_interval=0)
+        thread = await client.threads.update(response.thread_id, title="Ünïcode")
+
+    assert thread.title == "Ünïcode"
@@ -0,0 +1,56 @@
+"""Tests for streaming thread export."""
+
+import asyncio
+import json
+
+import pytest
+
+from lumnisai import AsyncClient
+from lumnisai.export import _JsonlWriter
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+@pytest.fixture
+def server():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.seed_responses(60, thread_size=2)
+    return server
+
+
+@pytest.mark.asyncio
+async def test_export_jsonl(server, tmp_path):
+    destination = tmp_path / "history.jsonl"
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        result = await client.threads.export(destination, checkpoint=tmp_path / "history.ckpt")
+
+    lines = destination.read_text().splitlines()
+    assert result.threads_exported == 30
+    assert result.responses_exported == 60
+    assert len({json.loads(line)["response_id"] for line in lines}) == 60
+
+
+@pytest.mark.asyncio
+async def test_export_stops_when_writer_fails(server, tmp_path, monkeypatch):
+    def fail(self, records):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(_JsonlWriter, "write", fail)
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        with pytest.raises(OSError, match="No space left"):
+            await asyncio.wait_for(
+                client.threads.export(tmp_path / "history.jsonl", concurrency=2), timeout=10
+            )
+
+
+@pytest.mark.asyncio
+async def test_export_refuses_to_replace_existing_output(server, tmp_path):
+    destination = tmp_path / "history.jsonl"
+    destination.write_text("earlier export\n")
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        with pytest.raises(FileExistsError):
+            await client.threads.export(destination)
+        assert destination.read_text() == "earlier export\n"
+
+        result = await client.threads.export(destination, overwrite=True)
+
+    assert len(destination.read_text().splitlines()) == result.responses_exported == 60
@@ -0,0 +1,64 @@
+"""Tests for file statistics."""
+
+import pytest
+
+from lumnisai import AsyncClient
+from lumnisai.exceptions import TransportError, ValidationError
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+def make_server(count):
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.seed_files({f"file-{i}.{'txt' if i % 3 else 'md'}": "x" * (i + 1) for i in range(count)})
+    return server
+
+
+@pytest.mark.asyncio
+async def test_statistics_from_the_server():
+    server = make_server(10)
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        stats = await client.files.statistics()
+
+    assert stats.total_files == 10
+    assert server.calls["GET /v1/files/"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [404, 405])
+async def test_statistics_are_aggregated_from_listing_pages_without_the_endpoint(status):
+    server = make_server(250)
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        expected = await client.files.statistics()
+        server.inject(status=status, path=r"^/v1/files/statistics$")
+        stats = await client.files.statistics(page_size=100, concurrency=2)
+
+    assert server.calls["GET /v1/files/"] == 3
+    assert stats.total_files == expected.total_files == 250
+    assert stats.total_size_bytes == expected.total_size_bytes == sum(range(1, 251))
+    assert stats.files_by_type == expected.files_by_type
+    assert stats.files_by_status == expected.files_by_status
+    assert stats.files_by_scope == expected.files_by_scope
+    assert stats.average_file_size_bytes == pytest.approx(expected.average_file_size_bytes)
+    assert stats.storage_usage_percentage is None
+
+
+@pytest.mark.asyncio
+async def test_statistics_do_not_fall_back_on_server_errors():
+    server = make_server(3)
+    server.inject(status=500, path=r"^/v1/files/statistics$")
+    async with AsyncClient(api_key="test", http_transport=server.transport(), max_retries=0) as client:
+        with pytest.raises(TransportError):
+            await client.files.statistics()
+
+    assert server.calls["GET /v1/files/"] == 0
+
+
+@pytest.mark.asyncio
+async def test_statistics_validation_errors_are_raised():
+    server = make_server(3)
+    server.inject(status=422, path=r"^/v1/files/statistics$")
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        with pytest.raises(ValidationError):
+            await client.files.statistics(user_id="user@example.com")
+
+    assert server.calls["GET /v1/files/"] == 0
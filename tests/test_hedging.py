@@ -0,0 +1,64 @@
+"""Tests for hedged reads."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from lumnisai import AsyncClient, HedgePolicy
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+@pytest.mark.asyncio
+async def test_hedge_is_counted_and_timed_as_its_own_attempt():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    stuck = False
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal stuck
+        if stuck:
+            # The primary attempt of the last read is stuck
+            stuck = False
+            await asyncio.sleep(1.0)
+        return await server.handle(request)
+
+    policy = HedgePolicy(min_samples=3, min_delay=0.02, max_delay=0.05, burst=1.0)
+    started = []
+    pool_waits = []
+
+    def on_start(info):
+        started.append(info)
+        pool_waits.append(info.pool_wait)
+        # Timings the primary measured before the hedge was sent
+        info.pool_wait = 0.5
+        info._trace_events["connection.connect_tcp.started"] = info.started_at
+
+    ended = []
+    async with AsyncClient(
+        api_key="test", http_transport=httpx.MockTransport(handler), hedging=policy, collect_stats=True
+    ) as client:
+        response = await client.invoke("Hi", user_id="user@example.com", poll_interval=0)
+        for _ in range(5):
+            await client.get_response(response.response_id)
+        reads = client.stats().endpoints
+
+        stuck = True
+        client.hooks.on("request_start", on_start)
+        client.hooks.on("response_end", ended.append)
+        read = await client.get_response(response.response_id)
+        stats = client.stats()
+
+    assert read.response_id == response.response_id
+    assert (policy.hedged, policy.won) == (1, 1)
+    primary, hedge = started
+    assert not primary.hedge and hedge.hedge
+    assert hedge is not primary
+    assert hedge._trace_events is not primary._trace_events
+    assert pool_waits == [None, None]
+    # Only the winning hedge finished, with its own status and timings
+    assert ended == [hedge]
+    assert hedge.status_code == 200
+    assert hedge.elapsed is not None and hedge.elapsed < 0.5
+    before = next(stats for stats in reads if stats.endpoint == "GET /v1/responses/{id}")
+    after = next(stats for stats in stats.endpoints if stats.endpoint == "GET /v1/responses/{id}")
+    assert after.requests == before.requests + 1
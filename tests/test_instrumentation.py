@@ -0,0 +1,45 @@
+"""Tests for transport hooks and statistics."""
+
+import pytest
+
+from lumnisai import AsyncClient
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+@pytest.mark.asyncio
+async def test_stats_count_requests_retries_and_statuses():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.inject(status=503, path="/v1/threads", count=2)
+    async with AsyncClient(
+        api_key="test", http_transport=server.transport(), collect_stats=True, max_retries=3
+    ) as client:
+        await client.threads.list()
+        await client.threads.list()
+        snapshot = client.stats()
+
+    threads = next(stats for stats in snapshot.endpoints if stats.endpoint == "GET /v1/threads")
+    assert threads.requests == 4
+    assert threads.retries == 2
+    assert threads.status_counts == {"503": 2, "200": 2}
+    assert threads.latency.count == 4
+
+
+@pytest.mark.asyncio
+async def test_hooks_see_every_attempt_in_order():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.inject(status=503, path="/v1/threads", count=1)
+    events = []
+    async with AsyncClient(api_key="test", http_transport=server.transport(), max_retries=3) as client:
+        for event in ("request_start", "response_headers", "response_end", "retry", "error"):
+            client.hooks.on(event, lambda info, event=event: events.append((event, info.attempt)))
+        await client.threads.list()
+
+    assert events == [
+        ("request_start", 0),
+        ("response_headers", 0),
+        ("error", 0),
+        ("retry", 0),
+        ("request_start", 1),
+        ("response_headers", 1),
+        ("response_end", 1),
+    ]
@@ -0,0 +1,73 @@
+"""Tests for the bulk transfer lane."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from lumnisai import AsyncClient, BulkLane
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+def counting_transport(server):
+    """A transport over `server` recording the most uploads in flight at once."""
+    uploads = {"in_flight": 0, "max": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path != "/v1/files/upload":
+            return await server.handle(request)
+        uploads["in_flight"] += 1
+        uploads["max"] = max(uploads["max"], uploads["in_flight"])
+        try:
+            await asyncio.sleep(0.01)
+            return await server.handle(request)
+        finally:
+            uploads["in_flight"] -= 1
+
+    return httpx.MockTransport(handler), uploads
+
+
+async def upload_many(client, count):
+    await asyncio.gather(
+        *(client.files.upload(file_content=b"hello", file_name=f"file-{i}.txt") for i in range(count))
+    )
+
+
+@pytest.mark.asyncio
+async def test_lane_is_off_by_default():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    transport, uploads = counting_transport(server)
+    async with AsyncClient(api_key="test", http_transport=transport) as client:
+        await upload_many(client, 6)
+        assert client._transport.bulk_lane is None
+        assert client._transport._bulk_client is None
+
+    assert uploads["max"] == 6
+
+
+@pytest.mark.asyncio
+async def test_lane_limits_transfers_in_flight():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    transport, uploads = counting_transport(server)
+    lane = BulkLane(max_concurrency=2)
+    async with AsyncClient(api_key="test", http_transport=transport, bulk_lane=lane) as client:
+        await upload_many(client, 6)
+        assert client._transport._bulk_client is not None
+
+        async with client.for_user("user@example.com") as scoped:
+            assert scoped._transport.bulk_lane is lane
+
+    assert uploads["max"] == 2
+    assert lane.in_flight == lane.waiting == 0
+
+
+@pytest.mark.asyncio
+async def test_lane_can_be_enabled_with_defaults():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    async with AsyncClient(api_key="test", http_transport=server.transport(), bulk_lane=True) as client:
+        await client.init()
+        lane = client._transport.bulk_lane
+
+    assert isinstance(lane, BulkLane)
+    assert lane.covers("POST /v1/files/upload")
+    assert not lane.covers("GET /v1/responses/{id}")
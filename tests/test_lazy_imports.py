@@ -0,0 +1,39 @@
+"""Tests for lazily loaded package exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import lumnisai
+
+
+def run(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+
+
+def test_import_does_not_load_models_or_transport():
+    loaded = run(
+        "import sys, lumnisai; "
+        "print(*[m for m in ('lumnisai.models', 'lumnisai.async_client', 'lumnisai._transport', 'httpx', 'pydantic') if m in sys.modules])"
+    )
+    assert loaded == []
+
+
+def test_names_load_on_first_access_and_are_cached():
+    loaded = run(
+        "import sys, lumnisai; lumnisai.AgentConfig; "
+        "print('lumnisai.models' in sys.modules, 'AgentConfig' in vars(lumnisai), 'lumnisai.async_client' in sys.modules)"
+    )
+    assert loaded == ["True", "True", "False"]
+
+
+@pytest.mark.parametrize("name", lumnisai.__all__)
+def test_every_public_name_resolves(name):
+    assert getattr(lumnisai, name) is not None
+    assert name in dir(lumnisai)
+
+
+def test_unknown_names_raise_attribute_error():
+    with pytest.raises(AttributeError):
+        lumnisai.DoesNotExist  # noqa: B018
@@ -0,0 +1,111 @@
+"""Tests for the adaptive concurrency limiter."""
+
+import random
+
+import httpx
+import pytest
+
+from lumnisai import AsyncClient, ConcurrencyLimiter
+from lumnisai._transport import limiter as limiter_module
+from lumnisai.exceptions import RateLimitError
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+class FakeTime:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeTime()
+    monkeypatch.setattr(limiter_module, "time", fake)
+    return fake
+
+
+async def respond(limiter, clock, latency, error=None):
+    async with limiter.slot("GET /v1/responses/{id}"):
+        clock.now += latency
+        if error is not None:
+            raise error
+
+
+@pytest.mark.asyncio
+async def test_limit_holds_under_jittery_healthy_latency(clock):
+    rng = random.Random(7)
+    limiter = ConcurrencyLimiter(initial_limit=20, max_limit=50)
+    for _ in range(5000):
+        await respond(limiter, clock, rng.lognormvariate(-2.3, 0.4))
+
+    assert limiter.decreases == 0
+    assert limiter.limit == 50
+
+
+@pytest.mark.asyncio
+async def test_sustained_latency_rise_lowers_the_limit(clock):
+    rng = random.Random(7)
+    limiter = ConcurrencyLimiter(initial_limit=40, max_limit=50)
+    for _ in range(200):
+        await respond(limiter, clock, rng.lognormvariate(-2.3, 0.4))
+    assert limiter.decreases == 0
+
+    for _ in range(4):
+        await respond(limiter, clock, rng.lognormvariate(-2.3 + 1.4, 0.4))
+    assert limiter.decreases == 0
+
+    for _ in range(20):
+        await respond(limiter, clock, rng.lognormvariate(-2.3 + 1.4, 0.4))
+    assert limiter.decreases >= 1
+    assert limiter.limit < 40
+
+
+@pytest.mark.asyncio
+async def test_limit_stays_down_while_latency_stays_high(clock):
+    rng = random.Random(7)
+    limiter = ConcurrencyLimiter(initial_limit=40, max_limit=50, window=100)
+    for _ in range(200):
+        await respond(limiter, clock, rng.lognormvariate(-2.3, 0.4))
+    assert limiter.decreases == 0
+
+    # Elevated for three windows: the rise must not become the new baseline
+    for _ in range(300):
+        await respond(limiter, clock, rng.lognormvariate(-2.3 + 1.4, 0.4))
+    increases = limiter.increases
+    for _ in range(100):
+        await respond(limiter, clock, rng.lognormvariate(-2.3 + 1.4, 0.4))
+
+    assert limiter.increases == increases
+    assert limiter.limit < 40
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [RateLimitError(), httpx.ReadTimeout("timed out")],
+    ids=["429", "timeout"],
+)
+async def test_overload_errors_halve_the_limit(clock, error):
+    limiter = ConcurrencyLimiter(initial_limit=20)
+    with pytest.raises(type(error)):
+        await respond(limiter, clock, 0.1, error)
+
+    assert limiter.limit == 10
+    assert limiter.decreases == 1
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_requests_lower_the_client_limit():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    limiter = ConcurrencyLimiter(initial_limit=20)
+    async with AsyncClient(
+        api_key="test", http_transport=server.transport(), concurrency_limiter=limiter, max_retries=0
+    ) as client:
+        server.inject(status=429, count=1, retry_after=1)
+        with pytest.raises(RateLimitError):
+            await client.files.list()
+
+    assert limiter.decreases == 1
+    assert limiter.limit == 10
@@ -0,0 +1,24 @@
+"""Tests for the serialization microbenchmarks."""
+
+import argparse
+
+import pytest
+
+from benchmarks.micro import CASES, measure
+
+
+@pytest.fixture
+def args():
+    return argparse.Namespace(
+        duration=0.01, progress_entries=5, args_size=10, structured_items=5, error_items=5
+    )
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case.name for case in CASES])
+def test_case_reports_throughput_and_allocations(case, args):
+    results = {result.name: result for result in measure(case, args)}
+
+    assert results[f"{case.name}.ops"].value > 0
+    assert results[f"{case.name}.ops"].higher_is_better
+    assert results[f"{case.name}.alloc"].value >= 0
+    assert not results[f"{case.name}.alloc"].higher_is_better
@@ -0,0 +1,87 @@
+"""Tests for transport profiles."""
+
+import dataclasses
+import socket
+
+import httpx
+import pytest
+
+from lumnisai import AsyncClient
+from lumnisai._transport import PROFILES, TransportProfile
+from lumnisai._transport.profile import resolve_profile
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+def test_default_profile_without_environment():
+    assert resolve_profile(environ={}) == TransportProfile()
+
+
+def test_preset_from_argument_or_environment():
+    assert resolve_profile("batch", environ={}) is PROFILES["batch"]
+    assert resolve_profile(environ={"LUMNISAI_TRANSPORT_PROFILE": "serverless"}) is PROFILES["serverless"]
+    # An explicit profile wins over the environment
+    custom = TransportProfile(max_connections=3)
+    assert resolve_profile(custom, environ={"LUMNISAI_MAX_CONNECTIONS": "50"}) is custom
+
+
+def test_environment_overrides_preset_fields():
+    profile = resolve_profile(
+        "high-concurrency",
+        environ={
+            "LUMNISAI_MAX_CONNECTIONS": "250",
+            "LUMNISAI_HTTP2": "off",
+            "LUMNISAI_READ_TIMEOUT": "12.5",
+            "LUMNISAI_LOCAL_ADDRESS": "10.0.0.2",
+            "LUMNISAI_POOL_TIMEOUT": "",
+        },
+    )
+
+    assert profile == dataclasses.replace(
+        PROFILES["high-concurrency"],
+        max_connections=250,
+        http2=False,
+        read_timeout=12.5,
+        local_address="10.0.0.2",
+    )
+
+
+@pytest.mark.parametrize(
+    "environ,message",
+    [
+        ({"LUMNISAI_TRANSPORT_PROFILE": "huge"}, "Unknown transport profile 'huge'"),
+        ({"LUMNISAI_MAX_CONNECTIONS": "many"}, "Invalid value for LUMNISAI_MAX_CONNECTIONS"),
+        ({"LUMNISAI_HTTP2": "maybe"}, "Invalid value for LUMNISAI_HTTP2"),
+    ],
+)
+def test_invalid_settings_are_rejected(environ, message):
+    with pytest.raises(ValueError, match=message):
+        resolve_profile(environ=environ)
+
+
+def test_unset_timeouts_use_the_client_timeout():
+    timeouts = TransportProfile(connect_timeout=5.0).timeouts(30.0)
+
+    assert (timeouts.connect, timeouts.read, timeouts.write, timeouts.pool) == (5.0, 30.0, 30.0, 30.0)
+
+
+def test_socket_options_only_with_tcp_keepalive():
+    assert TransportProfile().socket_options() is None
+    assert TransportProfile().http_transport() is None
+
+    options = TransportProfile(tcp_keepalive=True).socket_options()
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    transport = TransportProfile(tcp_keepalive=True, http2=False).http_transport()
+    assert isinstance(transport, httpx.AsyncHTTPTransport)
+
+
+@pytest.mark.asyncio
+async def test_client_pool_uses_the_profile():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    async with AsyncClient(
+        api_key="test", http_transport=server.transport(), timeout=20.0, transport_profile="batch"
+    ) as client:
+        await client.init()
+        timeout = client._transport.client.timeout
+
+    assert client._config.transport_profile is PROFILES["batch"]
+    assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (10.0, 300.0, 300.0, 20.0)
@@ -0,0 +1,139 @@
+"""Tests for the rate limiter shared between processes."""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from lumnisai import AsyncClient, SharedRateLimiter
+from lumnisai._transport import ratelimit
+from lumnisai.exceptions import RateLimitError
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+@pytest.fixture
+def limiters(tmp_path):
+    opened = []
+
+    def open_limiter(**kwargs):
+        limiter = SharedRateLimiter(directory=tmp_path, name="tenant", **kwargs)
+        opened.append(limiter)
+        return limiter
+
+    yield open_limiter
+    for limiter in opened:
+        limiter.close()
+
+
+def write_state(limiter, tokens, refilled_at, cooldown_until):
+    ratelimit._STATE.pack_into(limiter._map, 0, tokens, refilled_at, cooldown_until)
+
+
+@pytest.mark.asyncio
+async def test_limiters_with_one_name_share_the_bucket(limiters):
+    first = limiters(rate=10, burst=2)
+    second = limiters(rate=10, burst=2)
+
+    await first.acquire()
+    await second.acquire()
+    started = time.monotonic()
+    await first.acquire()
+
+    assert time.monotonic() - started >= 0.08
+    assert (first.throttled, second.throttled) == (1, 0)
+
+
+@pytest.mark.asyncio
+async def test_cooldown_pauses_every_limiter(limiters):
+    first = limiters(rate=100)
+    second = limiters(rate=100)
+
+    await first.pause(0.05)
+    assert second.cooldown_remaining > 0.0
+    started = time.monotonic()
+    await second.acquire()
+
+    assert time.monotonic() - started >= 0.04
+    assert first.cooldowns == 1
+
+
+def test_cooldown_is_capped(limiters):
+    limiter = limiters(rate=100, max_cooldown=1.0)
+
+    limiter.cooldown(3600)
+
+    assert 0.0 < limiter.cooldown_remaining <= 1.0
+
+
+def test_deadline_from_before_the_clock_stepped_back_is_ignored(limiters):
+    limiter = limiters(rate=10, burst=5)
+    now = time.time()
+    write_state(limiter, 0.0, now + 3600, now + 3600)
+
+    assert limiter.cooldown_remaining == 0.0
+    wait, reserved = limiter._take()
+    assert reserved
+    assert wait == pytest.approx(0.1)
+
+
+def test_state_written_with_the_monotonic_clock_refills(limiters):
+    limiter = limiters(rate=10, burst=5)
+    write_state(limiter, -3.0, time.monotonic(), time.monotonic() + 60)
+
+    assert limiter._take() == (0.0, True)
+
+
+def test_clock_stepping_back_adds_no_tokens(limiters, monkeypatch):
+    limiter = limiters(rate=1, burst=1)
+    now = time.time()
+    monkeypatch.setattr(ratelimit.time, "time", lambda: now)
+    write_state(limiter, 0.0, now + 60, 0.0)
+
+    wait, reserved = limiter._take()
+
+    assert reserved
+    assert wait == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(ratelimit.fcntl is None, reason="flock is POSIX only")
+async def test_waiting_for_the_file_lock_does_not_block_the_event_loop(limiters):
+    limiter = limiters(rate=100)
+    # A second open file description contends like another process would
+    other = os.open(limiter.path, os.O_RDWR)
+    ratelimit.fcntl.flock(other, ratelimit.fcntl.LOCK_EX)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker = asyncio.create_task(tick())
+    try:
+        acquiring = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.1)
+        assert not acquiring.done()
+        assert ticks >= 5
+        ratelimit.fcntl.flock(other, ratelimit.fcntl.LOCK_UN)
+        await asyncio.wait_for(acquiring, timeout=1)
+    finally:
+        ticker.cancel()
+        os.close(other)
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_the_shared_bucket(limiters):
+    limiter = limiters(rate=100)
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.inject(status=429, count=1, retry_after=30)
+    async with AsyncClient(
+        api_key="test", http_transport=server.transport(), rate_limiter=limiter, max_retries=0
+    ) as client:
+        with pytest.raises(RateLimitError):
+            await client.files.list()
+
+    assert limiter.cooldowns == 1
+    assert 25 < limiter.cooldown_remaining <= 30
@@ -0,0 +1,79 @@
+"""Tests for time-sharded response listing."""
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from lumnisai import AsyncClient
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+# The fake's clock starts on 2025-01-01; seeded responses go back 30 days
+START, END = date(2024, 12, 1), date(2025, 1, 1)
+
+
+def make_server(count):
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.seed_responses(count, days=30)
+    return server
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shards,max_window_size", [(1, 1000), (4, 1000), (8, 20)])
+async def test_scan_yields_every_response_once_in_order(shards, max_window_size):
+    server = make_server(300)
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        responses = [
+            response
+            async for response in client.responses.scan(START, END, shards=shards, max_window_size=max_window_size)
+        ]
+
+    created = [response.created_at for response in responses]
+    assert len(responses) == 300
+    assert len({response.response_id for response in responses}) == 300
+    assert created == sorted(created)
+
+
+@pytest.mark.asyncio
+async def test_dense_windows_are_split():
+    requests = {}
+    for max_window_size in (1000, 50):
+        server = make_server(300)
+        async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+            count = 0
+            async for _ in client.responses.scan(START, END, shards=2, max_window_size=max_window_size):
+                count += 1
+        assert count == 300
+        requests[max_window_size] = server.calls["GET /v1/responses"]
+
+    # Two windows of 150 take two pages each; windows over 50 are split
+    # into ones small enough for a single page
+    assert requests[1000] == 4
+    assert requests[50] > requests[1000]
+
+
+@pytest.mark.asyncio
+async def test_scan_outside_the_range_or_reversed_is_empty():
+    server = make_server(30)
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        before = [response async for response in client.responses.scan(date(2024, 1, 1), date(2024, 1, 31))]
+        reversed_range = [response async for response in client.responses.scan(END, START)]
+
+    assert before == []
+    assert reversed_range == []
+
+
+@pytest.mark.asyncio
+async def test_breaking_early_cancels_pending_windows():
+    server = make_server(300)
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        scan = client.responses.scan(START, END, shards=8)
+        first = await scan.__anext__()
+        await scan.aclose()
+        await asyncio.sleep(0)
+        running = [
+            task for task in asyncio.all_tasks() if "fetch_window" in repr(task.get_coro()) and not task.done()
+        ]
+
+    assert first.created_at is not None
+    assert running == []
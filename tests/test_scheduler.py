@@ -0,0 +1,68 @@
+"""Tests for priority admission."""
+
+import asyncio
+
+import pytest
+
+from lumnisai import AsyncClient, ConcurrencyLimiter, PriorityScheduler
+from lumnisai._transport import Priority, request_priority
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+async def occupy(scheduler, priority, count):
+    """Ask for `count` slots of `priority`; returns the holders and a release event."""
+    release = asyncio.Event()
+    admitted = []
+
+    async def hold():
+        async with scheduler.slot(Priority(priority)):
+            admitted.append(priority)
+            await release.wait()
+
+    holders = [asyncio.create_task(hold()) for _ in range(count)]
+    await asyncio.sleep(0)
+    return holders, release, admitted
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit,batch_admitted", [(6, 4), (4, 2), (1, 1)])
+async def test_admission_follows_the_limiter(limit, batch_admitted):
+    scheduler = PriorityScheduler(capacity=20, reserved={"interactive": 2})
+    scheduler.limiter = ConcurrencyLimiter(initial_limit=limit, min_limit=1)
+
+    holders, release, admitted = await occupy(scheduler, "batch", 10)
+
+    assert len(admitted) == batch_admitted
+    assert scheduler.in_flight <= limit
+    release.set()
+    await asyncio.gather(*holders)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit,interactive_admitted", [(4, 2), (1, 0)])
+async def test_interactive_requests_use_reserved_slots_within_the_limit(limit, interactive_admitted):
+    scheduler = PriorityScheduler(capacity=20, reserved={"interactive": 2})
+    scheduler.limiter = ConcurrencyLimiter(initial_limit=limit, min_limit=1)
+
+    batch, release_batch, _ = await occupy(scheduler, "batch", 10)
+    interactive, release_interactive, admitted = await occupy(scheduler, "interactive", 5)
+
+    assert len(admitted) == interactive_admitted
+    assert scheduler.in_flight == limit
+    release_batch.set()
+    release_interactive.set()
+    await asyncio.gather(*batch, *interactive)
+
+
+@pytest.mark.asyncio
+async def test_invoke_polls_with_polling_priority():
+    # Without long polls, only request latency moves the fake's clock on
+    server = FakeLumnisServer(seed=1, clock=FakeClock(), latency=1.0)
+    scheduler = PriorityScheduler()
+    async with AsyncClient(api_key="test", http_transport=server.transport(), scheduler=scheduler) as client:
+        with request_priority("batch"):
+            await client.invoke("Hi", user_id="user@example.com", poll_interval=0, wait_timeout=None)
+
+    admitted = {stats.priority: stats.admitted for stats in scheduler.stats()}
+    assert admitted[Priority.POLLING] == server.calls["GET /v1/responses/{id}"] > 0
+    assert admitted[Priority.BATCH] == server.calls["POST /v1/responses"] == 1
@@ -0,0 +1,77 @@
+"""Tests for the skills resource."""
+
+import httpx
+import pytest
+
+from lumnisai import AsyncClient, SkillGuidelineCreate, SkillGuidelineUpdate
+from lumnisai.exceptions import AuthenticationError, NotFoundError, TransportError
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+SKILL = SkillGuidelineCreate(name="Search", description="Find people", content="Use filters", category="search")
+MISSING = "00000000-0000-4000-8000-000000000000"
+
+
+def make_client(server, **kwargs):
+    return AsyncClient(api_key="test", http_transport=server.transport(), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_skill_lifecycle():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    sent = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return await server.handle(request)
+
+    async with AsyncClient(api_key="test", http_transport=httpx.MockTransport(handler)) as client:
+        created = await client.skills.create(skill_data=SKILL)
+        fetched = await client.skills.get(created.id)
+        updated = await client.skills.update(created.id, updates=SkillGuidelineUpdate(name="People search"))
+        listed = await client.skills.list(category="search")
+        await client.skills.delete(created.id)
+        remaining = await client.skills.list()
+
+    assert fetched == created
+    assert updated.name == "People search"
+    assert [skill.id for skill in listed.skills] == [created.id]
+    assert remaining.skills == []
+    assert all(request.headers["Authorization"] == "Bearer test" for request in sent)
+
+
+@pytest.mark.asyncio
+async def test_missing_skill_raises_not_found():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    async with make_client(server) as client:
+        with pytest.raises(NotFoundError):
+            await client.skills.get(MISSING)
+        with pytest.raises(NotFoundError):
+            await client.skills.update(MISSING, updates=SkillGuidelineUpdate(name="x"))
+        with pytest.raises(NotFoundError):
+            await client.skills.delete(MISSING)
+
+
+@pytest.mark.asyncio
+async def test_rejected_credentials_raise_authentication_error():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.inject(status=401, path=r"^/v1/skills")
+    async with make_client(server) as client:
+        with pytest.raises(AuthenticationError):
+            await client.skills.list()
+
+
+@pytest.mark.asyncio
+async def test_reads_are_retried_and_writes_are_not():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    async with make_client(server, max_retries=1) as client:
+        client._transport.backoff_factor = 0
+        server.inject(status=503, path=r"^/v1/skills", count=1)
+        listed = await client.skills.list()
+
+        server.inject(status=503, path=r"^/v1/skills", count=1)
+        with pytest.raises(TransportError):
+            await client.skills.create(skill_data=SKILL)
+
+    assert listed.skills == []
+    assert server.calls["GET /v1/skills"] == 2
+    assert server.calls["POST /v1/skills"] == 1
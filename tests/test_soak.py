@@ -0,0 +1,49 @@
+"""Tests for the memory soak test."""
+
+import argparse
+
+import pytest
+
+from benchmarks import soak as soak_module
+
+
+@pytest.fixture
+def args():
+    return argparse.Namespace(
+        iterations=400,
+        warmup=1000,
+        sample_every=100,
+        concurrency=4,
+        progress_entries=1,
+        threshold=0.5,
+        top=5,
+    )
+
+
+def test_slope_fits_growth_per_operation():
+    assert soak_module._slope([(0, 10), (100, 60), (200, 110)]) == pytest.approx(0.5)
+    assert soak_module._slope([(0, 10), (0, 20)]) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_soak_reports_a_leaking_operation(args, monkeypatch):
+    leaked = []
+
+    async def leaky(client):
+        leaked.append([object() for _ in range(10)])
+
+    monkeypatch.setitem(soak_module.OPERATIONS, "leaky", leaky)
+    result = await soak_module.soak("leaky", args)
+
+    assert result.leak
+    assert result.blocks_per_operation > args.threshold
+    assert result.top_growth
+
+
+@pytest.mark.asyncio
+async def test_soak_accepts_bounded_memory(args):
+    result = await soak_module.soak("invoke", args)
+
+    assert result.iterations == 400
+    assert len(result.samples) == 5
+    assert not result.leak
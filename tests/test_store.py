@@ -0,0 +1,45 @@
+"""Tests for the local response store."""
+
+import pytest
+
+from lumnisai import AsyncClient, ResponseStore
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+def make_client(server, store, *, api_key="test"):
+    return AsyncClient(api_key=api_key, http_transport=server.transport(), response_store=store)
+
+
+@pytest.mark.asyncio
+async def test_terminal_response_is_served_from_store():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    store = ResponseStore()
+    async with make_client(server, store) as client:
+        response = await client.invoke("Hi", user_id="user@example.com", poll_interval=0)
+        fetches = server.calls["GET /v1/responses/{id}"]
+        again = await client.get_response(response.response_id)
+
+    assert again.output_text == response.output_text
+    assert server.calls["GET /v1/responses/{id}"] == fetches
+
+
+@pytest.mark.asyncio
+async def test_store_is_not_shared_across_scopes():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    store = ResponseStore()
+    async with make_client(server, store) as client:
+        response = await client.invoke("Hi", user_id="user@example.com", poll_interval=0)
+        fetches = server.calls["GET /v1/responses/{id}"]
+
+        # A for_user client and a client of another tenant ask the server
+        async with client.for_user("other@example.com") as scoped:
+            await scoped.get_response(response.response_id)
+        assert server.calls["GET /v1/responses/{id}"] == fetches + 1
+
+        async with make_client(server, store, api_key="other-tenant") as other:
+            await other.get_response(response.response_id)
+        assert server.calls["GET /v1/responses/{id}"] == fetches + 2
+
+    assert len(store) == 1
+    assert store.get(response.response_id) is not None
+    assert len(store.thread_responses(response.thread_id)) == 1
@@ -0,0 +1,77 @@
+"""Tests for the in-memory fake server shipped in lumnisai.testing."""
+
+import httpx
+import pytest
+
+from lumnisai import AsyncClient
+from lumnisai.exceptions import TransportError
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+def make_client(server, **kwargs):
+    return AsyncClient(api_key="test", http_transport=server.transport(), **kwargs)
+
+
+async def run_once(seed):
+    server = FakeLumnisServer(seed=seed, clock=FakeClock())
+    server.inject(status=503, rate=0.5, path="/v1/threads")
+    async with make_client(server, max_retries=0) as client:
+        response = await client.invoke("Hi", user_id="user@example.com", poll_interval=0)
+        outcomes = []
+        for _ in range(10):
+            try:
+                await client.threads.list()
+                outcomes.append("ok")
+            except TransportError:
+                outcomes.append("503")
+    return response.response_id, outcomes
+
+
+@pytest.mark.asyncio
+async def test_seed_makes_ids_and_faults_reproducible():
+    first = await run_once(seed=7)
+    assert await run_once(seed=7) == first
+    assert "503" in first[1] and "ok" in first[1]
+
+
+@pytest.mark.asyncio
+async def test_injected_faults_expire_after_count():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    fault = server.inject(status=503, count=2, path="/v1/threads")
+    async with make_client(server, max_retries=3) as client:
+        await client.threads.list()
+
+    assert fault.hits == 2
+    assert server.calls["GET /v1/threads"] == 3
+
+
+@pytest.mark.asyncio
+async def test_injected_network_errors_are_retried():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.inject(error=httpx.ConnectError, count=1)
+    async with make_client(server, max_retries=2) as client:
+        await client.threads.list()
+
+    assert server.calls["GET /v1/threads"] == 2
+
+
+@pytest.mark.asyncio
+async def test_long_runs_finish_in_virtual_time():
+    clock = FakeClock()
+    server = FakeLumnisServer(seed=1, clock=clock)
+    server.script(queue_delay=60.0, progress=["a", "b"], progress_interval=300.0, output_text="42")
+    async with make_client(server) as client:
+        response = await client.invoke("Hi", user_id="user@example.com", poll_interval=0)
+
+    assert response.output_text == "42"
+    assert clock.now() >= 660.0
+
+
+@pytest.mark.asyncio
+async def test_uploaded_files_are_searchable():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.seed_files({"notes.txt": "the quarterly revenue grew\nunrelated line"})
+    async with make_client(server) as client:
+        results = await client.files.search("quarterly revenue")
+
+    assert [result.file.file_name for result in results.results] == ["notes.txt"]
@@ -0,0 +1,81 @@
+"""Tests for thread synchronization."""
+
+import httpx
+import pytest
+
+from lumnisai import AsyncClient, ResponseStore
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+@pytest.mark.asyncio
+async def test_sync_fetches_only_changes():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.seed_responses(30, thread_size=3)
+    async with AsyncClient(
+        api_key="test", http_transport=server.transport(), response_store=ResponseStore()
+    ) as client:
+        first = await client.threads.sync()
+        second = await client.threads.sync()
+
+    assert first.threads_checked == 10
+    assert len(first.new_responses) == 30
+    assert second.changed_threads == []
+    assert second.new_responses == []
+
+
+@pytest.mark.asyncio
+async def test_sync_keeps_threads_shifted_between_pages():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.seed_responses(250, thread_size=1)
+    deleted = next(iter(server._threads))
+    syncs = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        # During the second sync, deleting a thread from the first page while
+        # the later pages are fetched moves one thread from the second page
+        # onto the first
+        if request.url.path == "/v1/threads" and request.url.params.get("offset") == "100":
+            if syncs == 1:
+                server._threads.pop(deleted)
+        return await server.handle(request)
+
+    async with AsyncClient(
+        api_key="test",
+        http_transport=httpx.MockTransport(handler),
+        response_store=ResponseStore(),
+    ) as client:
+        await client.threads.sync()
+        syncs += 1
+        shifted = await client.threads.sync()
+        syncs += 1
+        after = await client.threads.sync()
+
+    # The deleted thread was listed on the first page before it went; the
+    # thread shifted past the second page is looked up rather than removed
+    assert shifted.threads_checked == 250
+    assert shifted.changed_threads == []
+    assert shifted.removed_thread_ids == []
+    assert after.changed_threads == []
+    assert [str(thread_id) for thread_id in after.removed_thread_ids] == [deleted]
+
+
+@pytest.mark.asyncio
+async def test_sync_skips_thread_deleted_after_listing():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.seed_responses(150, thread_size=1)
+    deleted = next(iter(server._threads))
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1/threads" and request.url.params.get("offset") == "100":
+            server._threads.pop(deleted, None)
+        return await server.handle(request)
+
+    async with AsyncClient(
+        api_key="test",
+        http_transport=httpx.MockTransport(handler),
+        response_store=ResponseStore(),
+    ) as client:
+        result = await client.threads.sync()
+
+    assert deleted not in {str(thread.thread_id) for thread in result.changed_threads}
+    assert len(result.changed_threads) == 148
@@ -0,0 +1,46 @@
+"""Tests for invoke() lifecycle timelines."""
+
+import types
+
+import pytest
+
+from lumnisai import AsyncClient
+from lumnisai import timeline as timeline_module
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+@pytest.mark.asyncio
+async def test_timeline_splits_queue_and_run_time(monkeypatch):
+    clock = FakeClock()
+    # Time the client side on the server's clock too, so overhead is exact
+    monkeypatch.setattr(timeline_module, "time", types.SimpleNamespace(monotonic=clock.now))
+    server = FakeLumnisServer(seed=1, clock=clock, latency=0.5)
+    server.script(queue_delay=5.0, progress=["a", "b", "c"], progress_interval=2.0)
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        response = await client.invoke("Hi", user_id="user@example.com", poll_interval=0)
+
+    timeline = response.timeline
+    first_progress = response.progress[0].ts
+    assert timeline.status == "succeeded"
+    assert timeline.queued_seconds == pytest.approx((first_progress - response.created_at).total_seconds())
+    assert timeline.queued_seconds == pytest.approx(5.0)
+    assert timeline.run_seconds == pytest.approx((response.completed_at - first_progress).total_seconds())
+    assert timeline.run_seconds == pytest.approx(6.0)
+    assert timeline.progress_gaps == pytest.approx([2.0, 2.0])
+    # Everything outside the server's queue and run is the create round trip
+    assert timeline.create_seconds == pytest.approx(0.5)
+    assert timeline.total_seconds == pytest.approx(11.5)
+    assert timeline.client_overhead_seconds == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_timeline_callback_receives_streamed_invocations():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    timelines = []
+    async with AsyncClient(api_key="test", http_transport=server.transport()) as client:
+        client.on_timeline(timelines.append)
+        async for _ in await client.invoke("Hi", user_id="user@example.com", stream=True, poll_interval=0):
+            pass
+
+    assert len(timelines) == 1
+    assert timelines[0].run_seconds is not None
@@ -0,0 +1,123 @@
+"""Tests for OpenTelemetry tracing."""
+
+import asyncio
+import gc
+import logging
+
+import httpx
+import pytest
+
+from lumnisai import AsyncClient, HedgePolicy
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+trace = pytest.importorskip("opentelemetry.trace")
+sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+export = pytest.importorskip("opentelemetry.sdk.trace.export")
+in_memory = pytest.importorskip("opentelemetry.sdk.trace.export.in_memory_span_exporter")
+
+
+@pytest.fixture(scope="module")
+def provider():
+    provider = sdk_trace.TracerProvider()
+    trace.set_tracer_provider(provider)
+    return trace.get_tracer_provider()
+
+
+@pytest.fixture
+def spans(provider):
+    exporter = in_memory.InMemorySpanExporter()
+    processor = export.SimpleSpanProcessor(exporter)
+    provider.add_span_processor(processor)
+    yield exporter
+    processor.shutdown()
+
+
+def make_client(server):
+    return AsyncClient(api_key="test", http_transport=server.transport(), tracing=True)
+
+
+@pytest.mark.asyncio
+async def test_invoke_span_parents_http_spans(spans):
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    async with make_client(server) as client:
+        response = await client.invoke("Hi", user_id="user@example.com", poll_interval=0)
+
+    finished = spans.get_finished_spans()
+    invoke = next(span for span in finished if span.name == "lumnisai.invoke")
+    children = [span for span in finished if span.parent and span.parent.span_id == invoke.context.span_id]
+    assert invoke.attributes["lumnisai.response_id"] == str(response.response_id)
+    assert {span.name for span in children} >= {"POST /v1/responses", "GET /v1/responses/{id}"}
+
+
+@pytest.mark.asyncio
+async def test_stream_span_parents_poll_spans(spans):
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    async with make_client(server) as client:
+        updates = [update async for update in await client.invoke("Hi", user_id="user@example.com", stream=True, poll_interval=0)]
+
+    finished = spans.get_finished_spans()
+    invoke = next(span for span in finished if span.name == "lumnisai.invoke")
+    polls = [span for span in finished if span.name == "GET /v1/responses/{id}"]
+    assert updates
+    assert invoke.attributes["lumnisai.stream"] is True
+    assert polls and all(span.parent.span_id == invoke.context.span_id for span in polls)
+
+
+@pytest.mark.asyncio
+async def test_stream_abandoned_early_does_not_leak_context(spans, caplog):
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.script(progress=["a", "b", "c", "d"])
+    async with make_client(server) as client:
+        stream = await client.invoke("Hi", user_id="user@example.com", stream=True, poll_interval=0)
+        with caplog.at_level(logging.ERROR):
+            async for _ in stream:
+                break
+            # The caller's context is untouched while the stream is suspended
+            assert not trace.get_current_span().get_span_context().is_valid
+
+            # Leave the stream to the event loop's async generator finalizer,
+            # which closes it from another context
+            del stream
+            gc.collect()
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+    assert "Failed to detach context" not in caplog.text
+    assert "different Context" not in caplog.text
+    assert any(span.name == "lumnisai.invoke" for span in spans.get_finished_spans())
+
+
+@pytest.mark.asyncio
+async def test_hedged_read_ends_both_attempt_spans(spans):
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    stuck = False
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal stuck
+        if stuck:
+            stuck = False
+            await asyncio.sleep(1.0)
+        return await server.handle(request)
+
+    policy = HedgePolicy(min_samples=3, min_delay=0.02, max_delay=0.05, burst=1.0)
+    async with AsyncClient(
+        api_key="test", http_transport=httpx.MockTransport(handler), hedging=policy, tracing=True
+    ) as client:
+        response = await client.invoke("Hi", user_id="user@example.com", poll_interval=0)
+        for _ in range(5):
+            await client.get_response(response.response_id)
+        spans.clear()
+
+        stuck = True
+        await client.get_response(response.response_id)
+        # Let the cancelled primary unwind
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    assert (policy.hedged, policy.won) == (1, 1)
+    reads = [span for span in spans.get_finished_spans() if span.name == "GET /v1/responses/{id}"]
+    assert len(reads) == 2
+    primary = next(span for span in reads if span.attributes.get("lumnisai.cancelled"))
+    hedge = next(span for span in reads if span is not primary)
+    assert "http.response.status_code" not in primary.attributes
+    assert hedge.attributes["http.response.status_code"] == 200
@@ -0,0 +1,80 @@
+"""Tests for connection prewarming."""
+
+import gc
+import warnings
+
+import pytest
+
+from lumnisai import AsyncClient, BulkLane
+from lumnisai.testing import FakeClock, FakeLumnisServer
+
+
+def make_client(server, **kwargs):
+    return AsyncClient(api_key="test", http_transport=server.transport(), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_prewarm_on_enter():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    async with make_client(server, prewarm=5, transport_profile="serverless") as client:
+        report = client.warmup_report
+
+    (lane,) = report.lanes
+    assert (lane.lane, lane.requested, lane.succeeded) == ("api", 5, 5)
+    assert lane.http_version == "HTTP/1.1"
+    assert lane.http2 is None
+    assert report.ready
+    assert server.calls["GET /v1/health"] == 5
+
+
+@pytest.mark.asyncio
+async def test_requests_are_capped_at_the_keepalive_connections():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    async with make_client(server, transport_profile="serverless") as client:
+        report = await client.prewarm(50)
+
+    assert report.lanes[0].requested == 5
+    assert server.calls["GET /v1/health"] == 5
+
+
+@pytest.mark.asyncio
+async def test_http2_lane_that_negotiates_http1_is_not_ready():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    async with make_client(server) as client:
+        report = await client.prewarm(3)
+
+    assert report.lanes[0].http2 is False
+    assert not report.ready
+    assert "HTTP/2 not negotiated" in str(report)
+
+
+@pytest.mark.asyncio
+async def test_failed_health_checks_are_reported():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    server.inject(status=503, path=r"^/v1/health$", count=2)
+    async with make_client(server, transport_profile="serverless", max_retries=0) as client:
+        report = await client.prewarm(4)
+
+    (lane,) = report.lanes
+    assert lane.succeeded == 2
+    assert lane.errors == ["HTTP 503 (x2)"]
+    assert report.ready
+
+
+@pytest.mark.asyncio
+async def test_bulk_lane_is_warmed_only_when_enabled():
+    server = FakeLumnisServer(seed=1, clock=FakeClock())
+    async with make_client(server, transport_profile="serverless") as client:
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with pytest.raises(ValueError, match="'bulk'"):
+                await client.prewarm({"api": 1, "bulk": 2})
+            gc.collect()
+        # The api lane must not have been started and left unawaited
+        assert not [w for w in caught if issubclass(w.category, RuntimeWarning)]
+
+    async with make_client(server, transport_profile="serverless", bulk_lane=BulkLane()) as client:
+        report = await client.prewarm({"api": 1, "bulk": 2})
+
+    assert [(lane.lane, lane.succeeded) for lane in report.lanes] == [("api", 1), ("bulk", 2)]
+    assert report.ready